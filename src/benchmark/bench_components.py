@@ -0,0 +1,113 @@
+"""Micro-benchmarks for the referentials, the cleaner and every sinker.
+
+Run from ``src``::
+
+    PYTHONPATH=organization_information_fetcher_app:. python -m benchmark.bench_components
+
+Pass ``--model all-MiniLM-L6-v2`` to embed with a real SentenceTransformer
+instead of the offline hashing stand-in.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import Any, Callable, List, Optional, Sequence
+
+from core.domains.cleaner import Cleaner
+
+from benchmark.sinkers import SINKERS
+from benchmark.stand_ins import (
+    HashingEmbeddingModel,
+    build_referential,
+    raw_organizations,
+    read_company_names,
+)
+
+
+def measure(fn: Callable[[], Any], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds
+
+
+def report(name: str, seconds: float, items: int) -> None:
+    print(f"{name:<40}{seconds * 1e3:>10.2f} ms{items / seconds:>14.0f} items/s")
+
+
+def embedding_model(model_name: Optional[str]) -> Any:
+    if model_name is None:
+        return HashingEmbeddingModel()
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(model_name)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--companies", default="../resources/company_names.csv")
+    parser.add_argument("--resources", default="../resources")
+    parser.add_argument("--model", default=None)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    model = embedding_model(args.model)
+    start = time.perf_counter()
+    cpc = build_referential(os.path.join(args.resources, "cpc_ver3.csv"), model)
+    isic = build_referential(os.path.join(args.resources, "isic_rev5.csv"), model)
+    report("build referentials", time.perf_counter() - start, len(cpc) + len(isic))
+
+    organizations = raw_organizations(read_company_names(args.companies))
+    products: List[str] = [p for org in organizations for p in org.products]
+
+    for name, referential in [("cpc", cpc), ("isic", isic)]:
+        report(
+            f"{name} get_closest_match x{len(products)}",
+            measure(
+                lambda: [referential.get_closest_match(p) for p in products],
+                args.rounds,
+            ),
+            len(products),
+        )
+        report(
+            f"{name} get_closest_matches x{len(products)}",
+            measure(lambda: referential.get_closest_matches(products), args.rounds),
+            len(products),
+        )
+
+    cleaner = Cleaner(cpc, isic)
+    report(
+        f"cleaner one by one x{len(organizations)}",
+        measure(
+            lambda: [cleaner.serialize_to_organization(o) for o in organizations],
+            args.rounds,
+        ),
+        len(organizations),
+    )
+    report(
+        f"cleaner batch x{len(organizations)}",
+        measure(lambda: cleaner.serialize_to_organizations(organizations), args.rounds),
+        len(organizations),
+    )
+
+    cleaned = cleaner.serialize_to_organizations(organizations) * 10
+    for name, factory in sorted(SINKERS.items()):
+        with tempfile.TemporaryDirectory() as output_dir:
+
+            def sink() -> None:
+                with factory(
+                    os.path.join(output_dir, f"run{time.monotonic_ns()}")
+                ) as sinker:
+                    for organization in cleaned:
+                        sinker.sink_organization(organization)
+
+            report(
+                f"{name} sinker x{len(cleaned)}",
+                measure(sink, args.rounds),
+                len(cleaned),
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""End-to-end benchmark of FetchOrganizationInformation against local stand-ins.
+
+Run from ``src``::
+
+    PYTHONPATH=organization_information_fetcher_app:. python -m benchmark.bench_pipeline
+"""
+
+import argparse
+import logging
+import os
+import resource
+import tempfile
+import time
+import tracemalloc
+import warnings
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+from core.domains.cleaner import Cleaner
+from core.entities.organizations import RawOrganization
+from core.ports.fetching import RawOrganizationFetcher
+from core.ports.referential import Referential
+from core.ports.sinker import Sinker
+from core.usecases.fetch_organization_information import FetchOrganizationInformation
+from infrastructure.adapters.fetching_agent import (
+    RawOrganizationFetcherFromCompanyNameBuilder,
+)
+from infrastructure.adapters.metrics_registry import InMemoryMetrics
+from pydantic import BaseModel
+
+from benchmark.sinkers import SINKERS
+from benchmark.stand_ins import (
+    FakeSearch,
+    HashingEmbeddingModel,
+    RecordedPagesServer,
+    ScriptedReActChatModel,
+    build_referential,
+    read_company_names,
+)
+
+
+class _TimedFetcher(RawOrganizationFetcher):
+    def __init__(self, fetcher: RawOrganizationFetcher, started: Dict[str, float]):
+        self._fetcher = fetcher
+        self._started = started
+
+    def get_raw_organization_information(
+        self, value: str, domain: Optional[str] = None
+    ) -> RawOrganization:
+        self._started[value] = time.perf_counter()
+        return self._fetcher.get_raw_organization_information(value, domain)
+
+
+class _TimedSinker(Sinker):
+    def __init__(
+        self, sinker: Sinker, started: Dict[str, float], latencies: List[float]
+    ):
+        self._sinker = sinker
+        self._started = started
+        self._latencies = latencies
+
+    def sink_organization(self, data: BaseModel) -> None:
+        self._sinker.sink_organization(data)
+        company_name = data.company_name  # type: ignore[attr-defined]
+        self._latencies.append(time.perf_counter() - self._started[company_name])
+
+    def flush(self, fsync: bool = False) -> None:
+        self._sinker.flush(fsync)
+
+    def close(self) -> None:
+        self._sinker.close()
+
+
+class _PipelineRun(NamedTuple):
+    elapsed: float
+    latencies: List[float]
+    llm_calls: int
+
+
+def _run_pipeline(
+    args: argparse.Namespace,
+    company_names: List[str],
+    referentials: Tuple[Referential, Referential],
+) -> _PipelineRun:
+    metrics = InMemoryMetrics()
+    cleaner = Cleaner(*referentials, metrics=metrics)
+    started: Dict[str, float] = {}
+    latencies: List[float] = []
+
+    with (
+        RecordedPagesServer(company_names, latency=args.page_latency) as server,
+        tempfile.TemporaryDirectory() as output_dir,
+    ):
+        fetcher = (
+            RawOrganizationFetcherFromCompanyNameBuilder()
+            .with_llm(ScriptedReActChatModel(latency=args.llm_latency))
+            .with_search_backend(FakeSearch(server.base_url, args.search_latency))
+            .with_metrics(metrics)
+            .build()
+        )
+        sinker = SINKERS[args.sinker](os.path.join(output_dir, "organizations"))
+
+        start = time.perf_counter()
+        with _TimedSinker(sinker, started, latencies) as timed_sinker:
+            FetchOrganizationInformation(
+                _TimedFetcher(fetcher, started),
+                cleaner,
+                timed_sinker,
+                batch_size=args.batch_size,
+                metrics=metrics,
+                fetch_concurrency=args.fetch_concurrency,
+                clean_concurrency=args.clean_concurrency,
+            )(company_names)
+        elapsed = time.perf_counter() - start
+
+    return _PipelineRun(elapsed, latencies, metrics.counter("llm.calls"))
+
+
+def _percentile_ms(latencies: List[float], q: float) -> float:
+    return float(np.percentile(latencies, q)) * 1e3 if latencies else float("nan")
+
+
+def run(args: argparse.Namespace) -> Dict[str, float]:
+    company_names = read_company_names(args.companies, args.limit)
+    embedding_model = HashingEmbeddingModel()
+    referentials = (
+        build_referential(
+            os.path.join(args.resources, "cpc_ver3.csv"), embedding_model
+        ),
+        build_referential(
+            os.path.join(args.resources, "isic_rev5.csv"), embedding_model
+        ),
+    )
+
+    # Throughput and latencies come from a run without allocation tracing,
+    # whose overhead would swamp them
+    timed = _run_pipeline(args, company_names, referentials)
+    result = {
+        "companies": len(company_names),
+        "companies_per_second": len(company_names) / timed.elapsed,
+        "p50_latency_ms": _percentile_ms(timed.latencies, 50),
+        "p99_latency_ms": _percentile_ms(timed.latencies, 99),
+        "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10,
+        "llm_calls": timed.llm_calls,
+    }
+
+    if args.memory_run:
+        tracemalloc.start()
+        try:
+            _run_pipeline(args, company_names, referentials)
+            _, peak_traced = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        result["peak_traced_memory_mb"] = peak_traced / 2**20
+    return result
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--companies", default="../resources/company_names.csv")
+    parser.add_argument("--resources", default="../resources")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--llm-latency", type=float, default=0.0)
+    parser.add_argument("--search-latency", type=float, default=0.0)
+    parser.add_argument("--page-latency", type=float, default=0.0)
+    parser.add_argument("--batch-size", type=int, default=1)
+    parser.add_argument("--fetch-concurrency", type=int, default=1)
+    parser.add_argument("--clean-concurrency", type=int, default=1)
+    parser.add_argument("--sinker", choices=sorted(SINKERS), default="jsonl")
+    parser.add_argument(
+        "--no-memory-run",
+        dest="memory_run",
+        action="store_false",
+        help="Skip the second run measuring peak memory under tracemalloc.",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    warnings.filterwarnings("ignore", category=DeprecationWarning)
+
+    for name, value in run(args).items():
+        print(f"{name + ':':<24}{value:.2f}")
+
+
+if __name__ == "__main__":
+    main()
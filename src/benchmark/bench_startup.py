@@ -0,0 +1,113 @@
+"""Import-time profile of the CLI against the heavy adapters it defers.
+
+Each scenario runs in a fresh interpreter under ``python -X importtime``, so
+nothing is shared through ``sys.modules``. Run from ``src``::
+
+    PYTHONPATH=organization_information_fetcher_app:. python -m benchmark.bench_startup
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+APP_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "organization_information_fetcher_app",
+)
+
+RUN_IMPORTS = (
+    "import cli, core.usecases.fetch_organization_information, "
+    "infrastructure.adapters.fetching_agent, "
+    "infrastructure.repositories.referential_csv"
+)
+
+SCENARIOS: Dict[str, str] = {
+    "cli --help": "import cli; cli.build_parser().format_help()",
+    "cli run --dry-run imports": (
+        "import cli, core.domains.deduplication, "
+        "infrastructure.repositories.company_sources"
+    ),
+    "cli run imports": RUN_IMPORTS,
+    # What the run used to load before handling its arguments
+    "eager adapters": RUN_IMPORTS
+    + ", langchain.agents, langchain_core.prompts, langchain_mistralai, "
+    "sentence_transformers",
+}
+
+
+class ImportProfile(NamedTuple):
+    wall_seconds: float
+    import_seconds: float
+    by_package: Dict[str, float]
+
+
+def parse_importtime(stderr: str) -> Tuple[float, Dict[str, float]]:
+    """Sum the self time of every import, overall and per top-level package."""
+    total = 0.0
+    by_package: Dict[str, float] = defaultdict(float)
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:") :].split("|")
+        seconds = int(self_us) / 1e6
+        total += seconds
+        by_package[name.strip().split(".")[0]] += seconds
+    return total, dict(by_package)
+
+
+def profile(code: str, python: str = sys.executable) -> ImportProfile:
+    environment = dict(os.environ, PYTHONPATH=APP_DIR)
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [python, "-X", "importtime", "-c", code],
+        cwd=APP_DIR,
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall_seconds = time.perf_counter() - start
+    import_seconds, by_package = parse_importtime(completed.stderr)
+    return ImportProfile(wall_seconds, import_seconds, by_package)
+
+
+def best_of(code: str, rounds: int) -> ImportProfile:
+    return min((profile(code) for _ in range(rounds)), key=lambda p: p.wall_seconds)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args(argv)
+
+    profiles = {name: best_of(code, args.rounds) for name, code in SCENARIOS.items()}
+
+    print(f"{'scenario':<28}{'wall':>10}{'imports':>10}")
+    for name, result in profiles.items():
+        print(
+            f"{name:<28}{result.wall_seconds * 1e3:>8.0f}ms"
+            f"{result.import_seconds * 1e3:>8.0f}ms"
+        )
+
+    for name in ("cli --help", "eager adapters"):
+        top: List[Tuple[str, float]] = sorted(
+            profiles[name].by_package.items(), key=lambda item: -item[1]
+        )[: args.top]
+        print(f"\nslowest packages, {name}:")
+        for package, seconds in top:
+            print(f"  {package:<26}{seconds * 1e3:>8.0f}ms")
+
+    eager = profiles["eager adapters"].wall_seconds
+    print(
+        f"\ncli startup speedup:        "
+        f"{eager / profiles['cli --help'].wall_seconds:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+from typing import Callable, Dict
+
+from core.ports.sinker import Sinker
+from infrastructure.repositories.sinker_csv import SinkerCsv
+from infrastructure.repositories.sinker_jsonl import SinkerJsonl
+from infrastructure.repositories.sinker_parquet import SinkerParquet
+from infrastructure.repositories.sinker_sqlite import SinkerSqlite
+
+SINKERS: Dict[str, Callable[[str], Sinker]] = {
+    "csv": lambda path: SinkerCsv(f"{path}.csv"),
+    "jsonl": lambda path: SinkerJsonl(f"{path}.jsonl"),
+    "parquet": lambda path: SinkerParquet(f"{path}.parquet"),
+    "sqlite": lambda path: SinkerSqlite(f"{path}.db"),
+}
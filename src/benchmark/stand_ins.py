@@ -0,0 +1,255 @@
+"""Local stand-ins for the LLM, the web search and the company websites.
+
+They let the whole pipeline run offline with controlled latencies. Company
+pages are synthesized deterministically from the company name and embed the
+profile the scripted model "reads" back, so data still flows from the web
+server through the agent, the cleaner and the sinker.
+"""
+
+import json
+import re
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Type
+
+import numpy as np
+from core.entities.organizations import RawOrganization
+from infrastructure.repositories.referential_csv import (
+    CsvReferential,
+    CsvReferentialBuilder,
+    ReferentialData,
+)
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import Runnable, RunnableLambda
+from pydantic import BaseModel
+
+_ACTIVITIES = [
+    "Computer programming activities",
+    "Manufacture of motor vehicles",
+    "Retail sale of food in specialised stores",
+    "Hotels and similar accommodation",
+    "Wholesale of pharmaceutical goods",
+    "Electric power generation",
+]
+_PRODUCTS = [
+    "Software publishing services",
+    "Passenger cars",
+    "Bakery products",
+    "Accommodation services for visitors",
+    "Medicaments",
+    "Electrical energy",
+    "Consulting services",
+    "Cloud hosting services",
+]
+_COUNTRIES = ["USA", "France", "Germany", "Japan", "United Kingdom", "Canada"]
+_DATE_FORMATS = ["{year}", "{year}-04-01", "April 1, {year}", "Founded in {year}"]
+
+_PROFILE = re.compile(
+    r'<script type="application/json" id="profile">(.*?)</script>', re.DOTALL
+)
+_COMPANY = re.compile(
+    r"(?:Compile company information for|information for) (.+?)(?: by crawling|\.)"
+)
+_URL = re.compile(r"https?://[^\s'\"\]]+")
+
+
+def slugify(company_name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", company_name.lower()).strip("-")
+
+
+def company_profile(company_name: str) -> Dict[str, Any]:
+    rng = np.random.default_rng(zlib.crc32(company_name.encode()))
+    year = int(rng.integers(1850, 2020))
+    products = list(rng.choice(_PRODUCTS, size=int(rng.integers(1, 4)), replace=False))
+    return {
+        "company_name": company_name,
+        "creation_date": str(rng.choice(_DATE_FORMATS)).format(year=year),
+        "employees": int(rng.lognormal(5, 2)) + 1,
+        "economic_activity": str(rng.choice(_ACTIVITIES)),
+        "products": products,
+        "product_names": [f"{company_name} {product}" for product in products],
+        "country_origin": str(rng.choice(_COUNTRIES)),
+        "countries_activity": list(rng.choice(_COUNTRIES, size=2, replace=False)),
+        "main_company_domains": [f"{slugify(company_name)}.example"],
+    }
+
+
+def company_page(company_name: str) -> str:
+    profile = company_profile(company_name)
+    filler = " ".join(
+        f"<p>{company_name} delivers {product} to customers worldwide.</p>"
+        for product in profile["products"] * 20
+    )
+    return (
+        f"<html><head><title>About {company_name}</title>"
+        f'<script type="application/json" id="profile">{json.dumps(profile)}</script>'
+        f"</head><body><h1>{company_name}</h1>{filler}</body></html>"
+    )
+
+
+class RecordedPagesServer:
+    """Serve company pages from a local HTTP server, with an optional delay."""
+
+    def __init__(self, company_names: Iterable[str], latency: float = 0.0) -> None:
+        pages = {
+            f"/{slugify(name)}/about": company_page(name).encode()
+            for name in company_names
+        }
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                time.sleep(latency)
+                body = pages.get(self.path)
+                self.send_response(200 if body else 404)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.end_headers()
+                self.wfile.write(body or b"")
+
+            def log_message(self, *_: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "RecordedPagesServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class FakeSearch:
+    def __init__(self, base_url: str, latency: float = 0.0) -> None:
+        self._base_url = base_url
+        self._latency = latency
+
+    def __call__(self, query: str) -> List[str]:
+        time.sleep(self._latency)
+        slug = slugify(query.removesuffix(" company information"))
+        return [
+            f"{self._base_url}/{slug}/about",
+            f"https://www.linkedin.com/company/{slug}",
+        ]
+
+
+class ScriptedReActChatModel(BaseChatModel):
+    """Chat model following a fixed search, retrieve, answer ReAct script."""
+
+    latency: float = 0.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted-react"
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        time.sleep(self.latency)
+        prompt = str(messages[-1].content)
+        content = self._reply(prompt)
+        message = AIMessage(
+            content=content,
+            usage_metadata={
+                "input_tokens": len(prompt) // 4,
+                "output_tokens": len(content) // 4,
+                "total_tokens": (len(prompt) + len(content)) // 4,
+            },
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    @staticmethod
+    def _reply(prompt: str) -> str:
+        if prompt.startswith("Extract and structure the following company data:"):
+            return prompt.split(":", 1)[1].strip()
+
+        scratchpad = prompt.split("Begin!", 1)[-1]
+        observations = scratchpad.split("Observation:")[1:]
+        if not observations:
+            match = _COMPANY.search(scratchpad)
+            company_name = match.group(1) if match else "unknown"
+            return (
+                "Thought: I should search for the company.\n"
+                "Action: search_company\n"
+                f"Action Input: {company_name}"
+            )
+        if len(observations) == 1:
+            urls = _URL.findall(observations[0])
+            return (
+                "Thought: The first result is the company website.\n"
+                "Action: retrieve_page\n"
+                f"Action Input: {urls[0] if urls else ''}"
+            )
+        profile = _PROFILE.search(observations[-1])
+        return (
+            "Thought: I now know the final answer\n"
+            f"Final Answer: {profile.group(1) if profile else '{}'}"
+        )
+
+    def with_structured_output(
+        self, schema: Any, **kwargs: Any
+    ) -> Runnable[Any, BaseModel]:
+        model: Type[BaseModel] = schema
+
+        def _parse(message: AIMessage) -> BaseModel:
+            return model.model_validate_json(str(message.content))
+
+        return self | RunnableLambda(_parse)
+
+
+class HashingEmbeddingModel:
+    """Bag-of-words embeddings hashed into a fixed size, standing in for a
+    SentenceTransformer when the real model cannot be downloaded."""
+
+    def __init__(self, dimensions: int = 384) -> None:
+        self._dimensions = dimensions
+
+    def _encode_one(self, value: str) -> np.ndarray:
+        embedding = np.zeros(self._dimensions, dtype=np.float32)
+        for token in re.findall(r"[a-z0-9]+", value.lower()):
+            embedding[zlib.crc32(token.encode()) % self._dimensions] += 1.0
+        return embedding
+
+    def encode(
+        self, value: str | Sequence[str], convert_to_numpy: bool = True, **_: Any
+    ) -> np.ndarray:
+        if isinstance(value, str):
+            return self._encode_one(value)
+        return np.stack([self._encode_one(item) for item in value])
+
+
+def raw_organizations(company_names: Iterable[str]) -> List[RawOrganization]:
+    return [RawOrganization(**company_profile(name)) for name in company_names]
+
+
+def build_referential(csv_path: str, embedding_model: Any) -> CsvReferential:
+    """Build a referential without touching the on-disk embedding cache."""
+    keys, values = CsvReferentialBuilder._read_csv(csv_path)
+    return CsvReferential(
+        ReferentialData(
+            keys=np.array(keys, dtype=str),
+            values=np.array(values, dtype=str),
+            embeddings=embedding_model.encode(values, convert_to_numpy=True),
+        ),
+        embedding_model,
+    )
+
+
+def read_company_names(path: str, limit: Optional[int] = None) -> List[str]:
+    with open(path, encoding="utf-8") as file:
+        names = [line.strip() for line in file if line.strip()]
+    return names[:limit] if limit else names
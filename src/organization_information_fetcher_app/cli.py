@@ -0,0 +1,361 @@
+"""Command line entry point.
+
+Only the standard library is imported at module load. Each command imports the
+adapters it needs, so ``--help``, a dry run or a cache build never pay for
+langchain, transformers or torch.
+"""
+
+import argparse
+import contextlib
+import importlib
+import logging
+import os
+import sys
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    from core.ports.metrics import Metrics
+
+_LOGGER = logging.getLogger(__name__)
+
+_COMMANDS = ("run", "build-referential-cache", "benchmark", "merge")
+
+_BENCHMARKS = {
+    "components": "benchmark.bench_components",
+    "date-parser": "benchmark.bench_date_parser",
+    "pipeline": "benchmark.bench_pipeline",
+    "startup": "benchmark.bench_startup",
+}
+
+
+def _company_source(args: argparse.Namespace, metrics: "Metrics") -> Any:
+    from core.domains.deduplication import CompanyDeduplicator
+    from core.domains.priority import CompanyPrioritizer
+    from infrastructure.repositories.company_sources import open_company_source
+
+    options: Dict[str, Any] = {}
+    if args.companies.lower().endswith(".csv"):
+        options["has_header"] = args.has_header
+    return CompanyPrioritizer(args.priority_window)(
+        CompanyDeduplicator(metrics=metrics)(
+            open_company_source(args.companies, **options)
+        )
+    )
+
+
+def _run(args: argparse.Namespace) -> int:
+    from infrastructure.adapters.metrics_registry import InMemoryMetrics
+
+    metrics = InMemoryMetrics()
+    output = args.output or (
+        "./organizations.sqlite" if args.refresh else "./organizations.csv"
+    )
+
+    if args.dry_run:
+        count = sum(1 for _ in _company_source(args, metrics))
+        print(f"{count} companies to fetch from {args.companies} into {output}")
+        return 0
+
+    from core.domains.budget import TokenBudget
+    from core.domains.cleaner import Cleaner
+    from core.domains.refresh import RefreshPolicy
+    from core.domains.retry import RetryPolicy
+    from core.usecases.fetch_organization_information import (
+        FetchOrganizationInformation,
+    )
+    from dotenv import load_dotenv
+    from infrastructure.adapters.domain_crawler import (
+        DomainCrawler,
+        PolitenessScheduler,
+    )
+    from infrastructure.adapters.fetching_agent import (
+        RawOrganizationFetcherFromCompanyNameBuilder,
+    )
+    from infrastructure.adapters.metrics_registry import PrometheusFileExporter
+    from infrastructure.adapters.page_retriever import ConcurrentPageRetriever
+    from infrastructure.adapters.page_sources import HttpSourceChangeDetector
+    from infrastructure.adapters.transient_errors import is_transient_error
+    from infrastructure.repositories.fetch_state_sqlite import SqliteFetchStateStore
+    from infrastructure.repositories.organization_files import open_sinker
+    from infrastructure.repositories.referential_csv import CsvReferentialBuilder
+    from infrastructure.repositories.sinker_background import BackgroundSinker
+    from infrastructure.repositories.sinker_jsonl import SinkerJsonl
+    from infrastructure.repositories.sinker_metered import MeteredSinker
+
+    load_dotenv()
+
+    output_sinker = open_sinker(output)
+    if not output_sinker.durable_flush:
+        # Fetch records saved before the output is readable would make a crash
+        # look like a completed fetch to the next refresh
+        if args.refresh:
+            _LOGGER.error("--refresh cannot write to %s, use SQLite output.", output)
+            return 2
+        _LOGGER.info("Not recording fetch state, %s is written on close.", output)
+
+    cleaner = Cleaner(
+        CsvReferentialBuilder.build(args.cpc, args.model, metrics=metrics),
+        CsvReferentialBuilder.build(args.isic, args.model, metrics=metrics),
+        metrics=metrics,
+    )
+    budget = (
+        TokenBudget(args.company_token_budget, args.run_token_budget)
+        if args.company_token_budget or args.run_token_budget
+        else None
+    )
+    crawler = DomainCrawler(
+        scheduler=PolitenessScheduler(min_delay=args.crawl_delay), metrics=metrics
+    )
+    builder = (
+        RawOrganizationFetcherFromCompanyNameBuilder()
+        .with_standard_rate_limiter()
+        .with_mistral_ai()
+        .with_domain_crawler(crawler)
+        .with_page_retriever(
+            ConcurrentPageRetriever(
+                max_workers=args.page_workers, per_host=args.per_host, metrics=metrics
+            )
+        )
+        .with_metrics(metrics)
+    )
+    if budget is not None:
+        builder = builder.with_budget(budget)
+
+    # A refresh only writes the companies that changed, so it defaults to
+    # upserting into SQLite rather than rewriting the CSV export
+    refresh_policy = (
+        RefreshPolicy(
+            HttpSourceChangeDetector(
+                crawler.robots, crawler.scheduler, metrics=metrics
+            ),
+            max_age=timedelta(days=args.max_age_days),
+        )
+        if args.refresh
+        else None
+    )
+
+    with (
+        PrometheusFileExporter(metrics, args.prometheus),
+        BackgroundSinker(MeteredSinker(output_sinker, metrics)) as sinker,
+        SinkerJsonl(args.dead_letter, batch_size=1) as dead_letter,
+        (
+            SqliteFetchStateStore(args.fetch_state)
+            if output_sinker.durable_flush
+            else contextlib.nullcontext()
+        ) as fetch_state,
+    ):
+        FetchOrganizationInformation(
+            builder.build(),
+            cleaner,
+            sinker,
+            batch_size=args.batch_size,
+            metrics=metrics,
+            budget=budget,
+            deferred_company_budget=args.deferred_company_token_budget,
+            retry_policy=RetryPolicy(
+                max_attempts=args.max_attempts, is_transient=is_transient_error
+            ),
+            dead_letter=dead_letter,
+            fetch_state=fetch_state,
+            refresh_policy=refresh_policy,
+            checkpoint_every=args.checkpoint_every,
+            fetch_concurrency=args.fetch_concurrency,
+            clean_concurrency=args.clean_concurrency,
+            batch_interval=(
+                timedelta(seconds=args.batch_interval) if args.batch_interval else None
+            ),
+        )(_company_source(args, metrics))
+
+    metrics.write_json(args.metrics_json)
+    return 0
+
+
+def _build_referential_cache(args: argparse.Namespace) -> int:
+    from infrastructure.repositories.referential_csv import CsvReferentialBuilder
+
+    for file_path in args.referentials:
+        cache_path = CsvReferentialBuilder.cache_path(file_path)
+        if args.force and os.path.exists(cache_path):
+            os.remove(cache_path)
+        referential = CsvReferentialBuilder.build(file_path, args.model)
+        print(f"{cache_path}: {len(referential)} entries")
+    return 0
+
+
+def _benchmark(args: argparse.Namespace) -> int:
+    # The benchmark package sits next to the application directory
+    src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if src_dir not in sys.path:
+        sys.path.append(src_dir)
+    importlib.import_module(_BENCHMARKS[args.name]).main(args.arguments)
+    return 0
+
+
+def _merge(args: argparse.Namespace) -> int:
+    from infrastructure.repositories.organization_files import (
+        merge_organizations,
+        open_sinker,
+    )
+
+    with open_sinker(args.output) as sinker:
+        count = merge_organizations(args.inputs, sinker, key=args.key)
+    print(f"{count} organizations merged into {args.output}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="organization-information-fetcher",
+        description="Fetch information about companies from the web with an LLM "
+        "agent, classify their activity and products, and store the resulting "
+        "organizations. Without a command, options apply to run.",
+    )
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--log-level",
+        default="INFO",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser(
+        "run", parents=[common], help="Fetch, clean and store organizations."
+    )
+    run.set_defaults(handler=_run)
+    run.add_argument("--companies", default="resources/companies.csv")
+    run.add_argument(
+        "--has-header",
+        action="store_true",
+        help="The companies CSV starts with a header row.",
+    )
+    run.add_argument(
+        "--priority-window",
+        type=int,
+        default=10_000,
+        help="Companies read ahead to fetch those of higher priority first.",
+    )
+    run.add_argument(
+        "--output",
+        default=None,
+        help="CSV, JSONL, Parquet or SQLite file, by extension. Defaults to "
+        "./organizations.csv, or ./organizations.sqlite with --refresh.",
+    )
+    run.add_argument("--dead-letter", default="./dead_letter.jsonl")
+    run.add_argument("--fetch-state", default="./fetch_state.sqlite")
+    run.add_argument("--metrics-json", default="./metrics.json")
+    run.add_argument("--prometheus", default="./metrics.prom")
+    run.add_argument("--cpc", default="resources/cpc_ver3.csv")
+    run.add_argument("--isic", default="resources/isic_rev5.csv")
+    run.add_argument("--model", default="all-MiniLM-L6-v2")
+    run.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Only re-fetch companies whose sources changed or expired.",
+    )
+    run.add_argument("--max-age-days", type=float, default=30)
+    run.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="Organizations cleaned together.",
+    )
+    run.add_argument(
+        "--batch-interval",
+        type=float,
+        default=None,
+        help="Seconds after which a partial batch is cleaned anyway.",
+    )
+    run.add_argument(
+        "--fetch-concurrency",
+        type=int,
+        default=1,
+        help="Companies fetched at once.",
+    )
+    run.add_argument(
+        "--clean-concurrency",
+        type=int,
+        default=1,
+        help="Organizations or batches cleaned at once.",
+    )
+    run.add_argument("--checkpoint-every", type=int, default=1000)
+    run.add_argument("--max-attempts", type=int, default=3)
+    run.add_argument(
+        "--page-workers",
+        type=int,
+        default=8,
+        help="Pages fetched at once per company.",
+    )
+    run.add_argument("--per-host", type=int, default=2)
+    run.add_argument(
+        "--crawl-delay",
+        type=float,
+        default=1.0,
+        help="Minimum seconds between two requests to the same host.",
+    )
+    run.add_argument("--company-token-budget", type=int, default=None)
+    run.add_argument("--run-token-budget", type=int, default=None)
+    run.add_argument(
+        "--deferred-company-token-budget",
+        type=int,
+        default=None,
+        help="Tokens of a company retried after going over its budget. Defaults "
+        "to twice --company-token-budget, or its share of the run budget left.",
+    )
+    run.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only read and deduplicate the companies.",
+    )
+
+    cache = commands.add_parser(
+        "build-referential-cache",
+        parents=[common],
+        help="Embed referentials ahead of a run.",
+    )
+    cache.set_defaults(handler=_build_referential_cache)
+    cache.add_argument(
+        "referentials",
+        nargs="*",
+        default=["resources/cpc_ver3.csv", "resources/isic_rev5.csv"],
+    )
+    cache.add_argument("--model", default="all-MiniLM-L6-v2")
+    cache.add_argument("--force", action="store_true", help="Rebuild existing caches.")
+
+    benchmark = commands.add_parser(
+        "benchmark", parents=[common], help="Run an offline benchmark."
+    )
+    benchmark.set_defaults(handler=_benchmark)
+    benchmark.add_argument("name", choices=sorted(_BENCHMARKS))
+    benchmark.add_argument(
+        "arguments",
+        nargs=argparse.REMAINDER,
+        help="Options passed to the benchmark.",
+    )
+
+    merge = commands.add_parser(
+        "merge",
+        parents=[common],
+        help="Merge JSONL or Parquet outputs of several runs.",
+    )
+    merge.set_defaults(handler=_merge)
+    merge.add_argument("inputs", nargs="+", help="Later files replace earlier records.")
+    merge.add_argument("--output", required=True)
+    merge.add_argument("--key", default="company_name")
+
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    arguments: List[str] = list(sys.argv[1:] if argv is None else argv)
+    # Without a command, options apply to run, as before subcommands existed
+    if not arguments or arguments[0] not in _COMMANDS + ("-h", "--help"):
+        arguments.insert(0, "run")
+
+    args = build_parser().parse_args(arguments)
+    logging.basicConfig(level=args.log_level)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+import threading
+from collections import defaultdict
+from enum import Enum
+from typing import Dict, Optional
+
+
+class BudgetScope(str, Enum):
+    COMPANY = "company"
+    RUN = "run"
+
+
+class BudgetExceededError(RuntimeError):
+    def __init__(
+        self, scope: BudgetScope, used: int, limit: int, company: Optional[str]
+    ) -> None:
+        super().__init__(
+            f"Token budget exhausted for {scope.value}"
+            f"{f' {company}' if company else ''}: {used}/{limit} tokens."
+        )
+        self.scope = scope
+        self.used = used
+        self.limit = limit
+        self.company = company
+
+
+class TokenBudget:
+    """Thread-safe token accounting against per-company and per-run limits.
+
+    A limit of None means unlimited. Tokens are charged after each LLM call,
+    so a company can overshoot its limit by at most one call.
+    """
+
+    def __init__(
+        self, per_company: Optional[int] = None, per_run: Optional[int] = None
+    ) -> None:
+        self._per_company = per_company
+        self._per_run = per_run
+        self._lock = threading.Lock()
+        self._run_tokens = 0
+        self._company_tokens: Dict[str, int] = defaultdict(int)
+        self._company_limits: Dict[str, Optional[int]] = {}
+
+    @property
+    def per_company(self) -> Optional[int]:
+        return self._per_company
+
+    @property
+    def run_tokens(self) -> int:
+        return self._run_tokens
+
+    @property
+    def run_exhausted(self) -> bool:
+        return self._per_run is not None and self._run_tokens >= self._per_run
+
+    def company_tokens(self, company: str) -> int:
+        return self._company_tokens.get(company, 0)
+
+    def company_limit(self, company: str) -> Optional[int]:
+        return self._company_limits.get(company, self._per_company)
+
+    def second_pass_allowance(
+        self, companies: int, multiplier: float = 2.0
+    ) -> Optional[int]:
+        """Allowance of each of the companies retried after overspending.
+
+        A company that went over its cap would go over it again with the same
+        allowance, so it gets multiplier times the cap, or its share of what is
+        left of the run budget when that is larger.
+        """
+        if self._per_company is None:
+            return None
+        allowance = int(self._per_company * multiplier)
+        if self._per_run is not None and companies > 0:
+            with self._lock:
+                left = max(0, self._per_run - self._run_tokens)
+            allowance = max(allowance, left // companies)
+        return allowance
+
+    def allow(self, company: str, limit: Optional[int]) -> None:
+        """Give a company a fresh allowance, e.g. for a second pass."""
+        with self._lock:
+            self._company_limits[company] = limit
+            self._company_tokens[company] = 0
+
+    def check(self, company: Optional[str]) -> None:
+        """Raise if the run or the company has no budget left."""
+        with self._lock:
+            self._check(company, allow_equal=False)
+
+    def charge(self, company: Optional[str], tokens: int) -> None:
+        with self._lock:
+            self._run_tokens += tokens
+            if company is not None:
+                self._company_tokens[company] += tokens
+            self._check(company, allow_equal=True)
+
+    def _check(self, company: Optional[str], allow_equal: bool) -> None:
+        def over(used: int, limit: Optional[int]) -> bool:
+            return limit is not None and (
+                used > limit if allow_equal else used >= limit
+            )
+
+        if over(self._run_tokens, self._per_run):
+            raise BudgetExceededError(
+                BudgetScope.RUN, self._run_tokens, self._per_run or 0, company
+            )
+        if company is None:
+            return
+        limit = self._company_limits.get(company, self._per_company)
+        used = self._company_tokens.get(company, 0)
+        if over(used, limit):
+            raise BudgetExceededError(BudgetScope.COMPANY, used, limit or 0, company)
@@ -1,6 +1,7 @@
-from typing import Iterable, List
+from typing import Dict, Iterable, List, Optional, Sequence
 
-import dateparser
+import numpy as np
+from core.domains.date_parser import DateParser
 from core.entities.organizations import (
     EmployeeRange,
     Industry,
@@ -8,77 +9,104 @@ from core.entities.organizations import (
     Product,
     RawOrganization,
 )
-from core.ports.referential import Referential
-from streamable import Stream
+from core.ports.metrics import Metrics, NoopMetrics
+from core.ports.referential import Referential, ReferentialMatch
+
+# Inclusive upper bound of every EmployeeRange but the last one, in declaration order
+_EMPLOYEE_RANGE_BOUNDS = np.array([1, 10, 50, 200, 500, 1000, 5000, 10000])
+_EMPLOYEE_RANGES = list(EmployeeRange)
 
 
 class Cleaner:
 
     def __init__(
-        self, cpc_referential: Referential, isic_referential: Referential
+        self,
+        cpc_referential: Referential,
+        isic_referential: Referential,
+        date_parser: Optional[DateParser] = None,
+        metrics: Optional[Metrics] = None,
     ) -> None:
         self._cpc_referential = cpc_referential
         self._isic_referential = isic_referential
+        self._metrics = metrics or NoopMetrics()
+        self._date_parser = date_parser or DateParser(metrics=self._metrics)
 
     @staticmethod
-    def _enrich_employee(employees: int) -> EmployeeRange:
-        if employees == 1:
-            return EmployeeRange.SELF_EMPLOYED
-        elif employees < 11:
-            return EmployeeRange.RANGE_2_10
-        elif employees < 51:
-            return EmployeeRange.RANGE_11_50
-        elif employees < 201:
-            return EmployeeRange.RANGE_51_200
-        elif employees < 501:
-            return EmployeeRange.RANGE_201_500
-        elif employees < 1001:
-            return EmployeeRange.RANGE_501_1000
-        elif employees < 5001:
-            return EmployeeRange.RANGE_1001_5000
-        elif employees < 10001:
-            return EmployeeRange.RANGE_5001_10000
-        else:
-            return EmployeeRange.RANGE_10000_PLUS
+    def _enrich_employees(employees: Sequence[int]) -> List[EmployeeRange]:
+        indices = np.searchsorted(
+            _EMPLOYEE_RANGE_BOUNDS, np.asarray(employees, dtype=np.int64), side="left"
+        )
+        return [_EMPLOYEE_RANGES[idx] for idx in indices]
 
-    def _get_economic_activity(
-        self,
-        economic_activity: str,
-    ) -> Industry:
-        """Retrieve ISIC classification based on economic activity."""
-        result = self._isic_referential.get_closest_match(economic_activity)
+    @classmethod
+    def _enrich_employee(cls, employees: int) -> EmployeeRange:
+        return cls._enrich_employees([employees])[0]
+
+    @staticmethod
+    def _resolve(
+        referential: Referential, values: Iterable[str]
+    ) -> Dict[str, Optional[ReferentialMatch]]:
+        """Resolve each distinct value once, in a single batched lookup."""
+        unique_values = list(dict.fromkeys(values))
+        if not unique_values:
+            return {}
+        return dict(zip(unique_values, referential.get_closest_matches(unique_values)))
 
+    @staticmethod
+    def _to_industry(
+        economic_activity: str, result: Optional[ReferentialMatch]
+    ) -> Industry:
         if not result:
             raise ValueError(f"No ISIC classification found for: {economic_activity}")
 
-        return Industry(**{"isic_id": result.get(0), "value": result.get(1)})
+        return Industry(isic_id=result.key, value=result.value)
 
-    def _get_products(self, products: Iterable[str]) -> List[Product]:
-        def _serialize_product(result: dict) -> Product:
-            return Product(cpc_id=str(result.get(0)), value=result.get(1))
+    @staticmethod
+    def _to_products(
+        products: Iterable[str], matches: Dict[str, Optional[ReferentialMatch]]
+    ) -> List[Product]:
+        return [
+            Product(cpc_id=match.key, value=match.value)
+            for match in (matches[product] for product in products)
+            if match
+        ]
 
-        return list(
-            Stream(products)
-            .map(self._cpc_referential.get_closest_match)
-            .map(_serialize_product)
-        )
+    def serialize_to_organizations(
+        self, raw_organizations: Sequence[RawOrganization]
+    ) -> List[Organization]:
+        self._metrics.increment("clean.organizations", len(raw_organizations))
+        with self._metrics.timer("clean.isic_lookup"):
+            activities = self._resolve(
+                self._isic_referential,
+                (raw.economic_activity for raw in raw_organizations),
+            )
+        with self._metrics.timer("clean.cpc_lookup"):
+            products = self._resolve(
+                self._cpc_referential,
+                (product for raw in raw_organizations for product in raw.products),
+            )
+        employees = self._enrich_employees([raw.employees for raw in raw_organizations])
+
+        return [
+            Organization(
+                company_name=raw_organization.company_name,
+                creation_date=self._date_parser.parse(raw_organization.creation_date),
+                employees=employee_range,
+                economic_activity_raw=raw_organization.economic_activity,
+                economic_activity=self._to_industry(
+                    raw_organization.economic_activity,
+                    activities[raw_organization.economic_activity],
+                ),
+                products_raw=raw_organization.products,
+                products=self._to_products(raw_organization.products, products),
+                country_origin=raw_organization.country_origin,
+                countries_activity=raw_organization.countries_activity,
+                main_company_domains=raw_organization.main_company_domains,
+            )
+            for raw_organization, employee_range in zip(raw_organizations, employees)
+        ]
 
     def serialize_to_organization(
         self, raw_organization: RawOrganization
     ) -> Organization:
-        parsed_date = dateparser.parse(raw_organization.creation_date)
-
-        return Organization(
-            company_name=raw_organization.company_name,
-            creation_date=parsed_date.date() if parsed_date else None,
-            employees=self._enrich_employee(raw_organization.employees),
-            economic_activity_raw=raw_organization.economic_activity,
-            economic_activity=self._get_economic_activity(
-                raw_organization.economic_activity
-            ),
-            products_raw=raw_organization.products,
-            products=self._get_products(raw_organization.products),
-            country_origin=raw_organization.country_origin,
-            countries_activity=raw_organization.countries_activity,
-            main_company_domains=raw_organization.main_company_domains,
-        )
+        return self.serialize_to_organizations([raw_organization])[0]
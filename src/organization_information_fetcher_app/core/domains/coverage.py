@@ -0,0 +1,76 @@
+import re
+from typing import Dict, Iterable, Pattern, Set
+
+# Cues that a page states a RawOrganization field. They only need to be good
+# enough to tell when reading more pages is unlikely to add anything.
+_FIELD_CUES: Dict[str, Pattern[str]] = {
+    "creation_date": re.compile(
+        r"\b(?:founded|established|created|incorporated|since)\b[^.]{0,40}"
+        r"\b(?:1[5-9]|20)\d{2}\b"
+    ),
+    # Menus link to "Employees", "Products" or "Brands" pages from every page,
+    # so those fields need a number, a verb or a phrase introducing the values
+    "employees": re.compile(
+        r"\b\d[\d,. ]*\+?\s*(?:k\s+)?(?:employees|people|staff|workers|team members)\b"
+        r"|\b(?:employs|employing|headcount of|workforce of|team of)\s+"
+        r"(?:about |around |over |more than |nearly )?\d"
+    ),
+    "economic_activity": re.compile(
+        r"\b(?:industry|sector|specializ|specialis|leader in|provider of|"
+        r"manufactur|retailer|company that|we are a)"
+    ),
+    "products": re.compile(
+        r"\b(?:makes?|designs?|develops?|builds?|sells?|offers?|provides?|"
+        r"produces?|manufactures?|distributes?)\b[^.]{0,60}?"
+        r"\b(?:products?|services?|solutions?|software|equipment|tools|systems)\b"
+        r"|\b(?:products|services|solutions|offerings) (?:include|such as|range)\b"
+    ),
+    "product_names": re.compile(
+        r"\b(?:brands?|products?|ranges?|lines?|portfolio|catalog(?:ue)?)\s+"
+        r"(?:include|includes|including|such as|like|named|called)\b"
+        r"|\bunder the\b[^.]{0,40}\bbrands?\b|[®™]"
+    ),
+    "country_origin": re.compile(
+        r"\b(?:headquartered|headquarters|based in|located in|head office)\b"
+    ),
+    "countries_activity": re.compile(
+        r"\b(?:countries|worldwide|global(?:ly)?|international(?:ly)?|"
+        r"offices in|present in|operations in)\b"
+    ),
+    "main_company_domains": re.compile(
+        r"\b(?:www\.)?[a-z0-9-]+(?:\.[a-z0-9-]+)*\.[a-z]{2,}\b"
+    ),
+}
+
+
+class FieldCoverage:
+    """Track which RawOrganization fields the text read so far seems to cover.
+
+    The company name is the input of the fetch, it never has to be found.
+    """
+
+    def __init__(self) -> None:
+        self._missing: Set[str] = set(_FIELD_CUES)
+
+    @property
+    def missing(self) -> Set[str]:
+        return set(self._missing)
+
+    @property
+    def complete(self) -> bool:
+        return not self._missing
+
+    def update(self, text: str) -> bool:
+        """Account for a page of text and tell whether every field is covered."""
+        lowered = text.lower()
+        self._missing = {
+            field for field in self._missing if not _FIELD_CUES[field].search(lowered)
+        }
+        return self.complete
+
+    @classmethod
+    def of(cls, texts: Iterable[str]) -> "FieldCoverage":
+        coverage = cls()
+        for text in texts:
+            coverage.update(text)
+        return coverage
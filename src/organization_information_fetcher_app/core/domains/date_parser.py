@@ -0,0 +1,117 @@
+import logging
+import re
+from datetime import date
+from functools import lru_cache
+from typing import Callable, Optional, Sequence
+
+from core.ports.metrics import Metrics, NoopMetrics
+
+_LOGGER = logging.getLogger(__name__)
+
+_MONTHS = {
+    "jan": 1,
+    "feb": 2,
+    "mar": 3,
+    "apr": 4,
+    "may": 5,
+    "jun": 6,
+    "jul": 7,
+    "aug": 8,
+    "sep": 9,
+    "oct": 10,
+    "nov": 11,
+    "dec": 12,
+}
+_MONTH = r"(?P<month>[a-z]{3,9})\.?"
+_DAY = r"(?P<day>\d{1,2})(?:st|nd|rd|th)?"
+_YEAR = r"(?P<year>\d{4})"
+
+_ISO_DATE = re.compile(
+    r"^(?P<year>\d{4})[-/.](?P<month>\d{1,2})(?:[-/.](?P<day>\d{1,2}))?(?:[t ].*)?$"
+)
+_YEAR_ONLY = re.compile(rf"^(?:(?:founded|established|created|since|in)\s+)*{_YEAR}$")
+_MONTH_DAY_YEAR = re.compile(rf"^{_MONTH}\s+{_DAY},?\s+{_YEAR}$")
+_DAY_MONTH_YEAR = re.compile(rf"^{_DAY}\s+(?:of\s+)?{_MONTH},?\s+{_YEAR}$")
+_MONTH_YEAR = re.compile(rf"^{_MONTH},?\s+{_YEAR}$")
+
+
+class DateParser:
+    """Parse creation dates, trying common formats before falling back to dateparser.
+
+    Year-only and month-only values resolve to the first day of the period.
+    """
+
+    def __init__(
+        self,
+        languages: Sequence[str] = ("en",),
+        cache_size: Optional[int] = 4096,
+        metrics: Optional[Metrics] = None,
+    ) -> None:
+        self._languages = list(languages)
+        self._metrics = metrics or NoopMetrics()
+        self._fallback: Callable[[str], Optional[date]] = lru_cache(maxsize=cache_size)(
+            self._parse_with_dateparser
+        )
+
+    def __call__(self, value: Optional[str]) -> Optional[date]:
+        return self.parse(value)
+
+    def parse(self, value: Optional[str]) -> Optional[date]:
+        if not value:
+            return None
+
+        normalized = self._normalize(value)
+        if not normalized:
+            return None
+
+        parsed = self._parse_common_formats(normalized)
+        if parsed is not None:
+            self._metrics.increment("date_parser.fast_path")
+            return parsed
+
+        self._metrics.increment("date_parser.fallback")
+        return self._fallback(normalized)
+
+    @staticmethod
+    def _normalize(value: str) -> str:
+        return " ".join(value.lower().split())
+
+    @classmethod
+    def _parse_common_formats(cls, value: str) -> Optional[date]:
+        if match := _ISO_DATE.match(value):
+            return cls._build_date(match["year"], match["month"], match["day"])
+        if match := _YEAR_ONLY.match(value):
+            return cls._build_date(match["year"])
+        for pattern in (_MONTH_DAY_YEAR, _DAY_MONTH_YEAR):
+            if match := pattern.match(value):
+                month = _MONTHS.get(match["month"][:3])
+                if month is None:
+                    return None
+                return cls._build_date(match["year"], month, match["day"])
+        if match := _MONTH_YEAR.match(value):
+            month = _MONTHS.get(match["month"][:3])
+            if month is None:
+                return None
+            return cls._build_date(match["year"], month)
+        return None
+
+    @staticmethod
+    def _build_date(
+        year: str, month: Optional[int | str] = None, day: Optional[str] = None
+    ) -> Optional[date]:
+        try:
+            return date(int(year), int(month or 1), int(day or 1))
+        except ValueError:
+            return None
+
+    def _parse_with_dateparser(self, value: str) -> Optional[date]:
+        import dateparser  # imported lazily, it is slow to load
+
+        _LOGGER.debug("Falling back to dateparser for %r", value)
+        self._metrics.increment("date_parser.fallback_cache_misses")
+        parsed = dateparser.parse(
+            value,
+            languages=self._languages,
+            settings={"PREFER_DAY_OF_MONTH": "first", "PREFER_DATES_FROM": "past"},
+        )
+        return parsed.date() if parsed else None
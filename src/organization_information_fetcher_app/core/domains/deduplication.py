@@ -0,0 +1,185 @@
+import hashlib
+import logging
+import math
+import re
+import unicodedata
+from typing import Iterable, Iterator, List, Optional
+
+from core.entities.organizations import Company
+from core.ports.metrics import Metrics, NoopMetrics
+
+_LOGGER = logging.getLogger(__name__)
+
+_LEGAL_SUFFIXES = {
+    "ab",
+    "ag",
+    "as",
+    "bv",
+    "co",
+    "company",
+    "corp",
+    "corporation",
+    "gmbh",
+    "group",
+    "holding",
+    "holdings",
+    "inc",
+    "incorporated",
+    "kg",
+    "limited",
+    "llc",
+    "llp",
+    "lp",
+    "ltd",
+    "nv",
+    "oy",
+    "plc",
+    "pty",
+    "sa",
+    "sarl",
+    "sas",
+    "se",
+    "spa",
+    "srl",
+}
+
+
+def normalize_company_name(name: str) -> str:
+    """Reduce spelling variants of a company name to a single key.
+
+    Accents, case, punctuation, a leading "the" and trailing legal forms are
+    dropped, so "Google", "Google LLC" and "GOOGLE, Inc." share the key "google".
+    """
+    ascii_name = (
+        unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    )
+    # Dots are dropped first so that abbreviations like "S.A." stay one token
+    ascii_name = ascii_name.lower().replace(".", "").replace("&", " and ")
+    tokens = re.sub(r"[^a-z0-9]+", " ", ascii_name).split()
+    if len(tokens) > 1 and tokens[0] == "the":
+        tokens = tokens[1:]
+    while len(tokens) > 1 and tokens[-1] in _LEGAL_SUFFIXES:
+        tokens = tokens[:-1]
+    return " ".join(tokens)
+
+
+def normalize_domain(domain: str) -> str:
+    """Reduce a domain or URL to its lowercase host, without "www."."""
+    host = re.sub(r"^[a-z][a-z0-9+.-]*://", "", domain.strip().lower())
+    host = re.split(r"[/?#:]", host, maxsplit=1)[0]
+    return host.removeprefix("www.")
+
+
+class BloomFilter:
+    """Set membership in a fixed amount of memory, with false positives.
+
+    A filter holding capacity keys answers "seen" for an unseen key with
+    probability error_rate. Past capacity a new, larger and stricter layer is
+    added, so the overall error rate stays bounded however many keys come in.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 1e-6) -> None:
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError("Capacity must be positive and error rate in (0, 1).")
+        self._layers: List["_BloomLayer"] = [_BloomLayer(capacity, error_rate / 2)]
+
+    def __len__(self) -> int:
+        return sum(len(layer) for layer in self._layers)
+
+    def __contains__(self, key: str) -> bool:
+        hashes = _hash(key)
+        return any(layer.contains(hashes) for layer in self._layers)
+
+    @property
+    def size_in_bytes(self) -> int:
+        return sum(layer.size_in_bytes for layer in self._layers)
+
+    def add(self, key: str) -> bool:
+        """Add a key, telling whether it was (probably) already present."""
+        hashes = _hash(key)
+        if any(layer.contains(hashes) for layer in self._layers):
+            return True
+
+        layer = self._layers[-1]
+        if len(layer) >= layer.capacity:
+            layer = _BloomLayer(layer.capacity * 2, layer.error_rate / 2)
+            self._layers.append(layer)
+        layer.add(hashes)
+        return False
+
+
+def _hash(key: str) -> tuple[int, int]:
+    digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little")
+
+
+class _BloomLayer:
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self._hash_count = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def size_in_bytes(self) -> int:
+        return len(self._bits)
+
+    def _positions(self, hashes: tuple[int, int]) -> Iterator[int]:
+        # Enhanced double hashing: plain h1 + i * h2 clusters when h2 shares a
+        # factor with the size, raising the false positive rate
+        position, delta = hashes
+        for i in range(self._hash_count):
+            yield position % self._size
+            position += delta
+            delta += i
+
+    def contains(self, hashes: tuple[int, int]) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(hashes)
+        )
+
+    def add(self, hashes: tuple[int, int]) -> None:
+        for position in self._positions(hashes):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self._count += 1
+
+
+class CompanyDeduplicator:
+    """Drop companies already seen under the same normalized name or domain.
+
+    Memory stays constant per company whatever the input size, at the cost of
+    dropping an unseen company with probability error_rate.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1_000_000,
+        error_rate: float = 1e-6,
+        metrics: Optional[Metrics] = None,
+    ) -> None:
+        self._seen = BloomFilter(capacity, error_rate)
+        self._metrics = metrics or NoopMetrics()
+
+    def __call__(self, companies: Iterable[Company]) -> Iterator[Company]:
+        for company in companies:
+            if self.is_duplicate(company):
+                _LOGGER.debug("Skipping duplicate company %s", company.name)
+                self._metrics.increment("input.duplicates")
+                continue
+            self._metrics.increment("input.companies")
+            yield company
+
+    def is_duplicate(self, company: Company) -> bool:
+        """Record a company, telling whether it was seen before."""
+        keys = [f"name:{normalize_company_name(company.name)}"]
+        if company.domain:
+            keys.append(f"domain:{normalize_domain(company.domain)}")
+        # Add every key even once a duplicate is found, so the other keys of
+        # this company are known too
+        return any([self._seen.add(key) for key in keys])
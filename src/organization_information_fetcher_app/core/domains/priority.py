@@ -0,0 +1,36 @@
+import heapq
+import itertools
+from typing import Iterable, Iterator, List, Tuple
+
+from core.entities.organizations import Company
+
+
+class CompanyPrioritizer:
+    """Yield companies of higher priority first, within a window of companies.
+
+    At most window companies are held at once, so the input is still streamed
+    in constant memory: a company is only moved ahead of the window companies
+    read before it. Companies without priority come after prioritized ones and
+    equal priorities keep their input order.
+    """
+
+    def __init__(self, window: int = 10_000) -> None:
+        if window < 1:
+            raise ValueError("Window must be positive.")
+        self._window = window
+
+    def __call__(self, companies: Iterable[Company]) -> Iterator[Company]:
+        heap: List[Tuple[bool, float, int, Company]] = []
+        order = itertools.count()
+        for company in companies:
+            heapq.heappush(heap, (*self._key(company), next(order), company))
+            if len(heap) > self._window:
+                yield heapq.heappop(heap)[-1]
+        while heap:
+            yield heapq.heappop(heap)[-1]
+
+    @staticmethod
+    def _key(company: Company) -> Tuple[bool, float]:
+        if company.priority is None:
+            return True, 0.0
+        return False, -company.priority
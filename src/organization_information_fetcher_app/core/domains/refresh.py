@@ -0,0 +1,47 @@
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Callable, Optional
+
+from core.entities.sources import FetchRecord
+from core.ports.fetch_state import SourceChangeDetector
+
+
+class RefreshReason(str, Enum):
+    NEW = "new"
+    EXPIRED = "expired"
+    NO_SOURCES = "no_sources"
+    CHANGED = "changed"
+    UNCHANGED = "unchanged"
+
+
+class RefreshPolicy:
+    """Decide whether a company must go through the LLM again.
+
+    It must when it was never fetched, when its record is older than max_age,
+    or when one of the pages it was fetched from changed since.
+    """
+
+    def __init__(
+        self,
+        detector: SourceChangeDetector,
+        max_age: timedelta = timedelta(days=30),
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        self._detector = detector
+        self._max_age = max_age
+        self._clock = clock
+
+    def reason(self, record: Optional[FetchRecord]) -> RefreshReason:
+        if record is None:
+            return RefreshReason.NEW
+        if self._clock() - record.fetched_at > self._max_age:
+            return RefreshReason.EXPIRED
+        if not record.sources:
+            return RefreshReason.NO_SOURCES
+        # Stops at the first changed page
+        if any(self._detector.has_changed(source) for source in record.sources):
+            return RefreshReason.CHANGED
+        return RefreshReason.UNCHANGED
+
+    def needs_refresh(self, record: Optional[FetchRecord]) -> bool:
+        return self.reason(record) != RefreshReason.UNCHANGED
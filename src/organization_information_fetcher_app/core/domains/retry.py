@@ -0,0 +1,103 @@
+import logging
+import random
+import time
+from typing import Callable, Iterator, Optional, Tuple, Type, TypeVar
+
+from core.entities.failures import FailureKind
+
+_LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class RetryError(RuntimeError):
+    def __init__(self, error: BaseException, kind: FailureKind, attempts: int) -> None:
+        super().__init__(f"Failed after {attempts} attempt(s): {error!r}")
+        self.error = error
+        self.kind = kind
+        self.attempts = attempts
+
+
+def error_chain(error: BaseException) -> Iterator[BaseException]:
+    """Yield an error and the errors it wraps, through causes, contexts and args."""
+    seen = set()
+    pending = [error]
+    while pending:
+        current = pending.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        yield current
+        pending.extend(arg for arg in current.args if isinstance(arg, BaseException))
+        pending.extend(
+            wrapped
+            for wrapped in (current.__cause__, current.__context__)
+            if wrapped is not None
+        )
+
+
+class RetryPolicy:
+    """Retry transient failures with exponential backoff and full jitter.
+
+    An error is transient when it, or any error it wraps, is an instance of
+    transient_errors or satisfies is_transient. Anything else fails at once.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        transient_errors: Tuple[Type[BaseException], ...] = (
+            ConnectionError,
+            TimeoutError,
+        ),
+        is_transient: Optional[Callable[[BaseException], bool]] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("Max attempts must be at least 1.")
+        self._max_attempts = max_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._transient_errors = transient_errors
+        self._is_transient = is_transient
+        self._sleep = sleep
+
+    def classify(self, error: BaseException) -> FailureKind:
+        for wrapped in error_chain(error):
+            if isinstance(wrapped, self._transient_errors) or (
+                self._is_transient is not None and self._is_transient(wrapped)
+            ):
+                return FailureKind.TRANSIENT
+        return FailureKind.PERMANENT
+
+    def delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self._max_delay, self._base_delay * 2**attempt))
+
+    def call(
+        self,
+        fn: Callable[..., T],
+        *args: object,
+        on_retry: Optional[Callable[[BaseException, int], None]] = None,
+    ) -> T:
+        for attempt in range(1, self._max_attempts + 1):
+            try:
+                return fn(*args)
+            except Exception as e:
+                kind = self.classify(e)
+                if kind == FailureKind.PERMANENT or attempt == self._max_attempts:
+                    raise RetryError(e, kind, attempt) from e
+
+                delay = self.delay(attempt - 1)
+                _LOGGER.info(
+                    "Transient failure (attempt %d), retrying in %.1fs: %r",
+                    attempt,
+                    delay,
+                    e,
+                )
+                if on_retry is not None:
+                    on_retry(e, attempt)
+                self._sleep(delay)
+
+        raise AssertionError("unreachable")
@@ -0,0 +1,21 @@
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+
+class FailureKind(str, Enum):
+    TRANSIENT = "transient"
+    PERMANENT = "permanent"
+
+
+class FailedOrganization(BaseModel):
+    company_name: str
+    stage: str
+    failure_kind: FailureKind
+    error_type: str
+    error_message: str
+    attempts: int
+    partial_result: Optional[Dict[str, Any]] = None
+    failed_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
@@ -1,6 +1,6 @@
 from datetime import date
 from enum import Enum
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel
 
@@ -27,6 +27,13 @@ class Product(BaseModel):
     value: str
 
 
+class Company(BaseModel):
+    name: str
+    domain: Optional[str] = None
+    priority: Optional[float] = None
+    attributes: Dict[str, Any] = {}
+
+
 class RawOrganization(BaseModel):
     company_name: str
     creation_date: str
@@ -0,0 +1,17 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class PageSource(BaseModel):
+    url: str
+    content_hash: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class FetchRecord(BaseModel):
+    company_name: str
+    fetched_at: datetime
+    sources: List[PageSource] = []
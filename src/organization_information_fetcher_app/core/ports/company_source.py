@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from typing import Iterator
+
+from core.entities.organizations import Company
+
+
+class CompanySource(ABC):
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[Company]:
+        """Stream the companies to fetch, without loading them all in memory."""
@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import Optional, Self, Type
+
+from core.entities.sources import FetchRecord, PageSource
+
+
+class FetchStateStore(ABC):
+    """When each company was last fetched, and from which pages."""
+
+    @abstractmethod
+    def get(self, company_name: str) -> Optional[FetchRecord]:
+        pass
+
+    @abstractmethod
+    def put(self, record: FetchRecord) -> None:
+        pass
+
+    def flush(self) -> None:
+        """Persist buffered records."""
+
+    def close(self) -> None:
+        """Flush buffered records and release the underlying resources."""
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+class SourceChangeDetector(ABC):
+
+    @abstractmethod
+    def has_changed(self, source: PageSource) -> bool:
+        """Tell whether a page differs from when it was recorded."""
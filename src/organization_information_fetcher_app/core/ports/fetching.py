@@ -1,10 +1,42 @@
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
 
 from core.entities.organizations import RawOrganization
+from core.entities.sources import PageSource
+
+_SOURCES: ContextVar[Optional[List[PageSource]]] = ContextVar(
+    "page_sources", default=None
+)
 
 
 class RawOrganizationFetcher(ABC):
 
     @abstractmethod
-    def get_raw_organization_information(self, value: str) -> RawOrganization:
-        pass
+    def get_raw_organization_information(
+        self, value: str, domain: Optional[str] = None
+    ) -> RawOrganization:
+        """Fetch a company by name, crawling its domain directly when it is known."""
+
+    @staticmethod
+    def is_recording_sources() -> bool:
+        return _SOURCES.get() is not None
+
+    @staticmethod
+    def record_source(source: PageSource) -> None:
+        """Report a page read while fetching, outside recording_sources it is dropped."""
+        sources = _SOURCES.get()
+        if sources is not None:
+            sources.append(source)
+
+    @staticmethod
+    @contextmanager
+    def recording_sources() -> Iterator[List[PageSource]]:
+        """Collect the pages reported by the fetcher in this block."""
+        sources: List[PageSource] = []
+        token = _SOURCES.set(sources)
+        try:
+            yield sources
+        finally:
+            _SOURCES.reset(token)
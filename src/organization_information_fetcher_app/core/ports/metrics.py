@@ -0,0 +1,50 @@
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+_CURRENT_COMPANY: ContextVar[Optional[str]] = ContextVar(
+    "current_company", default=None
+)
+
+
+class Metrics(ABC):
+
+    @abstractmethod
+    def observe(self, name: str, value: float) -> None:
+        """Record a sample in the histogram called name."""
+
+    @abstractmethod
+    def increment(self, name: str, value: float = 1) -> None:
+        """Increase the counter called name, also attributed to the current company."""
+
+    @staticmethod
+    def current_company() -> Optional[str]:
+        return _CURRENT_COMPANY.get()
+
+    @contextmanager
+    def company(self, name: str) -> Iterator[None]:
+        """Attribute the counters incremented in this block to a company."""
+        token = _CURRENT_COMPANY.set(name)
+        try:
+            yield
+        finally:
+            _CURRENT_COMPANY.reset(token)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+
+class NoopMetrics(Metrics):
+
+    def observe(self, name: str, value: float) -> None:
+        pass
+
+    def increment(self, name: str, value: float = 1) -> None:
+        pass
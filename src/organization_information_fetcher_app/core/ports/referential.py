@@ -1,9 +1,19 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, NamedTuple, Optional, Sequence
+
+
+class ReferentialMatch(NamedTuple):
+    key: str
+    value: str
 
 
 class Referential(ABC):
 
     @abstractmethod
-    def get_closest_match(self, value: str) -> Optional[dict]:
+    def get_closest_match(self, value: str) -> Optional[ReferentialMatch]:
         pass
+
+    def get_closest_matches(
+        self, values: Sequence[str]
+    ) -> List[Optional[ReferentialMatch]]:
+        return [self.get_closest_match(value) for value in values]
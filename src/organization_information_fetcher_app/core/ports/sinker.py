@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import Iterable, Optional, Self, Type
 
 from pydantic import BaseModel
 
@@ -8,3 +10,30 @@ class Sinker(ABC):
     @abstractmethod
     def sink_organization(self, data: BaseModel) -> None:
         pass
+
+    def sink_organizations(self, data: Iterable[BaseModel]) -> None:
+        for record in data:
+            self.sink_organization(record)
+
+    @property
+    def durable_flush(self) -> bool:
+        """Whether records are readable from the output once flushed, rather
+        than only once the sinker is closed."""
+        return True
+
+    def flush(self, fsync: bool = False) -> None:
+        """Write buffered records, forcing them to disk when fsync is set."""
+
+    def close(self) -> None:
+        """Flush buffered records and release the underlying resources."""
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
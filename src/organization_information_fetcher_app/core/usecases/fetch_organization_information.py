@@ -1,24 +1,395 @@
-from typing import Iterable
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from queue import Empty, Full, Queue
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    TypeVar,
+)
 
+from core.domains.budget import BudgetExceededError, BudgetScope, TokenBudget
 from core.domains.cleaner import Cleaner
+from core.domains.refresh import RefreshPolicy, RefreshReason
+from core.domains.retry import RetryError, RetryPolicy
+from core.entities.failures import FailedOrganization
+from core.entities.organizations import Company, Organization, RawOrganization
+from core.entities.sources import FetchRecord
+from core.ports.fetch_state import FetchStateStore
 from core.ports.fetching import RawOrganizationFetcher
+from core.ports.metrics import Metrics, NoopMetrics
 from core.ports.sinker import Sinker
 from streamable import Stream
 
+_LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _Fetched(NamedTuple):
+    company: Company
+    raw_organization: RawOrganization
+    record: FetchRecord
+
+
+class _Cleaned(NamedTuple):
+    organization: Organization
+    record: FetchRecord
+
+
+class _End(NamedTuple):
+    error: Optional[BaseException] = None
+
+
+def _group_by_time(
+    items: Iterable[T], size: int, interval: timedelta
+) -> Iterator[List[T]]:
+    """Group items by size, cutting a batch short once interval has passed
+    since its first item, even while the next item is still being produced.
+
+    Items are pulled on a thread of their own through a queue of size items,
+    so waiting on a slow upstream never holds a partial batch back.
+    """
+    queue: Queue[T | _End] = Queue(maxsize=size)
+    stopped = threading.Event()
+
+    def put(item: T | _End) -> bool:
+        while not stopped.is_set():
+            try:
+                queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                pass
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put(item):
+                    return
+        except BaseException as e:
+            put(_End(e))
+        else:
+            put(_End())
+
+    threading.Thread(target=produce, name="batches", daemon=True).start()
+    batch: List[T] = []
+    deadline = 0.0
+    try:
+        while True:
+            try:
+                item = queue.get(
+                    timeout=max(0.0, deadline - time.monotonic()) if batch else None
+                )
+            except Empty:
+                yield batch
+                batch = []
+                continue
+            if isinstance(item, _End):
+                if batch:
+                    yield batch
+                if item.error is not None:
+                    raise item.error
+                return
+            if not batch:
+                deadline = time.monotonic() + interval.total_seconds()
+            batch.append(item)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+    finally:
+        stopped.set()
+
 
 class FetchOrganizationInformation:
+    """Fetch, clean and sink companies as a pipeline of concurrent stages.
+
+    Each stage runs on its own pool of fetch_concurrency and clean_concurrency
+    threads and keeps at most that many items in flight, so a slow stage holds
+    back the stages feeding it instead of piling up their results. Items come
+    out of a concurrent stage in completion order. Cleaning is micro-batched
+    when batch_size is above 1, a batch being cleaned batch_interval after its
+    first organization even if fetching the next one takes longer. Sinking
+    stays on the calling thread, wrap the sinker in a BackgroundSinker to write
+    on a thread of its own.
+    """
 
     def __init__(
-        self, fetcher: RawOrganizationFetcher, cleaner: Cleaner, sinker: Sinker
+        self,
+        fetcher: RawOrganizationFetcher,
+        cleaner: Cleaner,
+        sinker: Sinker,
+        batch_size: int = 1,
+        metrics: Optional[Metrics] = None,
+        budget: Optional[TokenBudget] = None,
+        deferred_company_budget: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        dead_letter: Optional[Sinker] = None,
+        fetch_state: Optional[FetchStateStore] = None,
+        refresh_policy: Optional[RefreshPolicy] = None,
+        checkpoint_every: int = 1000,
+        fetch_concurrency: int = 1,
+        clean_concurrency: int = 1,
+        batch_interval: Optional[timedelta] = None,
     ) -> None:
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1.")
+        if fetch_concurrency < 1 or clean_concurrency < 1:
+            raise ValueError("Stage concurrency must be at least 1.")
+        if fetch_state is not None and not sinker.durable_flush:
+            # A checkpoint would mark companies fetched while their records
+            # cannot be read back yet
+            raise ValueError(
+                "Fetch state needs a sinker whose records are readable once " "flushed."
+            )
         self._fetcher = fetcher
         self._cleaner = cleaner
         self._sinker = sinker
+        self._batch_size = batch_size
+        self._metrics = metrics or NoopMetrics()
+        self._budget = budget
+        self._deferred_company_budget = deferred_company_budget
+        self._retry_policy = retry_policy or RetryPolicy(max_attempts=1)
+        self._dead_letter = dead_letter
+        self._fetch_state = fetch_state
+        self._refresh_policy = refresh_policy
+        self._checkpoint_every = checkpoint_every
+        self._fetch_concurrency = fetch_concurrency
+        self._clean_concurrency = clean_concurrency
+        self._batch_interval = batch_interval
+        self._unsaved_records = 0
+        # Fetches and cleans fail from the stage threads
+        self._lock = threading.Lock()
+        self._deferred: List[Company] = []
+        self._cut_off: List[str] = []
+        self._failed: List[FailedOrganization] = []
 
-    def __call__(self, companies: Iterable[str]) -> None:
-        list(
+    @property
+    def cut_off_companies(self) -> List[str]:
+        """Companies dropped because the run or their second pass ran out of budget."""
+        return list(self._cut_off)
+
+    @property
+    def failed_companies(self) -> List[FailedOrganization]:
+        """Companies that failed a stage, as written to the dead letter sinker."""
+        return list(self._failed)
+
+    def _fetch(self, company: str | Company) -> Optional[_Fetched]:
+        if isinstance(company, str):
+            company = Company(name=company)
+
+        if self._budget is not None and self._budget.run_exhausted:
+            with self._lock:
+                self._cut_off.append(company.name)
+            return None
+
+        if not self._needs_refresh(company):
+            return None
+
+        # Only pass the domain along when known, so the search path stays as is
+        args = (
+            (company.name,)
+            if company.domain is None
+            else (company.name, company.domain)
+        )
+        with (
+            self._metrics.company(company.name),
+            self._metrics.timer("pipeline.fetch"),
+        ):
+            self._metrics.increment("pipeline.companies")
+            try:
+                with RawOrganizationFetcher.recording_sources() as sources:
+                    raw_organization = self._call_with_retries(
+                        self._fetcher.get_raw_organization_information, *args
+                    )
+            except RetryError as e:
+                if isinstance(e.error, BudgetExceededError):
+                    self._on_budget_exceeded(company, e.error)
+                else:
+                    self._on_failure(company.name, "fetch", e)
+                return None
+
+        # A page read again on a retry replaces its earlier version
+        record = FetchRecord(
+            company_name=company.name,
+            fetched_at=datetime.now(timezone.utc),
+            sources=list({source.url: source for source in sources}.values()),
+        )
+        return _Fetched(company, raw_organization, record)
+
+    def _needs_refresh(self, company: Company) -> bool:
+        if self._refresh_policy is None or self._fetch_state is None:
+            return True
+
+        with self._metrics.company(company.name), self._metrics.timer("refresh.check"):
+            reason = self._refresh_policy.reason(self._fetch_state.get(company.name))
+            self._metrics.increment(f"refresh.{reason.value}")
+        _LOGGER.debug("Refresh check for %s: %s", company.name, reason.value)
+        return reason != RefreshReason.UNCHANGED
+
+    def _call_with_retries(self, fn: Callable[..., T], *args: Any) -> T:
+        return self._retry_policy.call(
+            fn, *args, on_retry=lambda *_: self._metrics.increment("pipeline.retries")
+        )
+
+    def _on_failure(
+        self,
+        company: str,
+        stage: str,
+        error: RetryError,
+        partial_result: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        _LOGGER.error(
+            "%s failed at %s after %d attempt(s): %r",
+            company,
+            stage,
+            error.attempts,
+            error.error,
+        )
+        self._metrics.increment(f"pipeline.failures.{stage}")
+        failure = FailedOrganization(
+            company_name=company,
+            stage=stage,
+            failure_kind=error.kind,
+            error_type=type(error.error).__name__,
+            error_message=str(error.error),
+            attempts=error.attempts,
+            partial_result=partial_result,
+        )
+        with self._lock:
+            self._failed.append(failure)
+            if self._dead_letter is not None:
+                self._dead_letter.sink_organization(failure)
+
+    def _on_budget_exceeded(self, company: Company, error: BudgetExceededError) -> None:
+        with self._lock:
+            if error.scope == BudgetScope.COMPANY and company not in self._deferred:
+                _LOGGER.info("Deferring %s to the second pass: %s", company.name, error)
+                self._metrics.increment("budget.deferred")
+                self._deferred.append(company)
+            else:
+                _LOGGER.warning("Cutting off %s: %s", company.name, error)
+                self._metrics.increment("budget.cut_off")
+                self._cut_off.append(company.name)
+
+    def _clean(self, fetched: _Fetched) -> Optional[_Cleaned]:
+        with self._metrics.timer("pipeline.clean"):
+            try:
+                organization = self._call_with_retries(
+                    self._cleaner.serialize_to_organization, fetched.raw_organization
+                )
+            except RetryError as e:
+                self._on_failure(
+                    fetched.company.name,
+                    "clean",
+                    e,
+                    partial_result=fetched.raw_organization.model_dump(mode="json"),
+                )
+                return None
+        return _Cleaned(organization, fetched.record)
+
+    def _clean_batch(self, batch: List[_Fetched]) -> List[Optional[_Cleaned]]:
+        with self._metrics.timer("pipeline.clean_batch"):
+            try:
+                organizations = self._cleaner.serialize_to_organizations(
+                    [fetched.raw_organization for fetched in batch]
+                )
+            except Exception:
+                # One bad record must not take its batch down: clean them one
+                # by one so only the faulty ones end up in the dead letter
+                _LOGGER.warning(
+                    "Batch of %d failed to clean, retrying record by record",
+                    len(batch),
+                )
+                return [self._clean(fetched) for fetched in batch]
+        return [
+            _Cleaned(organization, fetched.record)
+            for organization, fetched in zip(organizations, batch)
+        ]
+
+    def _sink(self, cleaned: _Cleaned) -> None:
+        with self._metrics.timer("pipeline.sink"):
+            self._sinker.sink_organization(cleaned.organization)
+
+        if self._fetch_state is not None:
+            self._fetch_state.put(cleaned.record)
+            self._unsaved_records += 1
+            if self._unsaved_records >= self._checkpoint_every:
+                self._checkpoint()
+
+    def _checkpoint(self) -> None:
+        """Save fetch records only once their organizations are flushed, so a
+        crash can never mark an organization fresh without it being written."""
+        self._sinker.flush()
+        if self._fetch_state is not None:
+            self._fetch_state.flush()
+        self._unsaved_records = 0
+
+    def _run(self, companies: Iterable[str | Company]) -> None:
+        fetched = (
             Stream(companies)
-            .map(self._fetcher.get_raw_organization_information)  # adapters
-            .map(self._cleaner.serialize_to_organization)  # domains
-            .map(self._sinker.sink_organization)  # repositories
+            .map(
+                self._fetch,
+                concurrency=self._fetch_concurrency,
+                ordered=False,
+            )  # adapters
+            .filter(lambda fetched: fetched is not None)
         )
+
+        if self._batch_size == 1:
+            cleaned = fetched.map(
+                self._clean, concurrency=self._clean_concurrency, ordered=False
+            )  # domains
+        else:
+            # Stream.group only checks its interval when the next item comes
+            # in, so a slow fetch would still hold back a partial batch
+            batches = (
+                fetched.group(size=self._batch_size)
+                if self._batch_interval is None
+                else Stream(
+                    _group_by_time(fetched, self._batch_size, self._batch_interval)
+                )
+            )
+            cleaned = batches.map(
+                self._clean_batch,
+                concurrency=self._clean_concurrency,
+                ordered=False,
+            ).flatten()  # domains
+
+        list(
+            cleaned.filter(lambda cleaned: cleaned is not None).map(self._sink)
+        )  # repositories
+
+    def __call__(self, companies: Iterable[str | Company]) -> None:
+        self._deferred.clear()
+        self._cut_off.clear()
+        self._failed.clear()
+
+        self._run(companies)
+
+        if self._deferred and self._budget is not None:
+            # Companies that ran out of budget get a second chance once the
+            # easy ones are done, within whatever is left of the run budget
+            _LOGGER.info("Second pass over %d deferred companies", len(self._deferred))
+            # Without a budget of their own, deferred companies get a larger
+            # allowance than the cap they overspent, but never an unbounded one
+            second_pass_budget = (
+                self._budget.second_pass_allowance(len(self._deferred))
+                if self._deferred_company_budget is None
+                else self._deferred_company_budget
+            )
+            for company in self._deferred:
+                self._budget.allow(company.name, second_pass_budget)
+            self._run(list(self._deferred))
+
+        with self._metrics.timer("pipeline.flush"):
+            self._checkpoint()
+            if self._dead_letter is not None:
+                self._dead_letter.flush()
@@ -0,0 +1,252 @@
+import logging
+import threading
+import time
+import xml.etree.ElementTree as ElementTree
+from concurrent.futures import Future
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence
+from urllib.parse import urljoin, urlsplit
+from urllib.robotparser import RobotFileParser
+
+import requests
+from core.ports.metrics import Metrics, NoopMetrics
+from infrastructure.adapters.page_sources import (
+    USER_AGENT,
+    ThreadLocalSessions,
+    html_to_text,
+    record_page,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_PATHS = ("/", "/about", "/company", "/contact")
+DEFAULT_SITEMAP_KEYWORDS = (
+    "about",
+    "company",
+    "contact",
+    "history",
+    "who-we-are",
+    "team",
+    "products",
+    "services",
+)
+
+
+class CrawledPage(NamedTuple):
+    url: str
+    text: str
+
+
+def base_url(domain: str) -> str:
+    """Turn a bare domain or a URL into the scheme and host to crawl."""
+    parts = urlsplit(domain if "://" in domain else f"https://{domain}")
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+class RobotsCache:
+    """Fetch each host's robots.txt once and answer can_fetch from memory.
+
+    A missing robots.txt allows everything, an unauthorized one disallows
+    everything, as urllib.robotparser does.
+    """
+
+    def __init__(
+        self,
+        sessions: Callable[[], requests.Session],
+        user_agent: str = USER_AGENT,
+    ):
+        self._sessions = sessions
+        self._user_agent = user_agent
+        self._lock = threading.Lock()
+        self._parsers: Dict[str, Future[RobotFileParser]] = {}
+
+    def get(self, site: str) -> RobotFileParser:
+        # The lock only guards the dict: a slow robots.txt must not hold up
+        # other hosts, while concurrent callers for the same host share a fetch
+        with self._lock:
+            parser = self._parsers.get(site)
+            is_fetching = parser is None
+            if parser is None:
+                parser = self._parsers[site] = Future()
+
+        if is_fetching:
+            try:
+                parser.set_result(self._fetch(site))
+            except BaseException as e:
+                with self._lock:
+                    del self._parsers[site]
+                parser.set_exception(e)
+        return parser.result()
+
+    def can_fetch(self, url: str) -> bool:
+        return self.get(base_url(url)).can_fetch(self._user_agent, url)
+
+    def crawl_delay(self, site: str) -> Optional[float]:
+        delay = self.get(site).crawl_delay(self._user_agent)
+        return float(delay) if delay is not None else None
+
+    def _fetch(self, site: str) -> RobotFileParser:
+        parser = RobotFileParser(f"{site}/robots.txt")
+        try:
+            response = self._sessions().get(parser.url, timeout=10)
+        except requests.RequestException as e:
+            _LOGGER.info("Could not read %s, crawling unrestricted: %r", parser.url, e)
+            parser.allow_all = True
+            return parser
+
+        if response.status_code in (401, 403):
+            parser.disallow_all = True
+        elif response.status_code >= 400:
+            parser.allow_all = True
+        else:
+            parser.parse(response.text.splitlines())
+        return parser
+
+
+class PolitenessScheduler:
+    """Space requests to the same host by at least min_delay seconds.
+
+    Hosts are independent: waiting for one never delays another.
+    """
+
+    def __init__(
+        self,
+        min_delay: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._min_delay = min_delay
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = {}
+
+    def wait(self, host: str, delay: Optional[float] = None) -> None:
+        """Block until host may be requested again, then book the next slot."""
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + max(self._min_delay, delay or 0.0)
+        if slot > now:
+            self._sleep(slot - now)
+
+
+class DomainCrawler:
+    """Read the pages of a known company site that usually describe it: the
+    home page, about, company and contact pages, and matching sitemap entries.
+
+    Each thread crawls with a session of its own.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], requests.Session] = requests.Session,
+        scheduler: Optional[PolitenessScheduler] = None,
+        paths: Sequence[str] = DEFAULT_PATHS,
+        sitemap_keywords: Sequence[str] = DEFAULT_SITEMAP_KEYWORDS,
+        max_sitemap_pages: int = 5,
+        max_chars_per_page: int = 5000,
+        timeout: float = 10.0,
+        user_agent: str = USER_AGENT,
+        metrics: Optional[Metrics] = None,
+    ) -> None:
+        self._sessions = ThreadLocalSessions(session_factory, user_agent)
+        self._scheduler = scheduler or PolitenessScheduler()
+        self._robots = RobotsCache(self._sessions, user_agent)
+        self._paths = paths
+        self._sitemap_keywords = sitemap_keywords
+        self._max_sitemap_pages = max_sitemap_pages
+        self._max_chars_per_page = max_chars_per_page
+        self._timeout = timeout
+        self._metrics = metrics or NoopMetrics()
+
+    @property
+    def robots(self) -> RobotsCache:
+        return self._robots
+
+    @property
+    def scheduler(self) -> PolitenessScheduler:
+        return self._scheduler
+
+    def crawl(self, domain: str) -> List[CrawledPage]:
+        site = base_url(domain)
+        with self._metrics.timer("crawl.domain"):
+            urls = [urljoin(site, path) for path in self._paths]
+            urls += [url for url in self._sitemap_urls(site) if url not in urls]
+
+            pages = []
+            for url in urls:
+                html = self._get(site, url)
+                if html is None:
+                    continue
+                text = html_to_text(html)[: self._max_chars_per_page]
+                if text:
+                    pages.append(CrawledPage(url, text))
+
+        _LOGGER.debug("Crawled %d pages from %s", len(pages), site)
+        self._metrics.increment("crawl.pages", len(pages))
+        return pages
+
+    def _get(self, site: str, url: str) -> Optional[str]:
+        """Download a content page, recording it as a source of the company."""
+        response = self._download(site, url)
+        if response is None:
+            return None
+        record_page(url, response)
+        return response.text
+
+    def _download(self, site: str, url: str) -> Optional[requests.Response]:
+        if not self._robots.can_fetch(url):
+            self._metrics.increment("crawl.disallowed")
+            return None
+
+        self._scheduler.wait(urlsplit(site).netloc, self._robots.crawl_delay(site))
+        self._metrics.increment("crawl.requests")
+        try:
+            response = self._sessions().get(url, timeout=self._timeout)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            _LOGGER.debug("Skipping %s: %r", url, e)
+            return None
+        self._metrics.increment("fetch.bytes_downloaded", len(response.content))
+        return response
+
+    def _sitemap_urls(self, site: str) -> List[str]:
+        sitemaps = self._robots.get(site).site_maps() or [f"{site}/sitemap.xml"]
+        host = urlsplit(site).netloc
+        selected: List[str] = []
+        for url in self._sitemap_locations(site, sitemaps, depth=1):
+            if len(selected) >= self._max_sitemap_pages:
+                break
+            parts = urlsplit(url)
+            if parts.netloc == host and any(
+                keyword in parts.path.lower() for keyword in self._sitemap_keywords
+            ):
+                selected.append(url)
+        return selected
+
+    def _sitemap_locations(
+        self, site: str, sitemaps: Iterable[str], depth: int
+    ) -> Iterable[str]:
+        """Yield the page URLs of sitemaps, following sitemap indexes depth deep."""
+        for sitemap in sitemaps:
+            # Sitemaps change with every page of the site, they are not sources
+            # of the company: recording them would make every refresh re-fetch
+            response = self._download(site, sitemap)
+            if response is None:
+                continue
+            try:
+                root = ElementTree.fromstring(response.content)
+            except ElementTree.ParseError:
+                _LOGGER.debug("Skipping malformed sitemap %s", sitemap)
+                continue
+
+            locations = [
+                element.text.strip()
+                for element in root.iter()
+                if element.tag.endswith("loc") and element.text
+            ]
+            if root.tag.endswith("sitemapindex"):
+                if depth > 0:
+                    yield from self._sitemap_locations(site, locations, depth - 1)
+            else:
+                yield from locations
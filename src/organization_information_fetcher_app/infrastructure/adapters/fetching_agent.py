@@ -1,25 +1,99 @@
 import logging
-from typing import Any, Dict, Iterable, Optional, Self
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Self,
+    Tuple,
+)
 
 import requests
 from bs4 import BeautifulSoup
+from core.domains.budget import TokenBudget
+from core.domains.coverage import FieldCoverage
 from core.entities.organizations import RawOrganization
 from core.ports.fetching import RawOrganizationFetcher
+from core.ports.metrics import Metrics, NoopMetrics
 from googlesearch import search
-from langchain.agents import AgentExecutor, AgentType, initialize_agent
-from langchain.tools import Tool
-from langchain_core.language_models import BaseChatModel
-from langchain_core.prompts import ChatPromptTemplate
+from infrastructure.adapters.domain_crawler import CrawledPage, DomainCrawler
+from infrastructure.adapters.page_retriever import ConcurrentPageRetriever
+from infrastructure.adapters.page_sources import record_page
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
 from langchain_core.rate_limiters import InMemoryRateLimiter
-from langchain_mistralai import ChatMistralAI
+
+if TYPE_CHECKING:
+    from langchain.agents import AgentExecutor
+    from langchain_core.language_models import BaseChatModel
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _token_usage(response: LLMResult) -> Tuple[int, int]:
+    """Return the input and output tokens reported for an LLM call."""
+    token_usage = (response.llm_output or {}).get("token_usage") or {}
+    if token_usage:
+        return token_usage.get("prompt_tokens", 0), token_usage.get(
+            "completion_tokens", 0
+        )
+
+    input_tokens = output_tokens = 0
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(
+                getattr(generation, "message", None), "usage_metadata", None
+            )
+            if usage:
+                input_tokens += usage.get("input_tokens", 0)
+                output_tokens += usage.get("output_tokens", 0)
+    return input_tokens, output_tokens
+
+
+class MetricsCallbackHandler(BaseCallbackHandler):
+    """Count LLM calls and tokens for the company being fetched."""
+
+    def __init__(self, metrics: Metrics) -> None:
+        self._metrics = metrics
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        input_tokens, output_tokens = _token_usage(response)
+        self._metrics.increment("llm.calls")
+        self._metrics.increment("llm.input_tokens", input_tokens)
+        self._metrics.increment("llm.output_tokens", output_tokens)
+
+
+class BudgetCallbackHandler(BaseCallbackHandler):
+    """Charge every LLM call to the company being fetched, aborting past budget.
+
+    The company is read from Metrics.current_company(), which
+    RawOrganizationFetcherFromCompanyName sets for each company it fetches.
+    """
+
+    raise_error = True
+
+    def __init__(self, budget: TokenBudget) -> None:
+        self._budget = budget
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        self._budget.charge(Metrics.current_company(), sum(_token_usage(response)))
+
+
 class RawOrganizationFetcherFromCompanyNameBuilder:
-    _llm: Optional[BaseChatModel] = None
+    _llm: Optional["BaseChatModel"] = None
     _rate_limiter: Optional[InMemoryRateLimiter] = None
     _is_verbose: bool = False
+    _metrics: Metrics = NoopMetrics()
+    _search_backend: Optional[Callable[[str], Iterable[str]]] = None
+    _budget: Optional[TokenBudget] = None
+    _crawl_domains: bool = False
+    _crawler: Optional[DomainCrawler] = None
+    _retrieve_pages: bool = False
+    _page_retriever: Optional[ConcurrentPageRetriever] = None
 
     def with_standard_rate_limiter(self) -> Self:
         self._rate_limiter = InMemoryRateLimiter(
@@ -31,10 +105,59 @@ class RawOrganizationFetcherFromCompanyNameBuilder:
         self._is_verbose = True
         return self
 
+    def with_llm(self, llm: "BaseChatModel") -> Self:
+        self._llm = llm
+        return self
+
+    def with_search_backend(
+        self, search_backend: Callable[[str], Iterable[str]]
+    ) -> Self:
+        self._search_backend = search_backend
+        return self
+
+    def with_domain_crawler(self, crawler: Optional[DomainCrawler] = None) -> Self:
+        """Crawl known company domains directly instead of searching the web."""
+        self._crawl_domains = True
+        self._crawler = crawler
+        return self
+
+    def with_page_retriever(
+        self, page_retriever: Optional[ConcurrentPageRetriever] = None
+    ) -> Self:
+        """Let the agent fetch all search results at once with retrieve_pages."""
+        self._retrieve_pages = True
+        self._page_retriever = page_retriever
+        return self
+
+    def with_budget(self, budget: TokenBudget) -> Self:
+        self._budget = budget
+        return self
+
+    def with_metrics(self, metrics: Metrics) -> Self:
+        self._metrics = metrics
+        return self
+
+    def _instrument(
+        self, name: str, func: Callable[[str], Any]
+    ) -> Callable[[str], Any]:
+        metrics = self._metrics
+
+        def instrumented(value: str) -> Any:
+            metrics.increment(f"tool.{name}.calls")
+            with metrics.timer(f"tool.{name}"):
+                result = func(value)
+            if isinstance(result, str) and name == "retrieve_page":
+                metrics.increment("fetch.bytes_downloaded", len(result.encode()))
+            return result
+
+        return instrumented
+
     def with_mistral_ai(self) -> Self:
         if not self._rate_limiter:
             raise ValueError("Rate limiter must be set before initializing LLM.")
 
+        from langchain_mistralai import ChatMistralAI
+
         self._llm = ChatMistralAI(
             model="mistral-small-latest", temperature=0.1, rate_limiter=self._rate_limiter  # type: ignore
         )
@@ -45,6 +168,7 @@ class RawOrganizationFetcherFromCompanyNameBuilder:
         try:
             response = requests.get(url)
             response.raise_for_status()
+            record_page(url, response)
             return response.text
         except requests.exceptions.RequestException as e:
             raise ValueError(f"Error retrieving {url}.", e)
@@ -58,9 +182,12 @@ class RawOrganizationFetcherFromCompanyNameBuilder:
             raise ValueError("Error parsing.", e)
 
     @staticmethod
-    def search_company(company_name: str) -> list[str]:
+    def search_company(
+        company_name: str,
+        search_backend: Optional[Callable[[str], Iterable[str]]] = None,
+    ) -> list[str]:
         try:
-            return list(search(company_name))
+            return list((search_backend or search)(company_name))
         except Exception as e:
             raise ValueError(f"Error searching for company {company_name}.", e)
 
@@ -70,24 +197,48 @@ class RawOrganizationFetcherFromCompanyNameBuilder:
                 "LLM must be set before building the RawOrganizationFetcherFromCompanyName."
             )
 
+        # Imported here as langchain.agents and the prompts, which pull in
+        # transformers, take seconds to load
+        from langchain.agents import AgentType, initialize_agent
+        from langchain_core.prompts import ChatPromptTemplate
+        from langchain_core.tools import Tool
+
         search_tool = Tool(
             name="search_company",
-            func=self.search_company,
+            func=self._instrument(
+                "search_company",
+                partial(self.search_company, search_backend=self._search_backend),
+            ),
             description="Searches for company relative URLs.",
         )
 
         page_retriever = Tool(
             name="retrieve_page",
-            func=self.retrieve_page,
+            func=self._instrument("retrieve_page", self.retrieve_page),
             description="Retrieves the company page.",
         )
 
         page_parser = Tool(
             name="parse_page",
-            func=self.parse_page,
+            func=self._instrument("parse_page", self.parse_page),
             description="Parses the company information from the page.",
         )
 
+        tools = [search_tool, page_retriever, page_parser]
+        if self._retrieve_pages:
+            tools.append(
+                Tool(
+                    name="retrieve_pages",
+                    func=self._instrument(
+                        "retrieve_pages",
+                        self._page_retriever
+                        or ConcurrentPageRetriever(metrics=self._metrics),
+                    ),
+                    description="Retrieves several pages at once and returns their "
+                    "text. Give it the list of URLs returned by search_company.",
+                )
+            )
+
         prompt = ChatPromptTemplate.from_messages(
             [
                 (
@@ -108,19 +259,32 @@ class RawOrganizationFetcherFromCompanyNameBuilder:
             initialize_agent(
                 llm=self._llm,
                 agent=AgentType.ZERO_SHOT_REACT_DESCRIPTION,
-                tools=[search_tool, page_retriever, page_parser],
+                tools=tools,
                 prompt=prompt,
                 handle_parsing_errors=True,
                 verbose=self._is_verbose,
             ),
             llm=self._llm,
+            metrics=self._metrics,
+            budget=self._budget,
+            crawler=(
+                (self._crawler or DomainCrawler(metrics=self._metrics))
+                if self._crawl_domains
+                else None
+            ),
         )
 
 
 class RawOrganizationFetcherFromCompanyName(RawOrganizationFetcher):
 
     def __init__(
-        self, agent: AgentExecutor, llm: BaseChatModel, max_iterations: int = 5
+        self,
+        agent: "AgentExecutor",
+        llm: "BaseChatModel",
+        max_iterations: int = 5,
+        metrics: Optional[Metrics] = None,
+        budget: Optional[TokenBudget] = None,
+        crawler: Optional[DomainCrawler] = None,
     ) -> None:
         _LOGGER.debug(
             "Creating RawOrganizationFetcherFromCompanyName with agent: %s and LLM: %s",
@@ -130,11 +294,30 @@ class RawOrganizationFetcherFromCompanyName(RawOrganizationFetcher):
         self._agent = agent
         self._llm = llm
         self._max_iterations = max_iterations
+        self._metrics = metrics or NoopMetrics()
+        self._budget = budget
+        self._crawler = crawler
+        self._callbacks: List[BaseCallbackHandler] = [
+            MetricsCallbackHandler(self._metrics)
+        ]
+        if budget is not None:
+            self._callbacks.append(BudgetCallbackHandler(budget))
+
+    def _invoke_agent(self, prompt: str, company: str) -> Dict[str, Any]:
+        if self._budget is not None:
+            self._budget.check(company)
+        self._metrics.increment("fetch.agent_invocations")
+        with self._metrics.timer("fetch.agent"):
+            return self._agent.invoke(
+                {"input": prompt}, config={"callbacks": self._callbacks}
+            )
 
     def _format_result(self, raw_value: Dict[str, Any]) -> Dict | RawOrganization:
-        return self._llm.with_structured_output(RawOrganization).invoke(
-            f"Extract and structure the following company data: {raw_value.get("output")}"
-        )
+        with self._metrics.timer("fetch.format"):
+            return self._llm.with_structured_output(RawOrganization).invoke(
+                f"Extract and structure the following company data: {raw_value.get("output")}",
+                config={"callbacks": self._callbacks},
+            )
 
     @classmethod
     def _is_complete(cls, raw_result: Dict) -> bool:
@@ -147,14 +330,39 @@ class RawOrganizationFetcherFromCompanyName(RawOrganizationFetcher):
         actual_keys = set(raw_result.get("properties", {}).keys())
         return expected_keys - actual_keys
 
-    def get_raw_organization_information(self, value: str) -> RawOrganization:
+    def get_raw_organization_information(
+        self, value: str, domain: Optional[str] = None
+    ) -> RawOrganization:
+        # LLM calls are charged to the company in context, so set it here
+        # rather than rely on every caller doing so
+        with self._metrics.company(value):
+            return self._fetch(value, domain)
+
+    def _fetch(self, value: str, domain: Optional[str]) -> RawOrganization:
+        if domain is not None and self._crawler is not None:
+            pages = self._crawler.crawl(domain)
+            # Structuring pages that do not state every field would only make
+            # the model invent the missing ones
+            coverage = FieldCoverage.of(page.text for page in pages)
+            if pages and coverage.complete:
+                self._metrics.increment("fetch.search_skipped")
+                return self._extract_from_pages(value, domain, pages)
+            if pages:
+                self._metrics.increment("fetch.thin_crawls")
+            _LOGGER.info(
+                "Crawling %s left %s missing, searching for %s",
+                domain,
+                sorted(coverage.missing),
+                value,
+            )
+
         initial_prompt = f"""
             Compile company information for {value} by crawling the web using the following search query: "{value} company information".
             Compile and compare the information across the pages the most complete information possible.
             Output the retrieve values in JSON using this schema this object: {RawOrganization.model_json_schema()}
         """
 
-        raw_result = self._agent.invoke({"input": initial_prompt})
+        raw_result = self._invoke_agent(initial_prompt, value)
 
         if self._is_complete(raw_result):
             return self._format_result(raw_result)
@@ -163,6 +371,22 @@ class RawOrganizationFetcherFromCompanyName(RawOrganizationFetcher):
 
         return structured_result
 
+    def _extract_from_pages(
+        self, value: str, domain: str, pages: List[CrawledPage]
+    ) -> RawOrganization:
+        """Structure the crawled pages in a single LLM call, without the agent."""
+        if self._budget is not None:
+            self._budget.check(value)
+        content = "\n\n".join(f"{page.url}\n{page.text}" for page in pages)
+        raw_organization = self._format_result(
+            {"output": f"{value} (website {domain})\n\n{content}"}
+        )
+        if isinstance(raw_organization, dict):
+            raw_organization = RawOrganization.model_validate(raw_organization)
+        if domain not in raw_organization.main_company_domains:
+            raw_organization.main_company_domains.append(domain)
+        return raw_organization
+
     def _refine_result(self, raw_result: Dict, value: str) -> RawOrganization:
         self._cache: Dict[str, Dict[str, Any]]
         for _ in range(self._max_iterations):
@@ -178,6 +402,7 @@ class RawOrganizationFetcherFromCompanyName(RawOrganizationFetcher):
                 Output the result as a complete {RawOrganization.model_json_schema()}.
             """
 
-            raw_result = self._agent.invoke({"input": refinement_prompt})
+            self._metrics.increment("fetch.refine_iterations")
+            raw_result = self._invoke_agent(refinement_prompt, value)
 
         return self._format_result(raw_result)
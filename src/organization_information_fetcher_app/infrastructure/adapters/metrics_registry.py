@@ -0,0 +1,191 @@
+import bisect
+import json
+import logging
+import os
+import re
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence
+
+from core.ports.metrics import Metrics
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+)
+
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = list(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float("inf")
+        self.maximum = float("-inf")
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile, capped by the maximum."""
+        rank = q * self.count
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                return min(bound, self.maximum)
+        return self.maximum
+
+    def summary(self) -> Dict[str, float]:
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.total / self.count,
+            "min": self.minimum,
+            "max": self.maximum,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+        }
+
+
+class InMemoryMetrics(Metrics):
+    """Thread-safe histograms and counters, exportable as JSON or Prometheus text."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self._buckets = buckets
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Histogram] = {}
+        self._counters: Dict[str, float] = defaultdict(float)
+        self._company_counters: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+
+    def observe(self, name: str, value: float) -> None:
+        with self._lock:
+            if name not in self._histograms:
+                self._histograms[name] = Histogram(self._buckets)
+            self._histograms[name].observe(value)
+
+    def increment(self, name: str, value: float = 1) -> None:
+        company = self.current_company()
+        with self._lock:
+            self._counters[name] += value
+            if company is not None:
+                self._company_counters[company][name] += value
+
+    def counter(self, name: str, company: Optional[str] = None) -> float:
+        with self._lock:
+            if company is None:
+                return self._counters.get(name, 0)
+            return self._company_counters.get(company, {}).get(name, 0)
+
+    def histogram(self, name: str) -> Optional[Histogram]:
+        return self._histograms.get(name)
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "latencies": {
+                    name: histogram.summary()
+                    for name, histogram in sorted(self._histograms.items())
+                },
+                "counters": dict(sorted(self._counters.items())),
+                "companies": {
+                    company: dict(sorted(counters.items()))
+                    for company, counters in sorted(self._company_counters.items())
+                },
+            }
+
+    def to_prometheus(self, prefix: str = "organization_fetcher") -> str:
+        lines: List[str] = []
+        with self._lock:
+            for name, histogram in sorted(self._histograms.items()):
+                metric = self._metric_name(prefix, name, "seconds")
+                lines.append(f"# TYPE {metric} histogram")
+                cumulative = 0
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(f'{metric}_bucket{{le="{bound}"}} {cumulative}')
+                lines.append(f'{metric}_bucket{{le="+Inf"}} {histogram.count}')
+                lines.append(f"{metric}_sum {histogram.total}")
+                lines.append(f"{metric}_count {histogram.count}")
+            for name, value in sorted(self._counters.items()):
+                metric = self._metric_name(prefix, name, "total")
+                lines.append(f"# TYPE {metric} counter")
+                lines.append(f"{metric} {value}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _metric_name(prefix: str, name: str, suffix: str) -> str:
+        return f"{prefix}_{re.sub(r'[^a-zA-Z0-9_]', '_', name)}_{suffix}"
+
+    def write_json(self, path: str) -> None:
+        self._write_atomically(path, json.dumps(self.summary(), indent=2))
+
+    def write_prometheus(self, path: str) -> None:
+        self._write_atomically(path, self.to_prometheus())
+
+    @staticmethod
+    def _write_atomically(path: str, content: str) -> None:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, mode="w", encoding="utf-8") as file:
+            file.write(content)
+        os.replace(tmp_path, path)
+
+
+class PrometheusFileExporter:
+    """Rewrite a Prometheus text file every interval seconds until closed."""
+
+    def __init__(
+        self, metrics: InMemoryMetrics, file_path: str, interval: float = 15.0
+    ) -> None:
+        self._metrics = metrics
+        self._file_path = file_path
+        self._interval = interval
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="prometheus-exporter", daemon=True
+        )
+
+    def __enter__(self) -> "PrometheusFileExporter":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._stopped.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self._metrics.write_prometheus(self._file_path)
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            try:
+                self._metrics.write_prometheus(self._file_path)
+            except OSError:
+                _LOGGER.exception("Could not export metrics to %s", self._file_path)
@@ -0,0 +1,248 @@
+import contextvars
+import logging
+import math
+import re
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Set, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from core.domains.coverage import FieldCoverage
+from core.ports.metrics import Metrics, NoopMetrics
+from infrastructure.adapters.domain_crawler import CrawledPage
+from infrastructure.adapters.page_sources import USER_AGENT, html_to_text, record_page
+
+_LOGGER = logging.getLogger(__name__)
+
+_URL = re.compile(r"https?://[^\s'\",\]]+")
+
+
+# A request queued behind its host limit: url, start times of the retrieval,
+# context of the caller and the future handed back to it
+_PendingRequest = Tuple[str, Dict[str, float], contextvars.Context, "Future[str]"]
+
+
+class LatencyTracker:
+    """Sliding window of page latencies, used to decide when to hedge a request.
+
+    Until min_samples latencies are known the hedge delay is initial_delay.
+    """
+
+    def __init__(
+        self,
+        quantile: float = 0.9,
+        window: int = 200,
+        min_samples: int = 10,
+        initial_delay: float = 2.0,
+        min_delay: float = 0.2,
+    ) -> None:
+        self._quantile = quantile
+        self._min_samples = min_samples
+        self._initial_delay = initial_delay
+        self._min_delay = min_delay
+        self._lock = threading.Lock()
+        self._latencies: Deque[float] = deque(maxlen=window)
+
+    def record(self, latency: float) -> None:
+        with self._lock:
+            self._latencies.append(latency)
+
+    def hedge_delay(self) -> float:
+        with self._lock:
+            if len(self._latencies) < self._min_samples:
+                return self._initial_delay
+            latencies = sorted(self._latencies)
+        # Nearest rank: the smallest latency with at least quantile of them below
+        rank = math.ceil(self._quantile * len(latencies)) - 1
+        index = min(len(latencies) - 1, max(0, rank))
+        return max(self._min_delay, latencies[index])
+
+
+class ConcurrentPageRetriever:
+    """Fetch several pages at once, hedging stragglers and stopping early.
+
+    At most per_host requests run against the same host, the others wait in a
+    queue of that host without holding a worker. A request still running past
+    the hedge delay gets a duplicate, the first answer wins.
+    Retrieval stops as soon as the pages read cover every RawOrganization
+    field, leaving slower pages behind.
+    """
+
+    def __init__(
+        self,
+        fetch: Optional[Callable[[str], str]] = None,
+        max_workers: int = 8,
+        per_host: int = 2,
+        latencies: Optional[LatencyTracker] = None,
+        max_pages: int = 10,
+        max_chars_per_page: int = 5000,
+        timeout: float = 10.0,
+        metrics: Optional[Metrics] = None,
+    ) -> None:
+        self._fetch = fetch or self._get
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="pages")
+        self._per_host = per_host
+        self._hosts_lock = threading.Lock()
+        self._host_running: Dict[str, int] = defaultdict(int)
+        self._host_pending: Dict[str, Deque[_PendingRequest]] = defaultdict(deque)
+        self._latencies = latencies or LatencyTracker()
+        self._max_pages = max_pages
+        self._max_chars_per_page = max_chars_per_page
+        self._timeout = timeout
+        self._metrics = metrics or NoopMetrics()
+
+    def __call__(self, urls: str) -> str:
+        """Agent tool: retrieve the URLs found in the input, return their text."""
+        pages = self.retrieve(_URL.findall(urls))
+        if not pages:
+            return "No page could be retrieved."
+        return "\n\n".join(f"{page.url}\n{page.text}" for page in pages)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def retrieve(self, urls: Sequence[str]) -> List[CrawledPage]:
+        urls = list(dict.fromkeys(urls))[: self._max_pages]
+        coverage = FieldCoverage()
+        pages: Dict[str, CrawledPage] = {}
+        finished: Set[str] = set()
+        hedged: Set[str] = set()
+        running: Dict[str, float] = {}
+        futures: Dict[Future[str], str] = {
+            self._submit(url, running): url for url in urls
+        }
+
+        try:
+            while futures:
+                hedge_delay = self._latencies.hedge_delay()
+                done, _ = wait(
+                    futures,
+                    timeout=self._next_hedge_in(
+                        set(futures.values()) - hedged, running, hedge_delay
+                    ),
+                    return_when=FIRST_COMPLETED,
+                )
+
+                for future in done:
+                    url = futures.pop(future)
+                    if url in finished:
+                        continue
+                    try:
+                        html = future.result()
+                    except Exception as e:
+                        # A hedged duplicate may still succeed
+                        if url not in futures.values():
+                            _LOGGER.debug("Skipping %s: %r", url, e)
+                            finished.add(url)
+                        continue
+
+                    finished.add(url)
+                    text = html_to_text(html)[: self._max_chars_per_page]
+                    pages[url] = CrawledPage(url, text)
+                    if coverage.update(text):
+                        self._metrics.increment("pages.early_stops")
+                        return self._in_order(urls, pages)
+
+                for future, url in list(futures.items()):
+                    if url in finished:
+                        future.cancel()
+                        del futures[future]
+
+                now = time.monotonic()
+                for url in set(futures.values()) - hedged:
+                    if url in running and now - running[url] >= hedge_delay:
+                        hedged.add(url)
+                        self._metrics.increment("pages.hedged")
+                        futures[self._submit(url, running)] = url
+        finally:
+            for future in futures:
+                future.cancel()
+
+        return self._in_order(urls, pages)
+
+    @staticmethod
+    def _in_order(
+        urls: Sequence[str], pages: Dict[str, CrawledPage]
+    ) -> List[CrawledPage]:
+        return [pages[url] for url in urls if url in pages]
+
+    @staticmethod
+    def _next_hedge_in(
+        unhedged: Set[str], running: Dict[str, float], hedge_delay: float
+    ) -> Optional[float]:
+        """Seconds until the next unhedged request is due a hedge, counting
+        requests still queued behind their host limit as starting now."""
+        now = time.monotonic()
+        due = [running.get(url, now) + hedge_delay for url in unhedged]
+        return max(0.0, min(due) - now) if due else None
+
+    def _submit(self, url: str, running: Dict[str, float]) -> Future[str]:
+        """Start the request, or queue it until its host has a free slot."""
+        # Copy the context so counters stay attributed to the current company
+        request = (url, running, contextvars.copy_context(), Future())
+        host = urlsplit(url).netloc
+        with self._hosts_lock:
+            start = self._host_running[host] < self._per_host
+            if start:
+                self._host_running[host] += 1
+            else:
+                self._host_pending[host].append(request)
+        if start:
+            self._start(host, request)
+        return request[3]
+
+    def _start(self, host: str, request: _PendingRequest) -> None:
+        url, running, context, result = request
+        if not result.set_running_or_notify_cancel():
+            self._release(host)
+            return
+
+        def settle(future: Future[str]) -> None:
+            try:
+                result.set_result(future.result())
+            except BaseException as e:
+                result.set_exception(e)
+            self._release(host)
+
+        try:
+            future = self._executor.submit(context.run, self._fetch_one, url, running)
+        except RuntimeError as e:
+            # The retriever was closed
+            result.set_exception(e)
+            self._release(host)
+            return
+        future.add_done_callback(settle)
+
+    def _release(self, host: str) -> None:
+        """Hand the host slot of a finished request to the next queued one."""
+        while True:
+            with self._hosts_lock:
+                pending = self._host_pending[host]
+                if not pending:
+                    self._host_running[host] -= 1
+                    return
+                request = pending.popleft()
+            if not request[3].cancelled():
+                self._start(host, request)
+                return
+
+    def _fetch_one(self, url: str, running: Dict[str, float]) -> str:
+        started = time.monotonic()
+        running.setdefault(url, started)
+        self._metrics.increment("pages.requests")
+        with self._metrics.timer("pages.request"):
+            html = self._fetch(url)
+        self._latencies.record(time.monotonic() - started)
+        return html
+
+    def _get(self, url: str) -> str:
+        response = requests.get(
+            url, timeout=self._timeout, headers={"User-Agent": USER_AGENT}
+        )
+        response.raise_for_status()
+        self._metrics.increment("fetch.bytes_downloaded", len(response.content))
+        record_page(url, response)
+        return response.text
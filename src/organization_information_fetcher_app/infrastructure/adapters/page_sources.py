@@ -0,0 +1,124 @@
+import hashlib
+import logging
+import re
+import threading
+from typing import TYPE_CHECKING, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from bs4 import BeautifulSoup
+from core.entities.sources import PageSource
+from core.ports.fetch_state import SourceChangeDetector
+from core.ports.fetching import RawOrganizationFetcher
+from core.ports.metrics import Metrics, NoopMetrics
+
+if TYPE_CHECKING:
+    from infrastructure.adapters.domain_crawler import PolitenessScheduler, RobotsCache
+
+_LOGGER = logging.getLogger(__name__)
+
+USER_AGENT = "OrganizationInformationFetcher/1.0"
+
+
+def html_to_text(html: str) -> str:
+    """Visible text of a page, with whitespace collapsed."""
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(["script", "style", "noscript"]):
+        tag.decompose()
+    return re.sub(r"\s+", " ", soup.get_text(" ")).strip()
+
+
+def content_hash(html: str) -> str:
+    """Hash of the visible text, so markup-only changes do not count."""
+    return hashlib.sha256(html_to_text(html).encode()).hexdigest()
+
+
+def record_page(url: str, response: requests.Response) -> None:
+    """Report a downloaded page as a source of the organization being fetched."""
+    if not RawOrganizationFetcher.is_recording_sources():
+        return
+    RawOrganizationFetcher.record_source(
+        PageSource(
+            url=url,
+            content_hash=content_hash(response.text),
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+    )
+
+
+class ThreadLocalSessions:
+    """Hand each thread a requests session of its own, as sessions are not
+    safe to share between the threads fetching companies."""
+
+    def __init__(
+        self,
+        factory: Callable[[], requests.Session] = requests.Session,
+        user_agent: str = USER_AGENT,
+    ) -> None:
+        self._factory = factory
+        self._user_agent = user_agent
+        self._local = threading.local()
+
+    def __call__(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self._factory()
+            session.headers.setdefault("User-Agent", self._user_agent)
+        return session
+
+
+class HttpSourceChangeDetector(SourceChangeDetector):
+    """Check pages with conditional requests, comparing content hashes when the
+    server does not answer 304 Not Modified. Unreachable pages count as changed.
+
+    Probes go through the robots.txt rules and politeness delays of the
+    crawler, so a refresh does not hit a host harder than a fetch would. Each
+    thread probes with its own session.
+    """
+
+    def __init__(
+        self,
+        robots: "RobotsCache",
+        scheduler: "PolitenessScheduler",
+        session_factory: Callable[[], requests.Session] = requests.Session,
+        timeout: float = 10.0,
+        metrics: Optional[Metrics] = None,
+    ) -> None:
+        self._robots = robots
+        self._scheduler = scheduler
+        self._sessions = ThreadLocalSessions(session_factory)
+        self._timeout = timeout
+        self._metrics = metrics or NoopMetrics()
+
+    def has_changed(self, source: PageSource) -> bool:
+        # A page the crawler may no longer read cannot be checked either
+        if not self._robots.can_fetch(source.url):
+            self._metrics.increment("refresh.disallowed")
+            return True
+
+        headers: Dict[str, str] = {}
+        if source.etag:
+            headers["If-None-Match"] = source.etag
+        if source.last_modified:
+            headers["If-Modified-Since"] = source.last_modified
+
+        parts = urlsplit(source.url)
+        self._scheduler.wait(
+            parts.netloc, self._robots.crawl_delay(f"{parts.scheme}://{parts.netloc}")
+        )
+        self._metrics.increment("refresh.source_checks")
+        try:
+            response = self._sessions().get(
+                source.url, headers=headers, timeout=self._timeout
+            )
+        except requests.RequestException as e:
+            _LOGGER.debug("Could not check %s: %r", source.url, e)
+            return True
+
+        if response.status_code == 304:
+            self._metrics.increment("refresh.not_modified")
+            return False
+        if response.status_code >= 400:
+            return True
+        return content_hash(response.text) != source.content_hash
@@ -0,0 +1,133 @@
+import csv
+import json
+import logging
+import os
+from abc import abstractmethod
+from typing import Any, Dict, Iterator, Optional
+
+import pyarrow.parquet as pq
+from core.entities.organizations import Company
+from core.ports.company_source import CompanySource
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _RecordCompanySource(CompanySource):
+    """Map records with named fields to companies. Fields other than the name,
+    domain and priority are kept in the company attributes."""
+
+    def __init__(
+        self,
+        file_path: str,
+        name_column: str = "name",
+        domain_column: Optional[str] = "domain",
+        priority_column: Optional[str] = "priority",
+    ) -> None:
+        self._file_path = file_path
+        self._name_column = name_column
+        self._domain_column = domain_column
+        self._priority_column = priority_column
+
+    @abstractmethod
+    def _records(self) -> Iterator[Dict[str, Any]]:
+        pass
+
+    def __iter__(self) -> Iterator[Company]:
+        for line, record in enumerate(self._records(), start=1):
+            name = record.pop(self._name_column, None)
+            if not name or not str(name).strip():
+                _LOGGER.warning("Skipping record %d of %s without name", line, self)
+                continue
+            domain = (
+                record.pop(self._domain_column, None) if self._domain_column else None
+            )
+            priority = (
+                record.pop(self._priority_column, None)
+                if self._priority_column
+                else None
+            )
+            yield Company(
+                name=str(name).strip(),
+                domain=(str(domain).strip() or None) if domain else None,
+                priority=self._priority(priority, line),
+                attributes=record,
+            )
+
+    def _priority(self, priority: Any, line: int) -> Optional[float]:
+        if priority in (None, ""):
+            return None
+        try:
+            return float(priority)
+        except (TypeError, ValueError):
+            _LOGGER.warning(
+                "Ignoring priority %r of record %d of %s", priority, line, self
+            )
+            return None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._file_path!r})"
+
+
+class CsvCompanySource(_RecordCompanySource):
+    """Read companies from a CSV file with a header, or from a headerless file
+    holding the name and an optional domain, like resources/company_names.csv.
+    """
+
+    def __init__(self, file_path: str, has_header: bool = True, **columns: Any):
+        super().__init__(file_path, **columns)
+        self._has_header = has_header
+
+    def _records(self) -> Iterator[Dict[str, Any]]:
+        with open(self._file_path, newline="", encoding="utf-8") as file:
+            if self._has_header:
+                yield from csv.DictReader(file)
+                return
+            for row in csv.reader(file):
+                if row:
+                    yield {
+                        self._name_column: row[0],
+                        self._domain_column
+                        or "domain": row[1] if len(row) > 1 else None,
+                    }
+
+
+class JsonlCompanySource(_RecordCompanySource):
+
+    def _records(self) -> Iterator[Dict[str, Any]]:
+        with open(self._file_path, encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+
+class ParquetCompanySource(_RecordCompanySource):
+    """Read companies one record batch at a time."""
+
+    def __init__(self, file_path: str, batch_size: int = 10_000, **columns: Any):
+        super().__init__(file_path, **columns)
+        self._batch_size = batch_size
+
+    def _records(self) -> Iterator[Dict[str, Any]]:
+        parquet_file = pq.ParquetFile(self._file_path)
+        try:
+            for batch in parquet_file.iter_batches(batch_size=self._batch_size):
+                yield from batch.to_pylist()
+        finally:
+            parquet_file.close()
+
+
+_SOURCES = {
+    ".csv": CsvCompanySource,
+    ".jsonl": JsonlCompanySource,
+    ".parquet": ParquetCompanySource,
+}
+
+
+def open_company_source(file_path: str, **options: Any) -> CompanySource:
+    """Pick the company source matching the file extension."""
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension not in _SOURCES:
+        raise ValueError(
+            f"Unsupported company list {file_path}, expected one of {list(_SOURCES)}."
+        )
+    return _SOURCES[extension](file_path, **options)
@@ -0,0 +1,80 @@
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+from core.entities.sources import FetchRecord, PageSource
+from core.ports.fetch_state import FetchStateStore
+
+_LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fetch_state (
+    company_name TEXT PRIMARY KEY,
+    fetched_at TEXT NOT NULL,
+    sources TEXT NOT NULL
+);
+"""
+
+
+class SqliteFetchStateStore(FetchStateStore):
+    """Keep fetch records in SQLite. Records are only written on flush, so the
+    caller decides when they are safe to persist."""
+
+    def __init__(self, file_path: str) -> None:
+        self._buffer: Dict[str, FetchRecord] = {}
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(file_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+    def get(self, company_name: str) -> Optional[FetchRecord]:
+        with self._lock:
+            if company_name in self._buffer:
+                return self._buffer[company_name]
+            row = self._connection.execute(
+                "SELECT fetched_at, sources FROM fetch_state WHERE company_name = ?",
+                (company_name,),
+            ).fetchone()
+        if row is None:
+            return None
+        return FetchRecord(
+            company_name=company_name,
+            fetched_at=datetime.fromisoformat(row[0]),
+            sources=[PageSource(**source) for source in json.loads(row[1])],
+        )
+
+    def put(self, record: FetchRecord) -> None:
+        with self._lock:
+            self._buffer[record.company_name] = record
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def close(self) -> None:
+        self.flush()
+        self._connection.close()
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+
+        _LOGGER.debug("Saving %d fetch records", len(self._buffer))
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO fetch_state (company_name, fetched_at, sources)"
+                " VALUES (?, ?, ?)",
+                [
+                    (
+                        record.company_name,
+                        record.fetched_at.isoformat(),
+                        json.dumps([source.model_dump() for source in record.sources]),
+                    )
+                    for record in self._buffer.values()
+                ],
+            )
+        self._buffer.clear()
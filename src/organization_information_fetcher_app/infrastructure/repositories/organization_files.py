@@ -0,0 +1,113 @@
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, Iterable, Iterator
+
+from core.entities.organizations import Organization
+from core.ports.sinker import Sinker
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _file_extension(file_path: str) -> str:
+    return os.path.splitext(file_path)[1].lower()
+
+
+# The sinkers are imported when picked, so pyarrow is only loaded for Parquet
+def _csv_sinker(file_path: str, **options: Any) -> Sinker:
+    from infrastructure.repositories.sinker_csv import SinkerCsv
+
+    return SinkerCsv(file_path, **options)
+
+
+def _jsonl_sinker(file_path: str, **options: Any) -> Sinker:
+    from infrastructure.repositories.sinker_jsonl import SinkerJsonl
+
+    return SinkerJsonl(file_path, **options)
+
+
+def _parquet_sinker(file_path: str, **options: Any) -> Sinker:
+    from infrastructure.repositories.sinker_parquet import SinkerParquet
+
+    return SinkerParquet(file_path, **options)
+
+
+def _sqlite_sinker(file_path: str, **options: Any) -> Sinker:
+    from infrastructure.repositories.sinker_sqlite import SinkerSqlite
+
+    return SinkerSqlite(file_path, **options)
+
+
+_SINKERS: Dict[str, Callable[..., Sinker]] = {
+    ".csv": _csv_sinker,
+    ".jsonl": _jsonl_sinker,
+    ".parquet": _parquet_sinker,
+    ".sqlite": _sqlite_sinker,
+}
+
+
+def open_sinker(file_path: str, **options: Any) -> Sinker:
+    """Pick the sinker matching the file extension."""
+    extension = _file_extension(file_path)
+    if extension not in _SINKERS:
+        raise ValueError(
+            f"Unsupported output {file_path}, expected one of {list(_SINKERS)}."
+        )
+    return _SINKERS[extension](file_path, **options)
+
+
+def _read_jsonl(file_path: str) -> Iterator[Dict[str, Any]]:
+    with open(file_path, encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _read_parquet(file_path: str) -> Iterator[Dict[str, Any]]:
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(file_path)
+    try:
+        for batch in parquet_file.iter_batches():
+            yield from batch.to_pylist()
+    finally:
+        parquet_file.close()
+
+
+_READERS: Dict[str, Callable[[str], Iterable[Dict[str, Any]]]] = {
+    ".jsonl": _read_jsonl,
+    ".parquet": _read_parquet,
+}
+
+
+def read_organizations(file_path: str) -> Iterator[Organization]:
+    """Read back organizations written by SinkerJsonl or SinkerParquet.
+
+    CSV exports flatten nested fields to their repr and cannot be read back.
+    """
+    extension = _file_extension(file_path)
+    if extension not in _READERS:
+        raise ValueError(
+            f"Cannot read organizations from {file_path}, expected one of "
+            f"{list(_READERS)}."
+        )
+    for record in _READERS[extension](file_path):
+        yield Organization.model_validate(record)
+
+
+def merge_organizations(
+    file_paths: Iterable[str], sinker: Sinker, key: str = "company_name"
+) -> int:
+    """Sink the organizations of several outputs, a later file replacing the
+    records of earlier ones for the same key. Returns the organizations sunk.
+    """
+    merged: Dict[str, Organization] = {}
+    for file_path in file_paths:
+        count = 0
+        for organization in read_organizations(file_path):
+            merged[str(getattr(organization, key))] = organization
+            count += 1
+        _LOGGER.info("Read %d organizations from %s", count, file_path)
+
+    sinker.sink_organizations(merged.values())
+    return len(merged)
@@ -1,94 +1,227 @@
+import csv
 import logging
 import os
-from typing import Callable
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import numpy as np
-import pandas as pd
-from core.ports.referential import Referential
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
+from core.ports.metrics import Metrics, NoopMetrics
+from core.ports.referential import Referential, ReferentialMatch
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class LazySentenceTransformer:
+    """Load a SentenceTransformer on first encode.
+
+    Importing sentence_transformers pulls in torch and takes seconds, which
+    runs hitting the embedding cache and never encoding should not pay.
+    """
+
+    def __init__(self, model_name: str) -> None:
+        self._model_name = model_name
+        self._model: Optional["SentenceTransformer"] = None
+        self._lock = threading.Lock()
+
+    def encode(self, *args: Any, **kwargs: Any) -> Any:
+        return self.load().encode(*args, **kwargs)
+
+    def load(self) -> "SentenceTransformer":
+        with self._lock:
+            if self._model is None:
+                from sentence_transformers import SentenceTransformer
+
+                _LOGGER.info("Loading sentence transformer %s", self._model_name)
+                self._model = SentenceTransformer(self._model_name)
+            return self._model
+
+
+class ReferentialData(NamedTuple):
+    keys: np.ndarray
+    values: np.ndarray
+    embeddings: np.ndarray
+
+
 class CsvReferential(Referential):
+    """Match values to the closest referential entry by embedding similarity.
+
+    Only the normalized embeddings are kept, and a custom similarity_fn is
+    given those. The referential holds read-only copies of the keys and values,
+    the caller's arrays are left untouched.
+    """
 
     def __init__(
         self,
-        data: pd.DataFrame,
-        embedding_model: SentenceTransformer,
-        similarity_fn: Callable = cosine_similarity,
+        data: ReferentialData,
+        embedding_model: "SentenceTransformer | LazySentenceTransformer",
+        similarity_fn: Optional[Callable] = None,
+        metrics: Optional[Metrics] = None,
     ) -> None:
         _LOGGER.debug("Creating CsvReferential ...")
-        self._data = data
+        self._keys = self._read_only(np.array(data.keys))
+        self._values = self._read_only(np.array(data.values))
+        # Normalizing allocates a new matrix, so the input is never modified
+        self._embeddings = self._read_only(
+            self._normalize(np.asarray(data.embeddings, dtype=np.float32))
+        )
         self._embedding_model = embedding_model
         self._similarity_fn = similarity_fn
+        self._metrics = metrics or NoopMetrics()
 
-    def get_closest_match(self, value: str) -> dict:
-        query_embedding = self._embedding_model.encode(value, convert_to_numpy=True)
+    def __len__(self) -> int:
+        return len(self._keys)
 
-        similarities = self._similarity_fn(
-            [query_embedding], np.stack(self._data["embedding"].values)
+    @staticmethod
+    def _read_only(array: np.ndarray) -> np.ndarray:
+        array.flags.writeable = False
+        return array
+
+    @staticmethod
+    def _normalize(embeddings: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(embeddings, axis=-1, keepdims=True)
+        return (embeddings / np.maximum(norms, np.finfo(np.float32).eps)).astype(
+            np.float32, copy=False
         )
 
-        return self._data.iloc[np.argmax(similarities)].to_dict()
+    def _similarities(self, query_embeddings: np.ndarray) -> np.ndarray:
+        if self._similarity_fn is not None:
+            return np.atleast_2d(
+                self._similarity_fn(query_embeddings, self._embeddings)
+            )
+        # Rows are pre-normalized, so the dot product ranks like cosine similarity
+        return query_embeddings @ self._embeddings.T
+
+    def _to_match(self, idx: int) -> ReferentialMatch:
+        return ReferentialMatch(key=str(self._keys[idx]), value=str(self._values[idx]))
+
+    def get_closest_match(self, value: str) -> Optional[ReferentialMatch]:
+        if not len(self):
+            return None
+
+        with self._metrics.timer("referential.encode"):
+            query_embedding = self._embedding_model.encode(value, convert_to_numpy=True)
+        with self._metrics.timer("referential.search"):
+            idx = int(np.argmax(self._similarities(np.atleast_2d(query_embedding))))
+        self._metrics.increment("referential.lookups")
+
+        return self._to_match(idx)
+
+    def get_closest_matches(
+        self, values: Sequence[str]
+    ) -> List[Optional[ReferentialMatch]]:
+        if not len(self) or not values:
+            return [None] * len(values)
+
+        with self._metrics.timer("referential.encode"):
+            query_embeddings = self._embedding_model.encode(
+                list(values), convert_to_numpy=True
+            )
+        with self._metrics.timer("referential.search"):
+            indices = np.argmax(
+                self._similarities(np.atleast_2d(query_embeddings)), axis=1
+            )
+        self._metrics.increment("referential.lookups", len(values))
+
+        return [self._to_match(int(idx)) for idx in indices]
 
 
 class CsvReferentialBuilder:
 
     @classmethod
-    def _load_cached_data(cls, cache_path: str) -> pd.DataFrame:
-        """Load data from cache if it exists."""
+    def _load_cached_data(cls, cache_path: str) -> Optional[ReferentialData]:
+        """Load data from cache if it exists and uses the current layout."""
         _LOGGER.info("Loading cached embeddings...")
-        data = np.load(cache_path, allow_pickle=True)
-        dataframe = pd.DataFrame(data["data"]).astype(str)
-        dataframe["embedding"] = list(data["embeddings"])
-        return dataframe
+        with np.load(cache_path, allow_pickle=False) as cached:
+            if not set(ReferentialData._fields) <= set(cached.files):
+                _LOGGER.info("Outdated cache layout in %s, rebuilding.", cache_path)
+                return None
+            return ReferentialData(
+                keys=cached["keys"],
+                values=cached["values"],
+                embeddings=cached["embeddings"],
+            )
+
+    @classmethod
+    def _read_csv(cls, csv_path: str) -> Tuple[List[str], List[str]]:
+        with open(csv_path, newline="", encoding="utf-8") as file:
+            reader = csv.reader(file)
+            next(reader, None)  # header
+            rows = [(row[0], row[1]) for row in reader if len(row) >= 2]
+        return [key for key, _ in rows], [value for _, value in rows]
 
     @classmethod
     def _generate_embeddings(
-        cls, dataframe: pd.DataFrame, sentence_transformer: SentenceTransformer
-    ) -> pd.DataFrame:
+        cls,
+        values: List[str],
+        sentence_transformer: "SentenceTransformer | LazySentenceTransformer",
+    ) -> np.ndarray:
         _LOGGER.info("Generating embeddings from CSV...")
-
-        dataframe["embedding"] = dataframe["value"].apply(
-            lambda x: sentence_transformer.encode(x, convert_to_numpy=True)
+        return np.asarray(
+            sentence_transformer.encode(values, convert_to_numpy=True),
+            dtype=np.float32,
         )
-        return dataframe
 
     @classmethod
-    def _save_cache(cls, dataframe: pd.DataFrame, cache_path: str) -> None:
+    def _save_cache(cls, data: ReferentialData, cache_path: str) -> None:
         """Save processed data and embeddings to cache."""
         np.savez(
             cache_path,
-            data=dataframe.drop(columns=["embedding"]).to_numpy(),
-            embeddings=np.stack(dataframe["embedding"].values),
+            keys=data.keys,
+            values=data.values,
+            embeddings=data.embeddings,
         )
 
     @classmethod
     def _load_data(
-        cls, csv_path: str, cache_path: str, sentence_transformer: SentenceTransformer
-    ) -> pd.DataFrame:
+        cls,
+        csv_path: str,
+        cache_path: str,
+        sentence_transformer: "SentenceTransformer | LazySentenceTransformer",
+        metrics: Optional[Metrics] = None,
+    ) -> ReferentialData:
+        metrics = metrics or NoopMetrics()
         if os.path.exists(cache_path):
-            return cls._load_cached_data(cache_path)
-        df = pd.read_csv(csv_path, names=["key", "value"], header=0)
-        df["value"] = df["value"].astype(str)
-        df["key"] = df["key"].astype(str)
-        df = cls._generate_embeddings(df, sentence_transformer)
-        cls._save_cache(df, cache_path)
-        return df
+            cached = cls._load_cached_data(cache_path)
+            if cached is not None:
+                metrics.increment("referential.cache_hits")
+                return cached
+        metrics.increment("referential.cache_misses")
+        keys, values = cls._read_csv(csv_path)
+        data = ReferentialData(
+            keys=np.array(keys, dtype=str),
+            values=np.array(values, dtype=str),
+            embeddings=cls._generate_embeddings(values, sentence_transformer),
+        )
+        cls._save_cache(data, cache_path)
+        return data
 
     @classmethod
     def build(
-        cls, file_path: str, sentence_transformer_model: str = "all-MiniLM-L6-v2"
+        cls,
+        file_path: str,
+        sentence_transformer_model: str = "all-MiniLM-L6-v2",
+        metrics: Optional[Metrics] = None,
     ) -> CsvReferential:
-        cache_path = cls._get_cache_path(file_path)
-        sentence_transformer = SentenceTransformer(sentence_transformer_model)
+        cache_path = cls.cache_path(file_path)
+        sentence_transformer = LazySentenceTransformer(sentence_transformer_model)
         return CsvReferential(
-            cls._load_data(file_path, cache_path, sentence_transformer),
+            cls._load_data(file_path, cache_path, sentence_transformer, metrics),
             sentence_transformer,
+            metrics=metrics,
         )
 
     @classmethod
-    def _get_cache_path(cls, file_path: str) -> str:
+    def cache_path(cls, file_path: str) -> str:
         return f"{file_path}.npz"
@@ -0,0 +1,124 @@
+import logging
+import queue
+import threading
+from enum import Enum
+from typing import List, NamedTuple, Optional
+
+from core.ports.sinker import Sinker
+from pydantic import BaseModel
+
+_LOGGER = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class _FlushRequest(NamedTuple):
+    fsync: bool
+
+
+class FsyncPolicy(str, Enum):
+    NEVER = "never"
+    BATCH = "batch"
+    CLOSE = "close"
+
+
+class BackgroundSinker(Sinker):
+    """Hand records to a writer thread that sinks them into the wrapped sinker.
+
+    The queue is bounded so a slow sink applies backpressure instead of growing
+    memory. Errors raised by the writer are re-raised on the next call from the
+    pipeline.
+    """
+
+    def __init__(
+        self,
+        sinker: Sinker,
+        max_queue_size: int = 1000,
+        max_batch_size: int = 100,
+        fsync_policy: FsyncPolicy = FsyncPolicy.NEVER,
+    ) -> None:
+        self._sinker = sinker
+        self._max_batch_size = max_batch_size
+        self._fsync_policy = fsync_policy
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="background-sinker", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def durable_flush(self) -> bool:
+        return self._sinker.durable_flush
+
+    def sink_organization(self, data: BaseModel) -> None:
+        self._raise_if_failed()
+        if self._closed:
+            raise ValueError("Cannot sink into a closed BackgroundSinker.")
+        self._queue.put(data)
+
+    def flush(self, fsync: bool = False) -> None:
+        """Wait for every queued record to be written, then flush the sinker."""
+        self._raise_if_failed()
+        if self._closed:
+            # The writer thread is gone, nothing would ever drain the queue
+            raise ValueError("Cannot flush a closed BackgroundSinker.")
+        self._queue.put(_FlushRequest(fsync))
+        self._queue.join()
+        self._raise_if_failed()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+        try:
+            if self._error is None:
+                self._sinker.flush(fsync=self._fsync_policy != FsyncPolicy.NEVER)
+        finally:
+            self._sinker.close()
+        self._raise_if_failed()
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise RuntimeError("Background sinker failed to write records.") from (
+                self._error
+            )
+
+    def _next_batch(self, first: object) -> List[object]:
+        batch = [first]
+        while len(batch) < self._max_batch_size:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            batch.append(item)
+            if item is _STOP or isinstance(item, _FlushRequest):
+                break
+        return batch
+
+    def _run(self) -> None:
+        stopped = False
+        while not stopped:
+            batch = self._next_batch(self._queue.get())
+            records = [item for item in batch if isinstance(item, BaseModel)]
+            stopped = batch[-1] is _STOP
+            try:
+                if self._error is None:
+                    self._write(records, batch[-1])
+            except Exception as e:  # surfaced to the pipeline thread
+                _LOGGER.exception("Background sinker failed.")
+                self._error = e
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write(self, records: List[BaseModel], last: object) -> None:
+        if records:
+            self._sinker.sink_organizations(records)
+        if isinstance(last, _FlushRequest):
+            self._sinker.flush(fsync=last.fsync)
+        elif records and self._fsync_policy == FsyncPolicy.BATCH:
+            self._sinker.flush(fsync=True)
@@ -1,5 +1,6 @@
 import csv
-from typing import List
+import os
+from typing import Any, Dict, Iterable, List
 
 from core.ports.sinker import Sinker
 from pydantic import BaseModel
@@ -9,31 +10,47 @@ class SinkerCsv(Sinker):
     def __init__(self, file_path: str, batch_size: int = 10) -> None:
         self._file_path = file_path
         self._batch_size = batch_size
-        self._buffer: List[BaseModel] = []
+        self._buffer: List[Dict[str, Any]] = []
 
     def __del__(self) -> None:
         # Flush remaining data before deleting the object
         self._flush()
 
     def sink_organization(self, data: BaseModel) -> None:
-        self._buffer.append(data)
+        self.sink_organizations([data])
+
+    def sink_organizations(self, data: Iterable[BaseModel]) -> None:
+        # A batch larger than batch_size is appended in a single write
+        self._buffer.extend(record.model_dump() for record in data)
 
         if len(self._buffer) >= self._batch_size:
             self._flush()
 
-    def _flush(self) -> None:
+    def flush(self, fsync: bool = False) -> None:
+        self._flush(fsync)
+
+    def close(self) -> None:
+        self._flush()
+
+    def _flush(self, fsync: bool = False) -> None:
         if not self._buffer:
+            if fsync and os.path.exists(self._file_path):
+                # Records written by an earlier flush may still be in the OS cache
+                with open(self._file_path, mode="a", encoding="utf-8") as file:
+                    os.fsync(file.fileno())
             return
 
         with open(self._file_path, mode="a", newline="", encoding="utf-8") as file:
-            writer = csv.DictWriter(
-                file, fieldnames=self._get_keys(self._buffer[0].model_dump())
-            )
+            writer = csv.DictWriter(file, fieldnames=self._get_keys(self._buffer[0]))
 
             if file.tell() == 0:
                 writer.writeheader()
 
-            writer.writerows([record.model_dump() for record in self._buffer])
+            writer.writerows(self._buffer)
+
+            if fsync:
+                file.flush()
+                os.fsync(file.fileno())
 
         self._buffer.clear()
 
@@ -0,0 +1,47 @@
+import os
+from typing import IO, Iterable, List, Optional
+
+from core.ports.sinker import Sinker
+from pydantic import BaseModel
+
+
+class SinkerJsonl(Sinker):
+    """Append one JSON document per organization, keeping nested fields as is."""
+
+    def __init__(self, file_path: str, batch_size: int = 10) -> None:
+        self._file_path = file_path
+        self._batch_size = batch_size
+        self._buffer: List[str] = []
+        self._file: Optional[IO[str]] = None
+
+    def sink_organization(self, data: BaseModel) -> None:
+        self.sink_organizations([data])
+
+    def sink_organizations(self, data: Iterable[BaseModel]) -> None:
+        # A batch larger than batch_size is appended in a single write
+        self._buffer.extend(record.model_dump_json() for record in data)
+
+        if len(self._buffer) >= self._batch_size:
+            self._flush()
+
+    def flush(self, fsync: bool = False) -> None:
+        self._flush()
+        if fsync and self._file is not None:
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        self._flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+
+        if self._file is None:
+            self._file = open(self._file_path, mode="a", encoding="utf-8")
+
+        self._file.write("\n".join(self._buffer) + "\n")
+        self._file.flush()
+        self._buffer.clear()
@@ -0,0 +1,36 @@
+from typing import Iterable
+
+from core.ports.metrics import Metrics
+from core.ports.sinker import Sinker
+from pydantic import BaseModel
+
+
+class MeteredSinker(Sinker):
+    """Time the calls made to the wrapped sinker and count the records it receives."""
+
+    def __init__(self, sinker: Sinker, metrics: Metrics) -> None:
+        self._sinker = sinker
+        self._metrics = metrics
+
+    @property
+    def durable_flush(self) -> bool:
+        return self._sinker.durable_flush
+
+    def sink_organization(self, data: BaseModel) -> None:
+        with self._metrics.timer("sink.write"):
+            self._sinker.sink_organization(data)
+        self._metrics.increment("sink.records")
+
+    def sink_organizations(self, data: Iterable[BaseModel]) -> None:
+        records = list(data)
+        with self._metrics.timer("sink.write"):
+            self._sinker.sink_organizations(records)
+        self._metrics.increment("sink.records", len(records))
+
+    def flush(self, fsync: bool = False) -> None:
+        with self._metrics.timer("sink.flush"):
+            self._sinker.flush(fsync)
+
+    def close(self) -> None:
+        with self._metrics.timer("sink.close"):
+            self._sinker.close()
@@ -0,0 +1,139 @@
+import datetime
+import enum
+import logging
+import os
+import types
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from core.ports.sinker import Sinker
+from pydantic import BaseModel
+
+_LOGGER = logging.getLogger(__name__)
+
+_PRIMITIVE_TYPES: Dict[type, pa.DataType] = {
+    str: pa.string(),
+    int: pa.int64(),
+    float: pa.float64(),
+    bool: pa.bool_(),
+    datetime.date: pa.date32(),
+    datetime.datetime: pa.timestamp("us"),
+}
+
+
+def _arrow_type(annotation: Any) -> pa.DataType:
+    origin = get_origin(annotation)
+    if origin in (Union, types.UnionType):
+        arguments = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(arguments) != 1:
+            raise TypeError(f"Unsupported union type: {annotation}")
+        return _arrow_type(arguments[0])
+    if origin in (list, List):
+        return pa.list_(_arrow_type(get_args(annotation)[0]))
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _arrow_struct(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+        return pa.string()
+    if annotation in _PRIMITIVE_TYPES:
+        return _PRIMITIVE_TYPES[annotation]
+    raise TypeError(f"Unsupported field type: {annotation}")
+
+
+def _arrow_struct(model: Type[BaseModel]) -> pa.StructType:
+    return pa.struct(
+        [
+            pa.field(name, _arrow_type(field.annotation))
+            for name, field in model.model_fields.items()
+        ]
+    )
+
+
+def arrow_schema(model: Type[BaseModel]) -> pa.Schema:
+    return pa.schema(list(_arrow_struct(model)))
+
+
+class SinkerParquet(Sinker):
+    """Write organizations as Parquet row groups, one per flushed batch.
+
+    The schema is derived from the first record's model, so nested products and
+    activities stay typed. The file is only readable once the sinker is closed.
+
+    Unlike the CSV and JSONL sinkers, which append, an existing file is
+    overwritten when the first record comes in: Parquet files cannot be
+    appended to. Nothing is written when no record is sunk.
+    """
+
+    def __init__(self, file_path: str, batch_size: int = 1000) -> None:
+        self._file_path = file_path
+        self._batch_size = batch_size
+        self._buffer: List[Dict[str, Any]] = []
+        self._file: Optional[IO[bytes]] = None
+        self._writer: Optional[pq.ParquetWriter] = None
+        self._closed = False
+
+    @property
+    def durable_flush(self) -> bool:
+        # The footer describing the row groups is only written on close
+        return False
+
+    def sink_organization(self, data: BaseModel) -> None:
+        self.sink_organizations([data])
+
+    def sink_organizations(self, data: Iterable[BaseModel]) -> None:
+        if self._closed:
+            # Reopening the file would overwrite the records already written
+            raise ValueError("Cannot sink into a closed SinkerParquet.")
+        records = list(data)
+        if not records:
+            return
+        if self._writer is None:
+            _LOGGER.debug("Opening Parquet file %s", self._file_path)
+            self._file = open(self._file_path, mode="wb")
+            self._writer = pq.ParquetWriter(self._file, arrow_schema(type(records[0])))
+
+        # A batch larger than batch_size is written as a single row group
+        self._buffer.extend(record.model_dump() for record in records)
+
+        if len(self._buffer) >= self._batch_size:
+            self._flush()
+
+    def flush(self, fsync: bool = False) -> None:
+        if self._closed:
+            raise ValueError("Cannot flush a closed SinkerParquet.")
+        self._flush()
+        if fsync and self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _flush(self) -> None:
+        if not self._buffer or self._writer is None:
+            return
+
+        self._writer.write_table(
+            pa.Table.from_pylist(self._buffer, schema=self._writer.schema)
+        )
+        self._buffer.clear()
@@ -0,0 +1,209 @@
+import hashlib
+import json
+import logging
+import sqlite3
+from typing import Dict, List
+
+from core.entities.organizations import Organization
+from core.ports.sinker import Sinker
+from pydantic import BaseModel
+
+_LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS activities (
+    isic_id TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS products (
+    cpc_id TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS organizations (
+    organization_key TEXT PRIMARY KEY,
+    company_name TEXT NOT NULL,
+    creation_date TEXT,
+    employees TEXT NOT NULL,
+    economic_activity_raw TEXT NOT NULL,
+    isic_id TEXT NOT NULL REFERENCES activities (isic_id),
+    products_raw TEXT NOT NULL,
+    country_origin TEXT NOT NULL,
+    countries_activity TEXT NOT NULL,
+    main_company_domains TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS organization_products (
+    organization_key TEXT NOT NULL
+        REFERENCES organizations (organization_key) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    cpc_id TEXT NOT NULL REFERENCES products (cpc_id),
+    PRIMARY KEY (organization_key, position)
+);
+CREATE INDEX IF NOT EXISTS organizations_isic_id ON organizations (isic_id);
+CREATE INDEX IF NOT EXISTS organization_products_cpc_id
+    ON organization_products (cpc_id);
+"""
+
+_UPSERT_ORGANIZATION = """
+INSERT INTO organizations (
+    organization_key, company_name, creation_date, employees,
+    economic_activity_raw, isic_id, products_raw, country_origin,
+    countries_activity, main_company_domains, content_hash
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (organization_key) DO UPDATE SET
+    company_name = excluded.company_name,
+    creation_date = excluded.creation_date,
+    employees = excluded.employees,
+    economic_activity_raw = excluded.economic_activity_raw,
+    isic_id = excluded.isic_id,
+    products_raw = excluded.products_raw,
+    country_origin = excluded.country_origin,
+    countries_activity = excluded.countries_activity,
+    main_company_domains = excluded.main_company_domains,
+    content_hash = excluded.content_hash,
+    updated_at = CURRENT_TIMESTAMP
+"""
+
+
+class SinkerSqlite(Sinker):
+    """Upsert organizations into a normalized SQLite database.
+
+    Organizations are keyed by company name, or by their first domain when
+    key_by_domain is set. Records whose content did not change are skipped.
+    """
+
+    def __init__(
+        self, file_path: str, batch_size: int = 100, key_by_domain: bool = False
+    ) -> None:
+        self._batch_size = batch_size
+        self._key_by_domain = key_by_domain
+        self._buffer: Dict[str, Organization] = {}
+        # Writes may come from a BackgroundSinker thread
+        self._connection = sqlite3.connect(file_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("PRAGMA foreign_keys=ON")
+        self._connection.executescript(_SCHEMA)
+
+    def sink_organization(self, data: BaseModel) -> None:
+        if not isinstance(data, Organization):
+            raise ValueError(
+                f"SinkerSqlite only sinks Organization, got {type(data).__name__}."
+            )
+
+        # A later record for the same key replaces the buffered one
+        self._buffer[self._get_key(data)] = data
+
+        if len(self._buffer) >= self._batch_size:
+            self._flush()
+
+    def flush(self, fsync: bool = False) -> None:
+        self._flush()
+        if fsync:
+            self._connection.execute("PRAGMA wal_checkpoint(FULL)")
+
+    def close(self) -> None:
+        self._flush()
+        self._connection.close()
+
+    def find_organization_keys_by_isic(self, isic_id: str) -> List[str]:
+        """Keys of the organizations classified under an ISIC code or any of its
+        subdivisions, so that division "62" finds classes 6211, 6220 or 6290.
+        """
+        if not isic_id:
+            raise ValueError("ISIC code must not be empty.")
+        # A range rather than LIKE, which SQLite only runs on the index under
+        # case-sensitive LIKE
+        upper_bound = isic_id[:-1] + chr(ord(isic_id[-1]) + 1)
+        return [
+            row[0]
+            for row in self._connection.execute(
+                "SELECT organization_key FROM organizations"
+                " WHERE isic_id >= ? AND isic_id < ? ORDER BY organization_key",
+                (isic_id, upper_bound),
+            )
+        ]
+
+    def _get_key(self, organization: Organization) -> str:
+        if self._key_by_domain and organization.main_company_domains:
+            return organization.main_company_domains[0].lower()
+        return organization.company_name
+
+    @staticmethod
+    def _hash(organization: Organization) -> str:
+        return hashlib.sha256(organization.model_dump_json().encode()).hexdigest()
+
+    def _changed(self, hashes: Dict[str, str]) -> List[str]:
+        placeholders = ", ".join("?" * len(hashes))
+        existing = dict(
+            self._connection.execute(
+                "SELECT organization_key, content_hash FROM organizations"
+                f" WHERE organization_key IN ({placeholders})",
+                list(hashes),
+            ).fetchall()
+        )
+        return [key for key, value in hashes.items() if existing.get(key) != value]
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+
+        hashes = {key: self._hash(value) for key, value in self._buffer.items()}
+
+        with self._connection:
+            changed = self._changed(hashes)
+            organizations = [(key, self._buffer[key]) for key in changed]
+            _LOGGER.debug(
+                "Upserting %d of %d organizations", len(changed), len(self._buffer)
+            )
+
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO activities (isic_id, value) VALUES (?, ?)",
+                {
+                    (org.economic_activity.isic_id, org.economic_activity.value)
+                    for _, org in organizations
+                },
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO products (cpc_id, value) VALUES (?, ?)",
+                {
+                    (product.cpc_id, product.value)
+                    for _, org in organizations
+                    for product in org.products
+                },
+            )
+            self._connection.executemany(
+                _UPSERT_ORGANIZATION,
+                [
+                    (
+                        key,
+                        org.company_name,
+                        org.creation_date.isoformat() if org.creation_date else None,
+                        org.employees.value,
+                        org.economic_activity_raw,
+                        org.economic_activity.isic_id,
+                        json.dumps(org.products_raw),
+                        org.country_origin,
+                        json.dumps(org.countries_activity),
+                        json.dumps(org.main_company_domains),
+                        hashes[key],
+                    )
+                    for key, org in organizations
+                ],
+            )
+            self._connection.executemany(
+                "DELETE FROM organization_products WHERE organization_key = ?",
+                [(key,) for key in changed],
+            )
+            self._connection.executemany(
+                "INSERT INTO organization_products"
+                " (organization_key, position, cpc_id) VALUES (?, ?, ?)",
+                [
+                    (key, position, product.cpc_id)
+                    for key, org in organizations
+                    for position, product in enumerate(org.products)
+                ],
+            )
+
+        self._buffer.clear()
@@ -0,0 +1,60 @@
+import argparse
+import math
+import os
+
+from benchmark.bench_pipeline import run
+
+_RESOURCES = os.path.join(os.path.dirname(__file__), "..", "..", "..", "resources")
+
+
+def test_pipeline_runs_end_to_end_offline() -> None:
+    # Given a few companies and no injected latency
+    args = argparse.Namespace(
+        companies=os.path.join(_RESOURCES, "company_names.csv"),
+        resources=_RESOURCES,
+        limit=3,
+        llm_latency=0.0,
+        search_latency=0.0,
+        page_latency=0.0,
+        batch_size=2,
+        fetch_concurrency=2,
+        clean_concurrency=1,
+        sinker="jsonl",
+        memory_run=True,
+    )
+
+    # When running the benchmark
+    result = run(args)
+
+    # Then every company went through search, page retrieval and formatting
+    assert result["companies"] == 3
+    assert result["llm_calls"] == 12
+    assert result["companies_per_second"] > 0
+    assert result["peak_traced_memory_mb"] > 0
+
+
+def test_pipeline_without_companies(tmp_path) -> None:
+    # Given no company to fetch
+    companies = tmp_path / "company_names.csv"
+    companies.write_text("")
+    args = argparse.Namespace(
+        companies=str(companies),
+        resources=_RESOURCES,
+        limit=None,
+        llm_latency=0.0,
+        search_latency=0.0,
+        page_latency=0.0,
+        batch_size=1,
+        fetch_concurrency=1,
+        clean_concurrency=1,
+        sinker="jsonl",
+        memory_run=False,
+    )
+
+    # When running the benchmark
+    result = run(args)
+
+    # Then latencies are undefined rather than crashing, and memory is skipped
+    assert result["companies"] == 0
+    assert math.isnan(result["p50_latency_ms"])
+    assert "peak_traced_memory_mb" not in result
@@ -0,0 +1,23 @@
+import pytest
+
+from benchmark.bench_startup import parse_importtime
+
+
+def test_parse_importtime_sums_self_times() -> None:
+    # Given an importtime report with nested imports
+    stderr = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       100 |        100 |   torch._C",
+            "import time:       300 |        400 | torch",
+            "import time:        50 |         50 | cli",
+            "unrelated warning",
+        ]
+    )
+
+    # When parsing it
+    total, by_package = parse_importtime(stderr)
+
+    # Then self times are summed overall and per top-level package
+    assert total == pytest.approx(450e-6)
+    assert by_package == pytest.approx({"torch": 400e-6, "cli": 50e-6})
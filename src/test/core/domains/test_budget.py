@@ -0,0 +1,82 @@
+import pytest
+from core.domains.budget import BudgetExceededError, BudgetScope, TokenBudget
+
+
+def test_charge_within_budget() -> None:
+    budget = TokenBudget(per_company=100, per_run=1000)
+
+    budget.charge("CompanyA", 60)
+    budget.charge("CompanyA", 40)
+
+    assert budget.company_tokens("CompanyA") == 100
+    assert budget.run_tokens == 100
+
+
+def test_charge_over_company_budget() -> None:
+    # Given a company close to its limit
+    budget = TokenBudget(per_company=100)
+    budget.charge("CompanyA", 90)
+
+    # When charging past it, Then the company scope is reported
+    with pytest.raises(BudgetExceededError) as error:
+        budget.charge("CompanyA", 20)
+    assert error.value.scope == BudgetScope.COMPANY
+    assert error.value.company == "CompanyA"
+    assert error.value.used == 110
+
+    # And other companies are unaffected
+    budget.check("CompanyB")
+
+
+def test_check_exhausted_company() -> None:
+    budget = TokenBudget(per_company=100)
+    budget.charge("CompanyA", 100)
+
+    with pytest.raises(BudgetExceededError, match="company CompanyA: 100/100"):
+        budget.check("CompanyA")
+
+
+def test_charge_over_run_budget() -> None:
+    budget = TokenBudget(per_run=100)
+    budget.charge("CompanyA", 80)
+
+    with pytest.raises(BudgetExceededError) as error:
+        budget.charge("CompanyB", 30)
+
+    assert error.value.scope == BudgetScope.RUN
+    assert budget.run_exhausted
+
+
+def test_allow_gives_fresh_allowance() -> None:
+    # Given a company that exhausted its budget
+    budget = TokenBudget(per_company=100)
+    budget.charge("CompanyA", 100)
+
+    # When granting a second pass allowance
+    budget.allow("CompanyA", 500)
+
+    # Then it can spend again, up to the new limit
+    budget.charge("CompanyA", 300)
+    assert budget.company_limit("CompanyA") == 500
+    assert budget.run_tokens == 400
+
+
+def test_second_pass_allowance_exceeds_the_cap() -> None:
+    # Given a per-company cap, with and without a run budget mostly left
+    capped = TokenBudget(per_company=100)
+    with_run = TokenBudget(per_company=100, per_run=2000)
+    with_run.charge(None, 400)
+
+    # Then deferred companies get twice the cap, or their share of the run left
+    assert capped.second_pass_allowance(companies=3) == 200
+    assert with_run.second_pass_allowance(companies=2) == 800
+    assert with_run.second_pass_allowance(companies=100) == 200
+    assert TokenBudget(per_run=1000).second_pass_allowance(companies=1) is None
+
+
+def test_unlimited_budget() -> None:
+    budget = TokenBudget()
+
+    budget.charge("CompanyA", 10**9)
+    budget.check("CompanyA")
+    assert not budget.run_exhausted
@@ -4,7 +4,7 @@ from unittest.mock import MagicMock
 import pytest
 from core.domains.cleaner import Cleaner
 from core.entities.organizations import EmployeeRange, Organization, RawOrganization
-from core.ports.referential import Referential
+from core.ports.referential import Referential, ReferentialMatch
 
 
 # Adding explicit return type for mock_referentials fixture
@@ -17,14 +17,21 @@ def mock_referentials() -> (
 
     # Mock CPC referential
     cpc_mock.get_closest_match.side_effect = lambda x: (
-        {0: "CPC-123", 1: x} if x else None
+        ReferentialMatch("CPC-123", x) if x else None
     )
 
     # Mock ISIC referential
     isic_mock.get_closest_match.side_effect = lambda x: (
-        {0: "ISIC-456", 1: x} if x else None
+        ReferentialMatch("ISIC-456", x) if x else None
     )
 
+    cpc_mock.get_closest_matches.side_effect = lambda xs: [
+        cpc_mock.get_closest_match(x) for x in xs
+    ]
+    isic_mock.get_closest_matches.side_effect = lambda xs: [
+        isic_mock.get_closest_match(x) for x in xs
+    ]
+
     return cpc_mock, isic_mock
 
 
@@ -90,3 +97,67 @@ def test_serialize_to_organization_empty_products(
     # Then it should return an Organization object with an empty products list
     assert isinstance(result, Organization)
     assert result.products == []
+
+
+def test_serialize_to_organizations_deduplicates_lookups(
+    cleaner: Cleaner,
+    raw_organization: RawOrganization,
+    mock_referentials: tuple[Referential, Referential],
+) -> None:
+    # Given several organizations sharing activities and products
+    other = raw_organization.model_copy(
+        update={
+            "company_name": "Other Company",
+            "employees": 20000,
+            "products": ["SaaS Platform", "Consulting"],
+        }
+    )
+
+    # When serializing them as a batch
+    result = cleaner.serialize_to_organizations([raw_organization, other])
+
+    # Then each referential is queried once with the distinct values
+    cpc_mock, isic_mock = mock_referentials
+    isic_mock.get_closest_matches.assert_called_once_with(["Software Development"])
+    cpc_mock.get_closest_matches.assert_called_once_with(
+        ["SaaS Platform", "Consulting"]
+    )
+    assert [organization.company_name for organization in result] == [
+        "Test Company",
+        "Other Company",
+    ]
+    assert result[1].employees == EmployeeRange.RANGE_10000_PLUS
+    assert [product.value for product in result[1].products] == [
+        "SaaS Platform",
+        "Consulting",
+    ]
+
+
+@pytest.mark.parametrize(
+    "employees, expected",
+    [
+        (1, EmployeeRange.SELF_EMPLOYED),
+        (2, EmployeeRange.RANGE_2_10),
+        (10, EmployeeRange.RANGE_2_10),
+        (11, EmployeeRange.RANGE_11_50),
+        (200, EmployeeRange.RANGE_51_200),
+        (201, EmployeeRange.RANGE_201_500),
+        (1000, EmployeeRange.RANGE_501_1000),
+        (5000, EmployeeRange.RANGE_1001_5000),
+        (10000, EmployeeRange.RANGE_5001_10000),
+        (10001, EmployeeRange.RANGE_10000_PLUS),
+    ],
+)
+def test_enrich_employee(employees: int, expected: EmployeeRange) -> None:
+    assert Cleaner._enrich_employee(employees) == expected
+
+
+def test_serialize_to_organization_without_isic_match(
+    cleaner: Cleaner,
+    raw_organization: RawOrganization,
+    mock_referentials: tuple[Referential, Referential],
+) -> None:
+    mock_referentials[1].get_closest_match.side_effect = lambda x: None
+
+    with pytest.raises(ValueError, match="No ISIC classification found"):
+        cleaner.serialize_to_organization(raw_organization)
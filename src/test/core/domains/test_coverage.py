@@ -0,0 +1,78 @@
+from core.domains.coverage import FieldCoverage
+from core.entities.organizations import RawOrganization
+
+ABOUT = (
+    "Acme is a leader in industrial tools, founded in 1901 and headquartered "
+    "in Lyon. Our 2,500 employees design products sold in 40 countries."
+)
+
+
+def test_partial_text_leaves_fields_missing() -> None:
+    # Given a page only stating the creation date
+    coverage = FieldCoverage()
+
+    # When accounting for it
+    complete = coverage.update("Acme was established in 1901.")
+
+    # Then the other fields are still missing
+    assert not complete
+    assert "creation_date" not in coverage.missing
+    assert "employees" in coverage.missing
+    assert "company_name" not in coverage.missing
+
+
+def test_pages_together_cover_every_field() -> None:
+    # When accounting for an about page and a page giving the website
+    coverage = FieldCoverage.of(
+        [ABOUT, "Visit www.acme.com for our brands such as Anvilo."]
+    )
+
+    # Then every field is covered
+    assert coverage.complete
+    assert coverage.missing == set()
+
+
+def test_every_field_but_the_company_name_is_tracked() -> None:
+    # When starting to read pages
+    coverage = FieldCoverage()
+
+    # Then every field of RawOrganization but the known one has a cue
+    assert coverage.missing | {"company_name"} == set(RawOrganization.model_fields)
+    assert "company_name" not in coverage.missing
+
+
+def test_menu_entries_do_not_cover_fields() -> None:
+    # Given a page whose only mention of products, brands and employees is the
+    # site menu
+    coverage = FieldCoverage()
+
+    # When accounting for it
+    coverage.update(
+        "Home | Products | Services | Solutions | Brands | Our range | "
+        "Employees | Workforce | Contact"
+    )
+
+    # Then those fields are still missing
+    assert {"products", "product_names", "employees"} <= coverage.missing
+
+
+def test_fields_covered_once_stated() -> None:
+    # When accounting for pages stating the employees and product names
+    coverage = FieldCoverage.of(
+        ["Acme employs over 300 people.", "Our brands include Anvilo and Hamro."]
+    )
+
+    # Then those fields are covered
+    assert "employees" not in coverage.missing
+    assert "product_names" not in coverage.missing
+
+
+def test_products_covered_once_stated() -> None:
+    # Given a page whose only mention of products is the site menu
+    coverage = FieldCoverage()
+    coverage.update("Home | Products | Services | Solutions | Contact")
+
+    # Then the products are still missing until a page says what is offered
+    assert "products" in coverage.missing
+    coverage.update("We design software for accountants.")
+    assert "products" not in coverage.missing
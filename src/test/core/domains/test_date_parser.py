@@ -0,0 +1,66 @@
+from datetime import date
+from typing import Optional
+from unittest.mock import patch
+
+import pytest
+from core.domains.date_parser import DateParser
+
+
+@pytest.fixture
+def date_parser() -> DateParser:
+    return DateParser()
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("1976", date(1976, 1, 1)),
+        ("Founded in 1976", date(1976, 1, 1)),
+        ("1976-04-01", date(1976, 4, 1)),
+        ("1976/04/01", date(1976, 4, 1)),
+        ("1976-04", date(1976, 4, 1)),
+        ("1976-04-01T00:00:00Z", date(1976, 4, 1)),
+        ("April 1, 1976", date(1976, 4, 1)),
+        ("Apr. 1st 1976", date(1976, 4, 1)),
+        ("1 April 1976", date(1976, 4, 1)),
+        ("September 1998", date(1998, 9, 1)),
+        ("  april   1976 ", date(1976, 4, 1)),
+    ],
+)
+def test_parse_common_formats(value: str, expected: date) -> None:
+    # Given a common date format, When parsing, Then dateparser is not needed
+    with patch.object(DateParser, "_parse_with_dateparser", side_effect=AssertionError):
+        assert DateParser().parse(value) == expected
+
+
+@pytest.mark.parametrize("value", [None, "", "   "])
+def test_parse_empty(date_parser: DateParser, value: Optional[str]) -> None:
+    assert date_parser.parse(value) is None
+
+
+def test_parse_invalid_date_falls_back() -> None:
+    # Given an out of range ISO date, Then the fallback decides
+    with patch.object(
+        DateParser, "_parse_with_dateparser", return_value=None
+    ) as fallback:
+        assert DateParser().parse("1976-13-45") is None
+        fallback.assert_called_once_with("1976-13-45")
+
+
+def test_fallback_is_memoized() -> None:
+    # Given a value only dateparser understands
+    with patch.object(
+        DateParser, "_parse_with_dateparser", return_value=date(1976, 4, 1)
+    ) as fallback:
+        date_parser = DateParser()
+
+        # When parsing it several times
+        for _ in range(3):
+            assert date_parser.parse("le 1er avril 1976") == date(1976, 4, 1)
+
+        # Then dateparser is only called once
+        fallback.assert_called_once()
+
+
+def test_fallback_uses_dateparser() -> None:
+    assert DateParser(languages=["fr"]).parse("1er avril 1976") == date(1976, 4, 1)
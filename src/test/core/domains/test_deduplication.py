@@ -0,0 +1,72 @@
+import pytest
+from core.domains.deduplication import (
+    BloomFilter,
+    CompanyDeduplicator,
+    normalize_company_name,
+    normalize_domain,
+)
+from core.entities.organizations import Company
+from infrastructure.adapters.metrics_registry import InMemoryMetrics
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("Google", "google"),
+        ("Google LLC", "google"),
+        ("GOOGLE, Inc.", "google"),
+        ("The Coca-Cola Company", "coca cola"),
+        ("Société Générale S.A.", "societe generale"),
+        ("Johnson & Johnson", "johnson and johnson"),
+        ("Group", "group"),
+    ],
+)
+def test_normalize_company_name(name: str, expected: str) -> None:
+    assert normalize_company_name(name) == expected
+
+
+@pytest.mark.parametrize(
+    "domain, expected",
+    [
+        ("www.ikea.com", "ikea.com"),
+        ("https://WWW.Ikea.com/fr/about", "ikea.com"),
+        ("ikea.com:443", "ikea.com"),
+    ],
+)
+def test_normalize_domain(domain: str, expected: str) -> None:
+    assert normalize_domain(domain) == expected
+
+
+def test_bloom_filter_membership() -> None:
+    # Given a small filter
+    bloom = BloomFilter(capacity=100, error_rate=1e-6)
+
+    # When adding more keys than its capacity
+    added = [bloom.add(f"key-{i}") for i in range(1000)]
+
+    # Then every key is remembered and none was seen before
+    assert not any(added)
+    assert all(f"key-{i}" in bloom for i in range(1000))
+    assert len(bloom) == 1000
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 5
+
+
+def test_deduplicator_drops_variants_and_shared_domains() -> None:
+    # Given companies with spelling variants and a shared domain
+    metrics = InMemoryMetrics()
+    companies = [
+        Company(name="Google"),
+        Company(name="Google LLC"),
+        Company(name="IKEA", domain="www.ikea.com"),
+        Company(name="Ikea Group Sweden", domain="https://ikea.com"),
+        Company(name="Apple"),
+    ]
+
+    # When deduplicating them
+    unique = list(CompanyDeduplicator(metrics=metrics)(companies))
+
+    # Then only the first occurrence of each company is kept
+    assert [company.name for company in unique] == ["Google", "IKEA", "Apple"]
+    assert metrics.counter("input.duplicates") == 2
+    assert metrics.counter("input.companies") == 3
@@ -0,0 +1,42 @@
+from typing import Optional
+
+import pytest
+from core.domains.priority import CompanyPrioritizer
+from core.entities.organizations import Company
+
+
+def company(name: str, priority: Optional[float] = None) -> Company:
+    return Company(name=name, priority=priority)
+
+
+def test_higher_priorities_come_first() -> None:
+    # Given companies with and without priority
+    companies = [
+        company("a"),
+        company("b", 1),
+        company("c", 5),
+        company("d", 1),
+        company("e"),
+    ]
+
+    # When prioritizing them
+    names = [c.name for c in CompanyPrioritizer()(companies)]
+
+    # Then higher priorities come first, the others keep their input order
+    assert names == ["c", "b", "d", "a", "e"]
+
+
+def test_companies_only_move_within_the_window() -> None:
+    # Given a high priority company read after a full window
+    companies = [company("b", 2), company("a", 1), company("c", 9)]
+
+    # When prioritizing with a window of one company
+    names = [c.name for c in CompanyPrioritizer(window=1)(companies)]
+
+    # Then the first company has left before the last one is read
+    assert names == ["b", "c", "a"]
+
+
+def test_window_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        CompanyPrioritizer(window=0)
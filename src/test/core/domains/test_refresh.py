@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from core.domains.refresh import RefreshPolicy, RefreshReason
+from core.entities.sources import FetchRecord, PageSource
+from core.ports.fetch_state import SourceChangeDetector
+
+NOW = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def detector() -> MagicMock:
+    detector = MagicMock(spec=SourceChangeDetector)
+    detector.has_changed.return_value = False
+    return detector
+
+
+@pytest.fixture
+def policy(detector: MagicMock) -> RefreshPolicy:
+    return RefreshPolicy(detector, max_age=timedelta(days=30), clock=lambda: NOW)
+
+
+def _record(age: timedelta, sources: int = 2) -> FetchRecord:
+    return FetchRecord(
+        company_name="Acme",
+        fetched_at=NOW - age,
+        sources=[
+            PageSource(url=f"https://acme.com/{i}", content_hash=str(i))
+            for i in range(sources)
+        ],
+    )
+
+
+def test_unknown_company_is_fetched(policy: RefreshPolicy) -> None:
+    assert policy.reason(None) == RefreshReason.NEW
+    assert policy.needs_refresh(None)
+
+
+def test_old_record_is_refreshed_without_checking_pages(
+    policy: RefreshPolicy, detector: MagicMock
+) -> None:
+    assert policy.reason(_record(timedelta(days=31))) == RefreshReason.EXPIRED
+    detector.has_changed.assert_not_called()
+
+
+def test_record_without_sources_is_refreshed(policy: RefreshPolicy) -> None:
+    assert policy.reason(_record(timedelta(days=1), sources=0)) == (
+        RefreshReason.NO_SOURCES
+    )
+
+
+def test_unchanged_pages_skip_the_refresh(
+    policy: RefreshPolicy, detector: MagicMock
+) -> None:
+    # Given a recent record whose pages did not change
+    record = _record(timedelta(days=1))
+
+    # When checking it, Then it does not need a refresh
+    assert policy.reason(record) == RefreshReason.UNCHANGED
+    assert not policy.needs_refresh(record)
+    assert detector.has_changed.call_count == 4
+
+
+def test_changed_page_triggers_the_refresh(
+    policy: RefreshPolicy, detector: MagicMock
+) -> None:
+    # Given a recent record whose first page changed
+    detector.has_changed.side_effect = [True, False]
+
+    # When checking it, Then it needs a refresh and the other page is not checked
+    assert policy.reason(_record(timedelta(days=1))) == RefreshReason.CHANGED
+    assert detector.has_changed.call_count == 1
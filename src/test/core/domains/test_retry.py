@@ -0,0 +1,118 @@
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+from core.domains.retry import RetryError, RetryPolicy, error_chain
+from core.entities.failures import FailureKind
+
+
+@pytest.fixture
+def sleeps() -> List[float]:
+    return []
+
+
+@pytest.fixture
+def policy(sleeps: List[float]) -> RetryPolicy:
+    return RetryPolicy(max_attempts=3, base_delay=1.0, sleep=sleeps.append)
+
+
+def test_returns_without_retrying_on_success(
+    policy: RetryPolicy, sleeps: List[float]
+) -> None:
+    # Given a function that succeeds
+    fn = MagicMock(return_value="ok")
+
+    # When calling it through the policy
+    result = policy.call(fn, "arg")
+
+    # Then it is called once
+    assert result == "ok"
+    fn.assert_called_once_with("arg")
+    assert sleeps == []
+
+
+def test_retries_transient_errors_with_backoff(
+    policy: RetryPolicy, sleeps: List[float]
+) -> None:
+    # Given a function failing twice with transient errors
+    fn = MagicMock(side_effect=[TimeoutError(), ConnectionError(), "ok"])
+    on_retry = MagicMock()
+
+    # When calling it through the policy
+    result = policy.call(fn, on_retry=on_retry)
+
+    # Then it succeeds on the third attempt after jittered, bounded sleeps
+    assert result == "ok"
+    assert fn.call_count == 3
+    assert on_retry.call_count == 2
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= 1.0
+    assert 0 <= sleeps[1] <= 2.0
+
+
+def test_gives_up_after_max_attempts(policy: RetryPolicy) -> None:
+    # Given a function that keeps timing out
+    fn = MagicMock(side_effect=TimeoutError("slow"))
+
+    # When calling it through the policy
+    with pytest.raises(RetryError) as exc_info:
+        policy.call(fn)
+
+    # Then the last error is reported as transient
+    assert fn.call_count == 3
+    assert exc_info.value.kind == FailureKind.TRANSIENT
+    assert exc_info.value.attempts == 3
+    assert isinstance(exc_info.value.error, TimeoutError)
+
+
+def test_does_not_retry_permanent_errors(
+    policy: RetryPolicy, sleeps: List[float]
+) -> None:
+    # Given a function failing with a permanent error
+    fn = MagicMock(side_effect=ValueError("bad input"))
+
+    # When calling it through the policy
+    with pytest.raises(RetryError) as exc_info:
+        policy.call(fn)
+
+    # Then it fails at once
+    assert fn.call_count == 1
+    assert exc_info.value.kind == FailureKind.PERMANENT
+    assert sleeps == []
+
+
+def test_classifies_wrapped_errors() -> None:
+    # Given a policy with a custom transient predicate
+    policy = RetryPolicy(is_transient=lambda e: "429" in str(e))
+
+    # When classifying errors wrapping other errors
+    wrapped_in_args = ValueError("Failed to retrieve page", OSError("429"))
+    try:
+        try:
+            raise ConnectionError("reset")
+        except ConnectionError as e:
+            raise RuntimeError("Agent failed") from e
+    except RuntimeError as e:
+        wrapped_as_cause = e
+
+    # Then the wrapped errors decide
+    assert policy.classify(wrapped_in_args) == FailureKind.TRANSIENT
+    assert policy.classify(wrapped_as_cause) == FailureKind.TRANSIENT
+    assert policy.classify(ValueError("500")) == FailureKind.PERMANENT
+    assert len(list(error_chain(wrapped_as_cause))) == 2
+
+
+def test_delay_is_capped() -> None:
+    # Given a policy with a low maximum delay
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+
+    # When computing the delay of a late attempt
+    delays = [policy.delay(10) for _ in range(100)]
+
+    # Then it never exceeds the cap
+    assert all(0 <= delay <= 5.0 for delay in delays)
+
+
+def test_invalid_max_attempts() -> None:
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
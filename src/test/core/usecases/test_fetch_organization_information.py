@@ -1,9 +1,20 @@
-from typing import Generator, List
-from unittest.mock import MagicMock
+import threading
+import time
+from datetime import timedelta
+from typing import Generator, Iterator, List, Optional
+from unittest.mock import MagicMock, PropertyMock
 
 import pytest
+from core.domains.budget import BudgetExceededError, BudgetScope, TokenBudget
 from core.domains.cleaner import Cleaner
+from core.domains.refresh import RefreshPolicy, RefreshReason
+from core.domains.retry import RetryPolicy
+from core.entities.failures import FailureKind
+from core.entities.organizations import Company, RawOrganization
+from core.entities.sources import PageSource
+from core.ports.fetch_state import FetchStateStore
 from core.ports.fetching import RawOrganizationFetcher
+from core.ports.metrics import Metrics, NoopMetrics
 from core.ports.sinker import Sinker
 from core.usecases.fetch_organization_information import FetchOrganizationInformation
 
@@ -56,3 +67,525 @@ def test_fetch_organization_information(
     mock_sinker.sink_organization.assert_any_call("clean_raw_CompanyA")
     mock_sinker.sink_organization.assert_any_call("clean_raw_CompanyB")
     assert mock_sinker.sink_organization.call_count == len(companies)
+
+
+def test_fetch_organization_information_in_batches(
+    mock_fetcher: MagicMock, mock_cleaner: MagicMock, mock_sinker: MagicMock
+) -> None:
+    # Given a FetchOrganizationInformation instance cleaning by batches of 2
+    mock_cleaner.serialize_to_organizations.side_effect = lambda xs: [
+        f"clean_{x}" for x in xs
+    ]
+    fetch_organization_info = FetchOrganizationInformation(
+        fetcher=mock_fetcher,
+        cleaner=mock_cleaner,
+        sinker=mock_sinker,
+        batch_size=2,
+    )
+
+    # When calling fetch_organization_info with 3 companies
+    fetch_organization_info(["CompanyA", "CompanyB", "CompanyC"])
+
+    # Then the cleaner should be called once per batch
+    mock_cleaner.serialize_to_organizations.assert_any_call(
+        ["raw_CompanyA", "raw_CompanyB"]
+    )
+    mock_cleaner.serialize_to_organizations.assert_any_call(["raw_CompanyC"])
+    mock_cleaner.serialize_to_organization.assert_not_called()
+
+    # And every organization should still be sunk, in order
+    assert [call.args[0] for call in mock_sinker.sink_organization.call_args_list] == [
+        "clean_raw_CompanyA",
+        "clean_raw_CompanyB",
+        "clean_raw_CompanyC",
+    ]
+
+
+def test_invalid_batch_size(
+    mock_fetcher: MagicMock, mock_cleaner: MagicMock, mock_sinker: MagicMock
+) -> None:
+    with pytest.raises(ValueError, match="Batch size must be at least 1"):
+        FetchOrganizationInformation(mock_fetcher, mock_cleaner, mock_sinker, 0)
+
+
+def test_invalid_stage_concurrency(
+    mock_fetcher: MagicMock, mock_cleaner: MagicMock, mock_sinker: MagicMock
+) -> None:
+    with pytest.raises(ValueError, match="Stage concurrency must be at least 1"):
+        FetchOrganizationInformation(
+            mock_fetcher, mock_cleaner, mock_sinker, fetch_concurrency=0
+        )
+
+
+def test_fetch_state_needs_durable_flush(
+    mock_fetcher: MagicMock, mock_cleaner: MagicMock, mock_sinker: MagicMock
+) -> None:
+    # Given a sinker whose records are only readable once closed
+    type(mock_sinker).durable_flush = PropertyMock(return_value=False)
+
+    # Then it cannot be checkpointed together with the fetch state
+    with pytest.raises(ValueError, match="readable once flushed"):
+        FetchOrganizationInformation(
+            mock_fetcher,
+            mock_cleaner,
+            mock_sinker,
+            fetch_state=MagicMock(spec=FetchStateStore),
+        )
+
+
+def test_stages_run_concurrently(
+    mock_fetcher: MagicMock, mock_cleaner: MagicMock, mock_sinker: MagicMock
+) -> None:
+    # Given fetches that only complete once three of them are in flight
+    barrier = threading.Barrier(3, timeout=5)
+    mock_fetcher.get_raw_organization_information.side_effect = lambda x: (
+        barrier.wait() is not None and f"raw_{x}"
+    )
+    # And a clean that only completes while another one is running
+    cleaning = threading.Barrier(2, timeout=5)
+    mock_cleaner.serialize_to_organization.side_effect = lambda x: (
+        cleaning.wait() is not None and f"clean_{x}"
+    )
+
+    # When running the fetch and clean stages on their own threads
+    FetchOrganizationInformation(
+        mock_fetcher,
+        mock_cleaner,
+        mock_sinker,
+        fetch_concurrency=3,
+        clean_concurrency=2,
+    )([f"Company{i}" for i in range(6)])
+
+    # Then every company is sunk, in completion order
+    assert sorted(
+        call.args[0] for call in mock_sinker.sink_organization.call_args_list
+    ) == [f"clean_raw_Company{i}" for i in range(6)]
+
+
+def test_fetch_stage_is_bounded(
+    mock_fetcher: MagicMock, mock_cleaner: MagicMock, mock_sinker: MagicMock
+) -> None:
+    # Given a slow sinker behind a fast fetch stage
+    lock = threading.Lock()
+    in_flight = [0]
+    fetched = []
+
+    def fetch(name: str) -> str:
+        with lock:
+            fetched.append(name)
+            in_flight[0] = max(
+                in_flight[0],
+                len(fetched) - mock_sinker.sink_organization.call_count,
+            )
+        return f"raw_{name}"
+
+    mock_fetcher.get_raw_organization_information.side_effect = fetch
+    mock_sinker.sink_organization.side_effect = lambda _: time.sleep(0.01)
+
+    # When running the pipeline
+    FetchOrganizationInformation(
+        mock_fetcher, mock_cleaner, mock_sinker, fetch_concurrency=2
+    )([f"Company{i}" for i in range(20)])
+
+    # Then fetches never run far ahead of the sinker
+    assert mock_sinker.sink_organization.call_count == 20
+    assert in_flight[0] <= 4
+
+
+def test_micro_batches_are_cut_by_interval(
+    mock_fetcher: MagicMock, mock_cleaner: MagicMock, mock_sinker: MagicMock
+) -> None:
+    # Given a fetch that only answers once the previous company is cleaned,
+    # and batches of up to 10 within 10 ms
+    cleaned = threading.Event()
+
+    def fetch(company: str) -> str:
+        if company != "CompanyA":
+            assert cleaned.wait(5), "the partial batch waited for the next fetch"
+            cleaned.clear()
+        return f"raw_{company}"
+
+    def clean(raw_organizations: List[str]) -> List[str]:
+        cleaned.set()
+        return [f"clean_{x}" for x in raw_organizations]
+
+    mock_fetcher.get_raw_organization_information.side_effect = fetch
+    mock_cleaner.serialize_to_organizations.side_effect = clean
+
+    # When running the pipeline
+    FetchOrganizationInformation(
+        mock_fetcher,
+        mock_cleaner,
+        mock_sinker,
+        batch_size=10,
+        batch_interval=timedelta(milliseconds=10),
+    )(["CompanyA", "CompanyB", "CompanyC"])
+
+    # Then each partial batch is cleaned without waiting for the next company
+    assert mock_cleaner.serialize_to_organizations.call_count == 3
+    assert mock_sinker.sink_organization.call_count == 3
+
+
+def test_full_batches_are_not_delayed_by_interval(
+    mock_fetcher: MagicMock, mock_cleaner: MagicMock, mock_sinker: MagicMock
+) -> None:
+    # Given batches of two within a long interval
+    mock_cleaner.serialize_to_organizations.side_effect = lambda xs: [
+        f"clean_{x}" for x in xs
+    ]
+
+    # When running the pipeline
+    start = time.monotonic()
+    FetchOrganizationInformation(
+        mock_fetcher,
+        mock_cleaner,
+        mock_sinker,
+        batch_size=2,
+        batch_interval=timedelta(seconds=10),
+    )(["CompanyA", "CompanyB", "CompanyC"])
+
+    # Then a full batch and the last partial one go without waiting
+    assert time.monotonic() - start < 1
+    assert [
+        len(call.args[0])
+        for call in mock_cleaner.serialize_to_organizations.call_args_list
+    ] == [2, 1]
+    assert mock_sinker.sink_organization.call_count == 3
+
+
+def test_timed_batches_pass_input_errors_on(
+    mock_fetcher: MagicMock, mock_cleaner: MagicMock, mock_sinker: MagicMock
+) -> None:
+    # Given a company list failing after its first company
+    def companies() -> Iterator[str]:
+        yield "CompanyA"
+        raise OSError("truncated file")
+
+    # When running the pipeline with timed batches
+    pipeline = FetchOrganizationInformation(
+        mock_fetcher,
+        mock_cleaner,
+        mock_sinker,
+        batch_size=10,
+        batch_interval=timedelta(seconds=10),
+    )
+
+    # Then the error reaches the caller
+    with pytest.raises(OSError, match="truncated file"):
+        pipeline(companies())
+
+
+def test_fetch_organization_information_flushes_sinker(
+    mock_fetcher: MagicMock, mock_cleaner: MagicMock, mock_sinker: MagicMock
+) -> None:
+    FetchOrganizationInformation(mock_fetcher, mock_cleaner, mock_sinker)(["CompanyA"])
+
+    mock_sinker.flush.assert_called_once()
+
+
+def test_fetch_organization_information_records_metrics(
+    mock_fetcher: MagicMock, mock_cleaner: MagicMock, mock_sinker: MagicMock
+) -> None:
+    # Given a metrics port recording the company of each fetch
+    metrics = MagicMock(wraps=NoopMetrics())
+    companies_seen: List[Optional[str]] = []
+    mock_fetcher.get_raw_organization_information.side_effect = lambda x: (
+        companies_seen.append(Metrics.current_company()) or f"raw_{x}"
+    )
+
+    # When running the use case
+    FetchOrganizationInformation(
+        mock_fetcher, mock_cleaner, mock_sinker, metrics=metrics
+    )(["CompanyA", "CompanyB"])
+
+    # Then each fetch runs in its company context and every stage is timed
+    assert companies_seen == ["CompanyA", "CompanyB"]
+    timed = {call.args[0] for call in metrics.timer.call_args_list}
+    assert timed == {
+        "pipeline.fetch",
+        "pipeline.clean",
+        "pipeline.sink",
+        "pipeline.flush",
+    }
+
+
+def test_companies_over_budget_are_deferred(
+    mock_fetcher: MagicMock, mock_cleaner: MagicMock, mock_sinker: MagicMock
+) -> None:
+    # Given a company that exceeds its budget on the first attempt only
+    budget = TokenBudget(per_company=100)
+    attempts: List[str] = []
+
+    def fetch(company: str) -> str:
+        attempts.append(company)
+        if company == "HardCompany" and attempts.count(company) == 1:
+            raise BudgetExceededError(BudgetScope.COMPANY, 150, 100, company)
+        return f"raw_{company}"
+
+    mock_fetcher.get_raw_organization_information.side_effect = fetch
+
+    # When running the use case
+    use_case = FetchOrganizationInformation(
+        mock_fetcher,
+        mock_cleaner,
+        mock_sinker,
+        budget=budget,
+        deferred_company_budget=1000,
+    )
+    use_case(["HardCompany", "EasyCompany"])
+
+    # Then the hard company is retried after the easy one, with a new allowance
+    assert attempts == ["HardCompany", "EasyCompany", "HardCompany"]
+    assert budget.company_limit("HardCompany") == 1000
+    assert [call.args[0] for call in mock_sinker.sink_organization.call_args_list] == [
+        "clean_raw_EasyCompany",
+        "clean_raw_HardCompany",
+    ]
+    assert use_case.cut_off_companies == []
+
+
+def test_deferred_companies_get_a_larger_budget(
+    mock_fetcher: MagicMock, mock_cleaner: MagicMock, mock_sinker: MagicMock
+) -> None:
+    # Given a company over budget on its first attempt, and no second pass budget
+    budget = TokenBudget(per_company=100)
+    budget.charge("HardCompany", 60)
+    attempts: List[str] = []
+
+    def fetch(company: str) -> str:
+        attempts.append(company)
+        if attempts.count(company) == 1:
+            raise BudgetExceededError(BudgetScope.COMPANY, 150, 100, company)
+        return f"raw_{company}"
+
+    mock_fetcher.get_raw_organization_information.side_effect = fetch
+
+    # When running the use case
+    FetchOrganizationInformation(
+        mock_fetcher, mock_cleaner, mock_sinker, budget=budget
+    )(["HardCompany"])
+
+    # Then the second pass gets a fresh allowance larger than the first one
+    assert attempts == ["HardCompany", "HardCompany"]
+    assert budget.company_limit("HardCompany") > 100
+    assert budget.company_tokens("HardCompany") == 0
+
+
+def test_companies_are_cut_off(
+    mock_fetcher: MagicMock, mock_cleaner: MagicMock, mock_sinker: MagicMock
+) -> None:
+    # Given a company exceeding its own budget and spending the whole run budget
+    budget = TokenBudget(per_company=100, per_run=150)
+
+    def fetch(company: str) -> str:
+        if company == "HardCompany":
+            budget.charge(company, 150)
+        return f"raw_{company}"
+
+    mock_fetcher.get_raw_organization_information.side_effect = fetch
+
+    # When running the use case
+    use_case = FetchOrganizationInformation(
+        mock_fetcher, mock_cleaner, mock_sinker, budget=budget
+    )
+    use_case(["HardCompany", "EasyCompany", "OtherCompany"])
+
+    # Then no other company is fetched once the run budget is exhausted
+    assert mock_fetcher.get_raw_organization_information.call_count == 1
+    mock_sinker.sink_organization.assert_not_called()
+    assert use_case.cut_off_companies == ["EasyCompany", "OtherCompany", "HardCompany"]
+
+
+def _raw_organization(company_name: str) -> RawOrganization:
+    return RawOrganization(
+        company_name=company_name,
+        creation_date="2001",
+        employees=10,
+        economic_activity="Computer programming activities",
+        products=["Software"],
+        product_names=[f"{company_name} Software"],
+        country_origin="France",
+        countries_activity=["France"],
+        main_company_domains=[f"{company_name.lower()}.com"],
+    )
+
+
+def test_transient_fetch_failures_are_retried(
+    mock_fetcher: MagicMock, mock_cleaner: MagicMock, mock_sinker: MagicMock
+) -> None:
+    # Given a fetcher failing once with a transient error
+    mock_fetcher.get_raw_organization_information.side_effect = [
+        ConnectionError("reset"),
+        "raw_CompanyA",
+    ]
+    metrics = MagicMock(spec=Metrics)
+    metrics.company.side_effect = NoopMetrics().company
+    metrics.timer.side_effect = NoopMetrics().timer
+    fetch_organization_info = FetchOrganizationInformation(
+        fetcher=mock_fetcher,
+        cleaner=mock_cleaner,
+        sinker=mock_sinker,
+        metrics=metrics,
+        retry_policy=RetryPolicy(max_attempts=3, sleep=lambda _: None),
+    )
+
+    # When calling fetch_organization_info
+    fetch_organization_info(["CompanyA"])
+
+    # Then the company is fetched again and sunk
+    assert mock_fetcher.get_raw_organization_information.call_count == 2
+    mock_sinker.sink_organization.assert_called_once_with("clean_raw_CompanyA")
+    metrics.increment.assert_any_call("pipeline.retries")
+    assert fetch_organization_info.failed_companies == []
+
+
+def test_failures_are_isolated_and_dead_lettered(
+    mock_fetcher: MagicMock, mock_cleaner: MagicMock, mock_sinker: MagicMock
+) -> None:
+    # Given a fetcher failing for good on one company
+    def fetch(company: str) -> str:
+        if company == "CompanyB":
+            raise ValueError("Unparsable answer")
+        return f"raw_{company}"
+
+    mock_fetcher.get_raw_organization_information.side_effect = fetch
+    dead_letter = MagicMock(spec=Sinker)
+    fetch_organization_info = FetchOrganizationInformation(
+        fetcher=mock_fetcher,
+        cleaner=mock_cleaner,
+        sinker=mock_sinker,
+        retry_policy=RetryPolicy(max_attempts=3, sleep=lambda _: None),
+        dead_letter=dead_letter,
+    )
+
+    # When calling fetch_organization_info
+    fetch_organization_info(["CompanyA", "CompanyB", "CompanyC"])
+
+    # Then the other companies go through and the failure is dead-lettered once
+    assert mock_fetcher.get_raw_organization_information.call_count == 3
+    mock_sinker.sink_organization.assert_any_call("clean_raw_CompanyA")
+    mock_sinker.sink_organization.assert_any_call("clean_raw_CompanyC")
+    assert mock_sinker.sink_organization.call_count == 2
+
+    failure = dead_letter.sink_organization.call_args.args[0]
+    assert failure.company_name == "CompanyB"
+    assert failure.stage == "fetch"
+    assert failure.failure_kind == FailureKind.PERMANENT
+    assert failure.error_type == "ValueError"
+    assert failure.attempts == 1
+    assert fetch_organization_info.failed_companies == [failure]
+    dead_letter.flush.assert_called_once()
+
+
+def test_clean_failures_keep_the_partial_result(
+    mock_fetcher: MagicMock, mock_cleaner: MagicMock, mock_sinker: MagicMock
+) -> None:
+    # Given a cleaner failing on one record of a batch
+    mock_fetcher.get_raw_organization_information.side_effect = _raw_organization
+
+    def clean(raw_organization: RawOrganization) -> str:
+        if raw_organization.company_name == "CompanyB":
+            raise ValueError("No ISIC classification found")
+        return f"clean_{raw_organization.company_name}"
+
+    mock_cleaner.serialize_to_organization.side_effect = clean
+    mock_cleaner.serialize_to_organizations.side_effect = lambda records: [
+        clean(record) for record in records
+    ]
+    dead_letter = MagicMock(spec=Sinker)
+    fetch_organization_info = FetchOrganizationInformation(
+        fetcher=mock_fetcher,
+        cleaner=mock_cleaner,
+        sinker=mock_sinker,
+        batch_size=3,
+        dead_letter=dead_letter,
+    )
+
+    # When calling fetch_organization_info
+    fetch_organization_info(["CompanyA", "CompanyB", "CompanyC"])
+
+    # Then the rest of the batch is sunk and the raw record is dead-lettered
+    mock_sinker.sink_organization.assert_any_call("clean_CompanyA")
+    mock_sinker.sink_organization.assert_any_call("clean_CompanyC")
+    assert mock_sinker.sink_organization.call_count == 2
+
+    failure = dead_letter.sink_organization.call_args.args[0]
+    assert failure.company_name == "CompanyB"
+    assert failure.stage == "clean"
+    assert failure.partial_result == _raw_organization("CompanyB").model_dump()
+
+
+def test_known_domains_are_passed_to_the_fetcher(
+    mock_fetcher: MagicMock, mock_cleaner: MagicMock, mock_sinker: MagicMock
+) -> None:
+    # Given companies with and without a known domain
+    fetch_organization_info = FetchOrganizationInformation(
+        fetcher=mock_fetcher, cleaner=mock_cleaner, sinker=mock_sinker
+    )
+
+    # When calling fetch_organization_info
+    fetch_organization_info(
+        [Company(name="CompanyA", domain="companya.com"), Company(name="CompanyB")]
+    )
+
+    # Then the domain is only passed along when known
+    mock_fetcher.get_raw_organization_information.assert_any_call(
+        "CompanyA", "companya.com"
+    )
+    mock_fetcher.get_raw_organization_information.assert_any_call("CompanyB")
+
+
+def test_fetch_state_is_saved_after_flush(
+    mock_fetcher: MagicMock, mock_cleaner: MagicMock, mock_sinker: MagicMock
+) -> None:
+    # Given a fetcher reading a page for each company
+    def fetch(company: str) -> str:
+        RawOrganizationFetcher.record_source(
+            PageSource(url=f"https://{company}.com", content_hash="abc")
+        )
+        return f"raw_{company}"
+
+    mock_fetcher.get_raw_organization_information.side_effect = fetch
+    fetch_state = MagicMock(spec=FetchStateStore)
+    events = MagicMock()
+    events.attach_mock(mock_sinker.flush, "sinker_flush")
+    events.attach_mock(fetch_state.flush, "state_flush")
+
+    # When running the use case
+    FetchOrganizationInformation(
+        mock_fetcher, mock_cleaner, mock_sinker, fetch_state=fetch_state
+    )(["CompanyA"])
+
+    # Then the pages read are recorded, and saved after the sinker is flushed
+    record = fetch_state.put.call_args.args[0]
+    assert record.company_name == "CompanyA"
+    assert record.sources == [
+        PageSource(url="https://CompanyA.com", content_hash="abc")
+    ]
+    assert [call[0] for call in events.mock_calls] == ["sinker_flush", "state_flush"]
+
+
+def test_refresh_skips_unchanged_companies(
+    mock_fetcher: MagicMock, mock_cleaner: MagicMock, mock_sinker: MagicMock
+) -> None:
+    # Given a refresh policy finding only CompanyB unchanged
+    fetch_state = MagicMock(spec=FetchStateStore)
+    refresh_policy = MagicMock(spec=RefreshPolicy)
+    refresh_policy.reason.side_effect = lambda record: (
+        RefreshReason.UNCHANGED if record == "record_CompanyB" else RefreshReason.NEW
+    )
+    fetch_state.get.side_effect = lambda company: f"record_{company}"
+
+    # When refreshing
+    FetchOrganizationInformation(
+        mock_fetcher,
+        mock_cleaner,
+        mock_sinker,
+        fetch_state=fetch_state,
+        refresh_policy=refresh_policy,
+    )(["CompanyA", "CompanyB"])
+
+    # Then only the other company goes through the fetcher
+    mock_fetcher.get_raw_organization_information.assert_called_once_with("CompanyA")
+    mock_sinker.sink_organization.assert_called_once_with("clean_raw_CompanyA")
+    assert fetch_state.put.call_count == 1
@@ -0,0 +1,241 @@
+import threading
+from typing import Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from core.ports.fetching import RawOrganizationFetcher
+from infrastructure.adapters.domain_crawler import (
+    DomainCrawler,
+    PolitenessScheduler,
+    RobotsCache,
+    base_url,
+)
+from infrastructure.adapters.metrics_registry import InMemoryMetrics
+
+ROBOTS = """User-agent: *
+Disallow: /contact
+Sitemap: https://acme.com/sitemap_index.xml
+"""
+
+SITEMAP_INDEX = """<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://acme.com/sitemap_pages.xml</loc></sitemap>
+</sitemapindex>
+"""
+
+SITEMAP = """<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://acme.com/our-history</loc></url>
+  <url><loc>https://acme.com/blog/post-1</loc></url>
+  <url><loc>https://other.com/about</loc></url>
+</urlset>
+"""
+
+
+def _response(status_code: int, text: str = "") -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = text.encode()
+    response.encoding = "utf-8"
+    return response
+
+
+@pytest.fixture
+def pages() -> Dict[str, str]:
+    return {
+        "https://acme.com/robots.txt": ROBOTS,
+        "https://acme.com/sitemap_index.xml": SITEMAP_INDEX,
+        "https://acme.com/sitemap_pages.xml": SITEMAP,
+        "https://acme.com/": "<html><body><h1>Acme</h1></body></html>",
+        "https://acme.com/about": (
+            "<html><head><script>var x = 1;</script></head>"
+            "<body><p>Acme was   founded in 1901.</p></body></html>"
+        ),
+        "https://acme.com/contact": "<html><body>Secret</body></html>",
+        "https://acme.com/our-history": "<html><body>A long history</body></html>",
+    }
+
+
+@pytest.fixture
+def session(pages: Dict[str, str]) -> MagicMock:
+    session = MagicMock(spec=requests.Session)
+    session.headers = {}
+    session.get.side_effect = lambda url, **_: (
+        _response(200, pages[url]) if url in pages else _response(404)
+    )
+    return session
+
+
+@pytest.fixture
+def sleeps() -> List[float]:
+    return []
+
+
+@pytest.fixture
+def crawler(session: MagicMock, sleeps: List[float]) -> DomainCrawler:
+    return DomainCrawler(
+        session_factory=lambda: session,
+        scheduler=PolitenessScheduler(min_delay=0.0, sleep=sleeps.append),
+    )
+
+
+def test_crawl_reads_likely_pages(crawler: DomainCrawler, session: MagicMock) -> None:
+    # When crawling a domain
+    pages = crawler.crawl("acme.com")
+
+    # Then the home, about and matching sitemap pages are read as text
+    assert [page.url for page in pages] == [
+        "https://acme.com/",
+        "https://acme.com/about",
+        "https://acme.com/our-history",
+    ]
+    assert pages[1].text == "Acme was founded in 1901."
+
+    # And pages disallowed by robots.txt or on other hosts are never requested
+    requested = [call.args[0] for call in session.get.call_args_list]
+    assert "https://acme.com/contact" not in requested
+    assert "https://other.com/about" not in requested
+    assert "https://acme.com/blog/post-1" not in requested
+
+
+def test_only_content_pages_are_recorded_as_sources(crawler: DomainCrawler) -> None:
+    # When crawling a domain while recording sources
+    with RawOrganizationFetcher.recording_sources() as sources:
+        crawler.crawl("acme.com")
+
+    # Then the pages read are sources, the sitemaps and robots.txt are not
+    assert [source.url for source in sources] == [
+        "https://acme.com/",
+        "https://acme.com/about",
+        "https://acme.com/our-history",
+    ]
+
+
+def test_each_thread_crawls_with_its_own_session(
+    pages: Dict[str, str], sleeps: List[float]
+) -> None:
+    # Given sessions created on demand
+    sessions: List[MagicMock] = []
+
+    def new_session() -> MagicMock:
+        session = MagicMock(spec=requests.Session)
+        session.headers = {}
+        session.get.side_effect = lambda url, **_: (
+            _response(200, pages[url]) if url in pages else _response(404)
+        )
+        sessions.append(session)
+        return session
+
+    metrics = InMemoryMetrics()
+    crawler = DomainCrawler(
+        session_factory=new_session,
+        scheduler=PolitenessScheduler(min_delay=0.0, sleep=sleeps.append),
+        metrics=metrics,
+    )
+
+    # When crawling from the main thread and from another one
+    crawler.crawl("acme.com")
+    thread = threading.Thread(target=crawler.crawl, args=("acme.com",))
+    thread.start()
+    thread.join()
+
+    # Then each thread used its own session, and the bytes read are counted
+    assert len(sessions) == 2
+    assert all(session.get.called for session in sessions)
+    assert metrics.counter("fetch.bytes_downloaded") > 0
+
+
+def test_robots_txt_is_fetched_once(crawler: DomainCrawler, session: MagicMock) -> None:
+    # When crawling the same domain twice
+    crawler.crawl("acme.com")
+    crawler.crawl("https://acme.com/some/page")
+
+    # Then robots.txt is only requested once
+    requested = [call.args[0] for call in session.get.call_args_list]
+    assert requested.count("https://acme.com/robots.txt") == 1
+
+
+def test_slow_robots_txt_does_not_block_other_hosts() -> None:
+    # Given a host whose robots.txt hangs until released
+    release = threading.Event()
+    session = MagicMock(spec=requests.Session)
+    session.get.side_effect = lambda url, **_: (
+        release.wait(5) and _response(404)
+        if url.startswith("https://slow.com")
+        else _response(200, "User-agent: *\nDisallow: /private")
+    )
+    robots = RobotsCache(lambda: session)
+    slow = threading.Thread(target=robots.can_fetch, args=("https://slow.com/",))
+    slow.start()
+
+    # When another host is checked meanwhile
+    # Then it is answered without waiting for the slow host
+    assert not robots.can_fetch("https://fast.com/private")
+    assert slow.is_alive()
+
+    release.set()
+    slow.join()
+    assert robots.can_fetch("https://slow.com/about")
+
+
+def test_robots_txt_is_fetched_once_across_threads() -> None:
+    # Given concurrent checks of the same host
+    session = MagicMock(spec=requests.Session)
+    session.get.return_value = _response(404)
+    robots = RobotsCache(lambda: session)
+    threads = [
+        threading.Thread(target=robots.can_fetch, args=("https://acme.com/",))
+        for _ in range(8)
+    ]
+
+    # When they all run
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Then robots.txt is downloaded once
+    session.get.assert_called_once()
+
+
+def test_missing_robots_and_sitemap(
+    pages: Dict[str, str], crawler: DomainCrawler
+) -> None:
+    # Given a site without robots.txt nor sitemap
+    del pages["https://acme.com/robots.txt"]
+
+    # When crawling it
+    crawled = crawler.crawl("acme.com")
+
+    # Then every default page is allowed
+    assert "https://acme.com/contact" in [page.url for page in crawled]
+
+
+def test_scheduler_spaces_requests_per_host() -> None:
+    # Given a scheduler with a frozen clock
+    sleeps: List[float] = []
+    scheduler = PolitenessScheduler(
+        min_delay=2.0, clock=lambda: 100.0, sleep=sleeps.append
+    )
+
+    # When requesting the same host three times and another host once
+    scheduler.wait("acme.com")
+    scheduler.wait("acme.com")
+    scheduler.wait("other.com")
+    scheduler.wait("acme.com", delay=5.0)
+
+    # Then only the repeated host waits, for its booked slots
+    assert sleeps == [2.0, 4.0]
+
+
+@pytest.mark.parametrize(
+    "domain, expected",
+    [
+        ("acme.com", "https://acme.com"),
+        ("www.acme.com", "https://www.acme.com"),
+        ("http://acme.com/about", "http://acme.com"),
+    ],
+)
+def test_base_url(domain: str, expected: str) -> None:
+    assert base_url(domain) == expected
@@ -3,11 +3,18 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
+from core.domains.budget import BudgetExceededError, TokenBudget
 from core.entities.organizations import RawOrganization
+from infrastructure.adapters.domain_crawler import CrawledPage, DomainCrawler
 from infrastructure.adapters.fetching_agent import (
+    BudgetCallbackHandler,
+    MetricsCallbackHandler,
     RawOrganizationFetcherFromCompanyName,
     RawOrganizationFetcherFromCompanyNameBuilder,
 )
+from infrastructure.adapters.metrics_registry import InMemoryMetrics
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
 
 
 def test_with_standard_rate_limiter() -> None:
@@ -91,6 +98,20 @@ def test_search_company_success() -> None:
         assert result == mock_results
 
 
+def test_search_company_with_backend() -> None:
+    # Given a search backend other than Google
+    backend = MagicMock(return_value=iter(["http://localhost/test"]))
+
+    # When calling search_company with it
+    result = RawOrganizationFetcherFromCompanyNameBuilder.search_company(
+        "Test Company", search_backend=backend
+    )
+
+    # Then the backend results are returned
+    assert result == ["http://localhost/test"]
+    backend.assert_called_once_with("Test Company")
+
+
 def test_search_company_failure() -> None:
     # Given a company name that causes an exception
     with patch(
@@ -139,3 +160,196 @@ def test_fetch_incomplete_result() -> None:
     assert result.countries_activity == ["US"]
     assert result.main_company_domains == ["testcorp.com"]
     agent_mock.invoke.assert_called_once()
+
+
+def test_fetch_records_metrics() -> None:
+    # Given a fetcher with metrics and an incomplete agent result
+    agent_mock = MagicMock()
+    agent_mock.invoke.return_value = {"properties": {"name": "Test Corp"}}
+    llm_mock = MagicMock()
+    metrics = InMemoryMetrics()
+    fetcher = RawOrganizationFetcherFromCompanyName(
+        agent_mock, llm_mock, metrics=metrics
+    )
+
+    # When fetching
+    fetcher.get_raw_organization_information("Test Corp")
+
+    # Then the agent call and formatting are timed
+    assert metrics.counter("fetch.agent_invocations") == 1
+    assert metrics.histogram("fetch.agent").count == 1
+    assert metrics.histogram("fetch.format").count == 1
+
+
+def test_metrics_callback_counts_tokens() -> None:
+    # Given an LLM result reporting its token usage
+    metrics = InMemoryMetrics()
+    handler = MetricsCallbackHandler(metrics)
+    message = AIMessage(
+        content="ok",
+        usage_metadata={"input_tokens": 12, "output_tokens": 3, "total_tokens": 15},
+    )
+
+    # When the LLM call ends while fetching a company
+    with metrics.company("Test Corp"):
+        handler.on_llm_end(LLMResult(generations=[[ChatGeneration(message=message)]]))
+
+    # Then the call and its tokens are attributed to the company
+    assert metrics.counter("llm.calls", company="Test Corp") == 1
+    assert metrics.counter("llm.input_tokens", company="Test Corp") == 12
+    assert metrics.counter("llm.output_tokens", company="Test Corp") == 3
+
+
+def test_instrumented_tool_counts_bytes() -> None:
+    metrics = InMemoryMetrics()
+    builder = RawOrganizationFetcherFromCompanyNameBuilder().with_metrics(metrics)
+
+    tool = builder._instrument("retrieve_page", lambda url: "<html>é</html>")
+
+    assert tool("http://example.com") == "<html>é</html>"
+    assert metrics.counter("tool.retrieve_page.calls") == 1
+    assert metrics.counter("fetch.bytes_downloaded") == 15
+
+
+def test_budget_callback_charges_current_company() -> None:
+    # Given a budget handler and an LLM result reporting 15 tokens
+    budget = TokenBudget(per_company=20)
+    handler = BudgetCallbackHandler(budget)
+    result = LLMResult(
+        generations=[[ChatGeneration(message=AIMessage(content="ok"))]],
+        llm_output={"token_usage": {"prompt_tokens": 12, "completion_tokens": 3}},
+    )
+
+    # When two calls end while fetching a company
+    with InMemoryMetrics().company("Test Corp"):
+        handler.on_llm_end(result)
+        # Then the second one exceeds the budget
+        with pytest.raises(BudgetExceededError):
+            handler.on_llm_end(result)
+
+    assert budget.company_tokens("Test Corp") == 30
+    assert handler.raise_error
+
+
+def test_fetch_charges_the_company_fetched() -> None:
+    # Given a fetcher with a budget, called outside any company context
+    budget = TokenBudget(per_company=100)
+    agent_mock = MagicMock()
+    fetcher = RawOrganizationFetcherFromCompanyName(
+        agent_mock, MagicMock(), budget=budget
+    )
+    result = LLMResult(
+        generations=[[ChatGeneration(message=AIMessage(content="ok"))]],
+        llm_output={"token_usage": {"prompt_tokens": 12, "completion_tokens": 3}},
+    )
+    agent_mock.invoke.side_effect = lambda _, config: (
+        config["callbacks"][-1].on_llm_end(result) or {"properties": {}}
+    )
+
+    # When fetching a company
+    fetcher.get_raw_organization_information("Test Corp")
+
+    # Then its LLM calls are charged to it
+    assert budget.company_tokens("Test Corp") == 15 * agent_mock.invoke.call_count
+
+
+def test_fetch_stops_when_budget_exhausted() -> None:
+    # Given a company which already spent its budget
+    budget = TokenBudget(per_company=10)
+    budget.charge("Test Corp", 10)
+    agent_mock = MagicMock()
+    fetcher = RawOrganizationFetcherFromCompanyName(
+        agent_mock, MagicMock(), budget=budget
+    )
+
+    # When fetching it, Then the agent is not invoked
+    with InMemoryMetrics().company("Test Corp"):
+        with pytest.raises(BudgetExceededError):
+            fetcher.get_raw_organization_information("Test Corp")
+    agent_mock.invoke.assert_not_called()
+
+
+def test_fetch_with_known_domain_skips_search() -> None:
+    # Given a fetcher with a crawler returning pages for the company domain
+    agent_mock = MagicMock()
+    llm_mock = MagicMock()
+    llm_mock.with_structured_output.return_value.invoke.return_value = RawOrganization(
+        company_name="Test Corp",
+        creation_date="2021",
+        employees=20,
+        economic_activity="Software development",
+        products=["A"],
+        product_names=["Product A"],
+        country_origin="US",
+        countries_activity=["US"],
+        main_company_domains=[],
+    )
+    crawler = MagicMock(spec=DomainCrawler)
+    crawler.crawl.return_value = [
+        CrawledPage(
+            "https://testcorp.com/about",
+            "Test Corp, founded in 2021 and headquartered in Austin, is a leader "
+            "in software development. Our 20 employees develop software sold "
+            "in 12 countries under the brands Product A. www.testcorp.com",
+        )
+    ]
+    metrics = InMemoryMetrics()
+    fetcher = RawOrganizationFetcherFromCompanyName(
+        agent_mock, llm_mock, metrics=metrics, crawler=crawler
+    )
+
+    # When fetching with the domain
+    result = fetcher.get_raw_organization_information("Test Corp", "testcorp.com")
+
+    # Then the pages are structured directly, without the agent
+    crawler.crawl.assert_called_once_with("testcorp.com")
+    agent_mock.invoke.assert_not_called()
+    prompt = llm_mock.with_structured_output.return_value.invoke.call_args.args[0]
+    assert "Our 20 employees develop software" in prompt
+    assert result.main_company_domains == ["testcorp.com"]
+    assert metrics.counter("fetch.search_skipped") == 1
+
+
+def test_fetch_falls_back_to_search_when_nothing_is_crawled() -> None:
+    # Given a crawler that could not read any page
+    agent_mock = MagicMock()
+    agent_mock.invoke.return_value = {"properties": {"name": "Test Corp"}}
+    crawler = MagicMock(spec=DomainCrawler)
+    crawler.crawl.return_value = []
+    fetcher = RawOrganizationFetcherFromCompanyName(
+        agent_mock, MagicMock(), crawler=crawler
+    )
+
+    # When fetching with the domain
+    fetcher.get_raw_organization_information("Test Corp", "testcorp.com")
+
+    # Then the agent searches the web as usual
+    agent_mock.invoke.assert_called()
+
+
+def test_fetch_falls_back_to_search_when_the_crawl_is_thin() -> None:
+    # Given a crawler that only read a cookie wall
+    agent_mock = MagicMock()
+    agent_mock.invoke.return_value = {"properties": {"name": "Test Corp"}}
+    llm_mock = MagicMock()
+    crawler = MagicMock(spec=DomainCrawler)
+    crawler.crawl.return_value = [
+        CrawledPage("https://testcorp.com/", "We use cookies. Accept all.")
+    ]
+    metrics = InMemoryMetrics()
+    fetcher = RawOrganizationFetcherFromCompanyName(
+        agent_mock, llm_mock, metrics=metrics, crawler=crawler
+    )
+
+    # When fetching with the domain
+    fetcher.get_raw_organization_information("Test Corp", "testcorp.com")
+
+    # Then the agent searches the web rather than structuring the cookie wall
+    agent_mock.invoke.assert_called()
+    prompts = [
+        call.args[0]
+        for call in llm_mock.with_structured_output.return_value.invoke.call_args_list
+    ]
+    assert not any("We use cookies" in prompt for prompt in prompts)
+    assert metrics.counter("fetch.thin_crawls") == 1
+    assert metrics.counter("fetch.search_skipped") == 0
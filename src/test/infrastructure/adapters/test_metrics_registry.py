@@ -0,0 +1,80 @@
+import json
+
+import pytest
+from infrastructure.adapters.metrics_registry import (
+    Histogram,
+    InMemoryMetrics,
+    PrometheusFileExporter,
+)
+
+
+@pytest.fixture
+def metrics() -> InMemoryMetrics:
+    return InMemoryMetrics(buckets=(0.1, 1.0, 10.0))
+
+
+def test_histogram_summary() -> None:
+    histogram = Histogram(buckets=(0.1, 1.0, 10.0))
+    for value in [0.05, 0.5, 0.5, 5.0]:
+        histogram.observe(value)
+
+    summary = histogram.summary()
+    assert summary["count"] == 4
+    assert summary["sum"] == pytest.approx(6.05)
+    assert summary["p50"] == 1.0
+    assert summary["p99"] == 5.0
+
+
+def test_counters_are_attributed_to_company(metrics: InMemoryMetrics) -> None:
+    # Given counters incremented in and out of a company block
+    with metrics.company("CompanyA"):
+        metrics.increment("llm.calls", 2)
+    metrics.increment("llm.calls")
+
+    # Then the global and per company counters are kept apart
+    assert metrics.counter("llm.calls") == 3
+    assert metrics.counter("llm.calls", company="CompanyA") == 2
+    assert metrics.summary()["companies"] == {"CompanyA": {"llm.calls": 2}}
+
+
+def test_timer_observes_latency(metrics: InMemoryMetrics) -> None:
+    with metrics.timer("fetch.agent"):
+        pass
+
+    histogram = metrics.histogram("fetch.agent")
+    assert histogram is not None
+    assert histogram.count == 1
+
+
+def test_to_prometheus(metrics: InMemoryMetrics) -> None:
+    metrics.observe("fetch.agent", 0.5)
+    metrics.observe("fetch.agent", 20.0)
+    metrics.increment("fetch.bytes_downloaded", 1024)
+
+    text = metrics.to_prometheus()
+
+    assert "# TYPE organization_fetcher_fetch_agent_seconds histogram" in text
+    assert 'organization_fetcher_fetch_agent_seconds_bucket{le="1.0"} 1' in text
+    assert 'organization_fetcher_fetch_agent_seconds_bucket{le="+Inf"} 2' in text
+    assert "organization_fetcher_fetch_agent_seconds_count 2" in text
+    assert "organization_fetcher_fetch_bytes_downloaded_total 1024" in text
+
+
+def test_write_json(metrics: InMemoryMetrics, tmp_path) -> None:
+    metrics.increment("pipeline.companies")
+    path = tmp_path / "metrics.json"
+
+    metrics.write_json(str(path))
+
+    assert json.loads(path.read_text())["counters"] == {"pipeline.companies": 1}
+
+
+def test_prometheus_exporter_writes_on_close(
+    metrics: InMemoryMetrics, tmp_path
+) -> None:
+    path = tmp_path / "metrics.prom"
+
+    with PrometheusFileExporter(metrics, str(path), interval=60):
+        metrics.increment("pipeline.companies")
+
+    assert "organization_fetcher_pipeline_companies_total 1" in path.read_text()
@@ -0,0 +1,204 @@
+import threading
+import time
+from typing import Dict, List
+
+import pytest
+from infrastructure.adapters.metrics_registry import InMemoryMetrics
+from infrastructure.adapters.page_retriever import (
+    ConcurrentPageRetriever,
+    LatencyTracker,
+)
+
+COMPLETE_PAGE = (
+    "<p>Acme is a leader in industrial tools, founded in 1901 and headquartered "
+    "in Lyon. Our 2,500 employees design products sold in 40 countries under "
+    "the Anvilo brand. www.acme.com</p>"
+)
+
+
+@pytest.fixture
+def metrics() -> InMemoryMetrics:
+    return InMemoryMetrics()
+
+
+def test_retrieves_pages_in_input_order(metrics: InMemoryMetrics) -> None:
+    # Given pages answering in reverse order
+    delays = {"https://a.com/1": 0.1, "https://b.com/2": 0.0}
+    retriever = ConcurrentPageRetriever(
+        fetch=lambda url: time.sleep(delays[url]) or f"<p>{url}</p>",
+        metrics=metrics,
+    )
+
+    # When retrieving them
+    pages = retriever.retrieve(
+        ["https://a.com/1", "https://b.com/2", "https://a.com/1"]
+    )
+
+    # Then each page is fetched once and returned in input order
+    assert [page.url for page in pages] == ["https://a.com/1", "https://b.com/2"]
+    assert pages[0].text == "https://a.com/1"
+    assert metrics.counter("pages.requests") == 2
+
+
+def test_failed_pages_are_skipped() -> None:
+    # Given a page that cannot be fetched
+    def fetch(url: str) -> str:
+        if "broken" in url:
+            raise ValueError("404")
+        return "<p>ok</p>"
+
+    retriever = ConcurrentPageRetriever(fetch=fetch)
+
+    # When retrieving it with another page
+    pages = retriever.retrieve(["https://a.com/broken", "https://a.com/ok"])
+
+    # Then only the other page is returned
+    assert [page.url for page in pages] == ["https://a.com/ok"]
+
+
+def test_stops_once_every_field_is_covered(metrics: InMemoryMetrics) -> None:
+    # Given a complete page and a page that never answers in time
+    release = threading.Event()
+
+    def fetch(url: str) -> str:
+        if "slow" in url:
+            release.wait(5)
+        return COMPLETE_PAGE
+
+    retriever = ConcurrentPageRetriever(fetch=fetch, metrics=metrics)
+
+    # When retrieving both
+    start = time.monotonic()
+    pages = retriever.retrieve(["https://slow.com/", "https://acme.com/about"])
+    elapsed = time.monotonic() - start
+    release.set()
+
+    # Then the complete page is enough
+    assert [page.url for page in pages] == ["https://acme.com/about"]
+    assert elapsed < 1
+    assert metrics.counter("pages.early_stops") == 1
+
+
+def test_stragglers_are_hedged(metrics: InMemoryMetrics) -> None:
+    # Given a page whose first request hangs
+    calls: List[str] = []
+    release = threading.Event()
+
+    def fetch(url: str) -> str:
+        calls.append(url)
+        if len(calls) == 1:
+            release.wait(5)
+        return "<p>page</p>"
+
+    retriever = ConcurrentPageRetriever(
+        fetch=fetch,
+        latencies=LatencyTracker(initial_delay=0.05),
+        metrics=metrics,
+    )
+
+    # When retrieving it
+    start = time.monotonic()
+    pages = retriever.retrieve(["https://a.com/"])
+    elapsed = time.monotonic() - start
+    release.set()
+
+    # Then the duplicate request answers first
+    assert [page.url for page in pages] == ["https://a.com/"]
+    assert calls == ["https://a.com/", "https://a.com/"]
+    assert elapsed < 1
+    assert metrics.counter("pages.hedged") == 1
+
+
+def test_requests_per_host_are_limited() -> None:
+    # Given pages on the same host recording how many run at once
+    lock = threading.Lock()
+    active: Dict[str, int] = {"now": 0, "max": 0}
+
+    def fetch(url: str) -> str:
+        with lock:
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+        time.sleep(0.02)
+        with lock:
+            active["now"] -= 1
+        return "<p>page</p>"
+
+    retriever = ConcurrentPageRetriever(
+        fetch=fetch, per_host=2, latencies=LatencyTracker(initial_delay=10)
+    )
+
+    # When retrieving them
+    pages = retriever.retrieve([f"https://a.com/{i}" for i in range(6)])
+
+    # Then no more than two requests ran at once
+    assert len(pages) == 6
+    assert active["max"] == 2
+
+
+def test_host_limit_does_not_hold_workers() -> None:
+    # Given a single worker and a host whose requests hang
+    release = threading.Event()
+
+    def fetch(url: str) -> str:
+        if "slow" in url:
+            release.wait(5)
+            return "<p>slow</p>"
+        return COMPLETE_PAGE
+
+    retriever = ConcurrentPageRetriever(
+        fetch=fetch,
+        max_workers=2,
+        per_host=1,
+        latencies=LatencyTracker(initial_delay=10),
+    )
+
+    # When retrieving several pages of that host before a page of another one
+    start = time.monotonic()
+    pages = retriever.retrieve(
+        [f"https://slow.com/{i}" for i in range(3)] + ["https://acme.com/about"]
+    )
+    elapsed = time.monotonic() - start
+    release.set()
+
+    # Then the queued requests of the slow host leave a worker to the other host
+    assert [page.url for page in pages] == ["https://acme.com/about"]
+    assert elapsed < 1
+
+
+def test_hedge_delay_follows_latency_percentile() -> None:
+    # Given a tracker with enough samples
+    tracker = LatencyTracker(quantile=0.9, min_samples=10, initial_delay=2.0)
+    assert tracker.hedge_delay() == 2.0
+
+    # When recording latencies
+    for latency in range(1, 11):
+        tracker.record(latency / 10)
+
+    # Then the hedge delay is the 90th percentile, not the slowest latency
+    assert tracker.hedge_delay() == pytest.approx(0.9)
+
+
+def test_hedge_delay_of_extreme_quantiles() -> None:
+    # Given trackers at the lowest and highest quantiles
+    lowest = LatencyTracker(quantile=0.0, min_samples=1, min_delay=0.0)
+    highest = LatencyTracker(quantile=1.0, min_samples=1, min_delay=0.0)
+
+    # When recording latencies
+    for latency in (0.3, 0.1, 0.2):
+        lowest.record(latency)
+        highest.record(latency)
+
+    # Then the delay stays within the latencies seen
+    assert lowest.hedge_delay() == pytest.approx(0.1)
+    assert highest.hedge_delay() == pytest.approx(0.3)
+
+
+def test_tool_input_accepts_search_results() -> None:
+    # Given a retriever used as an agent tool
+    retriever = ConcurrentPageRetriever(fetch=lambda url: "<p>About us</p>")
+
+    # When called with the output of search_company
+    output = retriever("['https://a.com/about', 'https://b.com/']")
+
+    # Then both pages are returned with their URL
+    assert output == "https://a.com/about\nAbout us\n\nhttps://b.com/\nAbout us"
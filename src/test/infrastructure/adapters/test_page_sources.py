@@ -0,0 +1,200 @@
+import threading
+from typing import Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from core.entities.sources import PageSource
+from core.ports.fetching import RawOrganizationFetcher
+from infrastructure.adapters.domain_crawler import PolitenessScheduler, RobotsCache
+from infrastructure.adapters.metrics_registry import InMemoryMetrics
+from infrastructure.adapters.page_sources import (
+    HttpSourceChangeDetector,
+    content_hash,
+    record_page,
+)
+
+PAGE = "<html><body><p>Acme makes anvils.</p></body></html>"
+
+
+def _response(
+    status_code: int, text: str = "", headers: Dict[str, str] = {}
+) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = text.encode()
+    response.encoding = "utf-8"
+    response.headers.update(headers)
+    return response
+
+
+@pytest.fixture
+def session() -> MagicMock:
+    session = MagicMock(spec=requests.Session)
+    session.headers = {}
+    return session
+
+
+@pytest.fixture
+def robots() -> MagicMock:
+    robots = MagicMock(spec=RobotsCache)
+    robots.can_fetch.return_value = True
+    robots.crawl_delay.return_value = None
+    return robots
+
+
+@pytest.fixture
+def scheduler() -> MagicMock:
+    return MagicMock(spec=PolitenessScheduler)
+
+
+@pytest.fixture
+def detector(
+    session: MagicMock, robots: MagicMock, scheduler: MagicMock
+) -> HttpSourceChangeDetector:
+    return HttpSourceChangeDetector(robots, scheduler, session_factory=lambda: session)
+
+
+@pytest.fixture
+def source() -> PageSource:
+    return PageSource(
+        url="https://acme.com/about",
+        content_hash=content_hash(PAGE),
+        etag='"v1"',
+        last_modified="Wed, 01 May 2024 00:00:00 GMT",
+    )
+
+
+def test_content_hash_ignores_markup() -> None:
+    assert content_hash(PAGE) == content_hash(
+        "<html><head><script>var nonce = 42;</script></head>"
+        "<body><div>Acme makes   anvils.</div></body></html>"
+    )
+    assert content_hash(PAGE) != content_hash("<p>Acme makes hammers.</p>")
+
+
+def test_not_modified_page(
+    detector: HttpSourceChangeDetector, session: MagicMock, source: PageSource
+) -> None:
+    # Given a server answering 304 Not Modified
+    session.get.return_value = _response(304)
+
+    # When checking the page
+    changed = detector.has_changed(source)
+
+    # Then it is unchanged and the request was conditional
+    assert not changed
+    headers = session.get.call_args.kwargs["headers"]
+    assert headers == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Wed, 01 May 2024 00:00:00 GMT",
+    }
+
+
+@pytest.mark.parametrize(
+    "response, expected",
+    [
+        (_response(200, PAGE), False),
+        (_response(200, "<p>Acme makes hammers.</p>"), True),
+        (_response(404), True),
+    ],
+)
+def test_page_compared_by_hash(
+    detector: HttpSourceChangeDetector,
+    session: MagicMock,
+    source: PageSource,
+    response: requests.Response,
+    expected: bool,
+) -> None:
+    session.get.return_value = response
+    assert detector.has_changed(source) is expected
+
+
+def test_unreachable_page_counts_as_changed(
+    detector: HttpSourceChangeDetector, session: MagicMock, source: PageSource
+) -> None:
+    session.get.side_effect = requests.ConnectionError()
+    assert detector.has_changed(source)
+
+
+def test_probes_respect_robots_and_politeness(
+    detector: HttpSourceChangeDetector,
+    session: MagicMock,
+    robots: MagicMock,
+    scheduler: MagicMock,
+    source: PageSource,
+) -> None:
+    # Given a host asking for a crawl delay
+    robots.crawl_delay.return_value = 5.0
+    session.get.return_value = _response(304)
+
+    # When checking a page
+    detector.has_changed(source)
+
+    # Then the probe waited for its politeness slot
+    robots.crawl_delay.assert_called_once_with("https://acme.com")
+    scheduler.wait.assert_called_once_with("acme.com", 5.0)
+
+
+def test_disallowed_page_is_not_probed(
+    session: MagicMock, robots: MagicMock, scheduler: MagicMock, source: PageSource
+) -> None:
+    # Given a page robots.txt no longer allows
+    robots.can_fetch.return_value = False
+    metrics = InMemoryMetrics()
+    detector = HttpSourceChangeDetector(
+        robots, scheduler, session_factory=lambda: session, metrics=metrics
+    )
+
+    # When checking it
+    changed = detector.has_changed(source)
+
+    # Then it counts as changed without any request
+    assert changed
+    session.get.assert_not_called()
+    scheduler.wait.assert_not_called()
+    assert metrics.counter("refresh.disallowed") == 1
+
+
+def test_each_thread_probes_with_its_own_session(
+    robots: MagicMock, scheduler: MagicMock, source: PageSource
+) -> None:
+    # Given sessions created on demand
+    sessions: List[MagicMock] = []
+
+    def new_session() -> MagicMock:
+        session = MagicMock(spec=requests.Session)
+        session.headers = {}
+        session.get.return_value = _response(304)
+        sessions.append(session)
+        return session
+
+    detector = HttpSourceChangeDetector(robots, scheduler, session_factory=new_session)
+
+    # When checking pages twice from the main thread and once from another
+    detector.has_changed(source)
+    detector.has_changed(source)
+    thread = threading.Thread(target=detector.has_changed, args=(source,))
+    thread.start()
+    thread.join()
+
+    # Then each thread reused a session of its own
+    assert len(sessions) == 2
+    assert [session.get.call_count for session in sessions] == [2, 1]
+
+
+def test_record_page_only_while_recording() -> None:
+    # Given a downloaded page
+    response = _response(200, PAGE, {"ETag": '"v1"'})
+
+    # When recording it inside and outside a recording block
+    record_page("https://acme.com/ignored", response)
+    with RawOrganizationFetcher.recording_sources() as sources:
+        record_page("https://acme.com/about", response)
+
+    # Then only the page read inside the block is kept
+    assert sources == [
+        PageSource(
+            url="https://acme.com/about", content_hash=content_hash(PAGE), etag='"v1"'
+        )
+    ]
@@ -0,0 +1,35 @@
+import httpx
+import pytest
+import requests
+from infrastructure.adapters.transient_errors import is_transient_error
+
+
+def _requests_http_error(status_code: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.HTTPError(response=response)
+
+
+def _httpx_status_error(status_code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://example.com")
+    response = httpx.Response(status_code, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (requests.ConnectionError(), True),
+        (requests.Timeout(), True),
+        (_requests_http_error(429), True),
+        (_requests_http_error(503), True),
+        (_requests_http_error(404), False),
+        (httpx.ReadTimeout("slow"), True),
+        (httpx.ConnectError("refused"), True),
+        (_httpx_status_error(502), True),
+        (_httpx_status_error(401), False),
+        (ValueError("bad input"), False),
+    ],
+)
+def test_is_transient_error(error: BaseException, expected: bool) -> None:
+    assert is_transient_error(error) is expected
@@ -0,0 +1,112 @@
+import json
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from core.entities.organizations import Company
+from infrastructure.repositories.company_sources import (
+    CsvCompanySource,
+    JsonlCompanySource,
+    ParquetCompanySource,
+    open_company_source,
+)
+
+RECORDS = [
+    {"name": "Ikea", "domain": "www.ikea.com", "priority": 2, "country": "SE"},
+    {"name": "Apple", "domain": "", "priority": None, "country": "US"},
+]
+EXPECTED = [
+    Company(
+        name="Ikea", domain="www.ikea.com", priority=2, attributes={"country": "SE"}
+    ),
+    Company(name="Apple", attributes={"country": "US"}),
+]
+
+
+def test_csv_with_header(tmp_path: Path) -> None:
+    # Given a CSV file with a header
+    path = tmp_path / "companies.csv"
+    path.write_text(
+        "name,domain,priority,country\nIkea,www.ikea.com,2,SE\nApple,,,US\n"
+    )
+
+    # When reading it
+    companies = list(CsvCompanySource(str(path)))
+
+    # Then every column is carried
+    assert companies == EXPECTED
+
+
+def test_invalid_priority_is_ignored(tmp_path: Path, caplog) -> None:
+    # Given a CSV file with a priority that is not a number
+    path = tmp_path / "companies.csv"
+    path.write_text("name,priority\nIkea,high\nApple,3\n")
+
+    # When reading it
+    companies = list(CsvCompanySource(str(path)))
+
+    # Then the company is kept without priority and the record is logged
+    assert companies == [Company(name="Ikea"), Company(name="Apple", priority=3)]
+    assert "'high' of record 1" in caplog.text
+
+
+def test_csv_without_header(tmp_path: Path) -> None:
+    # Given a headerless CSV file with an optional domain column
+    path = tmp_path / "companies.csv"
+    path.write_text("Ikea,www.ikea.com\nApple\n\n , \n")
+
+    # When reading it
+    companies = list(CsvCompanySource(str(path), has_header=False))
+
+    # Then names and domains are read and blank names skipped
+    assert companies == [
+        Company(name="Ikea", domain="www.ikea.com"),
+        Company(name="Apple"),
+    ]
+
+
+def test_jsonl(tmp_path: Path) -> None:
+    # Given a JSONL file
+    path = tmp_path / "companies.jsonl"
+    path.write_text("\n".join(json.dumps(record) for record in RECORDS) + "\n")
+
+    # When reading it
+    companies = list(JsonlCompanySource(str(path)))
+
+    # Then every field is carried
+    assert companies == EXPECTED
+
+
+def test_parquet_in_batches(tmp_path: Path) -> None:
+    # Given a Parquet file
+    path = tmp_path / "companies.parquet"
+    pq.write_table(pa.Table.from_pylist(RECORDS), path)
+
+    # When reading it one record at a time
+    companies = list(ParquetCompanySource(str(path), batch_size=1))
+
+    # Then every field is carried
+    assert companies == EXPECTED
+
+
+def test_custom_columns(tmp_path: Path) -> None:
+    # Given a JSONL file with other column names
+    path = tmp_path / "companies.jsonl"
+    path.write_text(json.dumps({"company": "Ikea", "website": "ikea.com"}) + "\n")
+
+    # When reading it with the matching columns
+    companies = list(
+        open_company_source(str(path), name_column="company", domain_column="website")
+    )
+
+    # Then they are mapped to the company
+    assert companies == [Company(name="Ikea", domain="ikea.com")]
+
+
+def test_open_company_source_by_extension(tmp_path: Path) -> None:
+    assert isinstance(open_company_source("a.CSV"), CsvCompanySource)
+    assert isinstance(open_company_source("a.jsonl"), JsonlCompanySource)
+    assert isinstance(open_company_source("a.parquet"), ParquetCompanySource)
+    with pytest.raises(ValueError, match="Unsupported company list"):
+        open_company_source("a.xlsx")
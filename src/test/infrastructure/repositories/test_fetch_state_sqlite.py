@@ -0,0 +1,49 @@
+from datetime import datetime, timezone
+from pathlib import Path
+
+from core.entities.sources import FetchRecord, PageSource
+from infrastructure.repositories.fetch_state_sqlite import SqliteFetchStateStore
+
+RECORD = FetchRecord(
+    company_name="Acme",
+    fetched_at=datetime(2024, 6, 1, 12, 30, tzinfo=timezone.utc),
+    sources=[
+        PageSource(url="https://acme.com/about", content_hash="abc", etag='"v1"'),
+    ],
+)
+
+
+def test_records_are_persisted_on_flush(tmp_path: Path) -> None:
+    # Given a store with a record put but not flushed
+    path = str(tmp_path / "state.sqlite")
+    store = SqliteFetchStateStore(path)
+    store.put(RECORD)
+
+    # Then it is readable from the store but not yet from the database
+    assert store.get("Acme") == RECORD
+    with SqliteFetchStateStore(path) as other:
+        assert other.get("Acme") is None
+
+    # When closing the store
+    store.close()
+
+    # Then the record survives
+    with SqliteFetchStateStore(path) as reopened:
+        assert reopened.get("Acme") == RECORD
+        assert reopened.get("Unknown") is None
+
+
+def test_later_record_replaces_earlier(tmp_path: Path) -> None:
+    # Given a record saved twice
+    path = str(tmp_path / "state.sqlite")
+    newer = RECORD.model_copy(
+        update={"fetched_at": datetime(2024, 7, 1, tzinfo=timezone.utc), "sources": []}
+    )
+    with SqliteFetchStateStore(path) as store:
+        store.put(RECORD)
+        store.flush()
+        store.put(newer)
+
+    # When reading it back, Then the latest one is kept
+    with SqliteFetchStateStore(path) as store:
+        assert store.get("Acme") == newer
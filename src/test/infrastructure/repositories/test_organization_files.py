@@ -0,0 +1,79 @@
+from datetime import date
+
+import pytest
+from core.entities.organizations import EmployeeRange, Industry, Organization, Product
+from infrastructure.repositories.organization_files import (
+    merge_organizations,
+    open_sinker,
+    read_organizations,
+)
+from infrastructure.repositories.sinker_jsonl import SinkerJsonl
+from infrastructure.repositories.sinker_parquet import SinkerParquet
+from infrastructure.repositories.sinker_sqlite import SinkerSqlite
+
+
+def _organization(name: str, employees: EmployeeRange) -> Organization:
+    return Organization(
+        company_name=name,
+        creation_date=date(1976, 4, 1),
+        employees=employees,
+        economic_activity_raw="Software",
+        economic_activity=Industry(isic_id="6201", value="Programming"),
+        products_raw=["Computers"],
+        products=[Product(cpc_id="452", value="Computers")],
+        country_origin="USA",
+        countries_activity=["USA"],
+        main_company_domains=[f"{name.lower()}.com"],
+    )
+
+
+def test_open_sinker_by_extension(tmp_path) -> None:
+    # When opening outputs by extension, Then the matching sinker is picked
+    with open_sinker(str(tmp_path / "out.jsonl")) as sinker:
+        assert isinstance(sinker, SinkerJsonl)
+    with open_sinker(str(tmp_path / "out.sqlite")) as sinker:
+        assert isinstance(sinker, SinkerSqlite)
+
+    # And an unknown extension is rejected
+    with pytest.raises(ValueError, match="Unsupported output"):
+        open_sinker(str(tmp_path / "out.xlsx"))
+
+
+@pytest.mark.parametrize(
+    "extension, sinker_class", [("jsonl", SinkerJsonl), ("parquet", SinkerParquet)]
+)
+def test_read_organizations_round_trip(tmp_path, extension, sinker_class) -> None:
+    # Given an organization written by a sinker
+    path = str(tmp_path / f"out.{extension}")
+    organization = _organization("Apple", EmployeeRange.RANGE_11_50)
+    with sinker_class(path) as sinker:
+        sinker.sink_organization(organization)
+
+    # When reading it back, Then it is unchanged
+    assert list(read_organizations(path)) == [organization]
+
+
+def test_read_organizations_rejects_csv(tmp_path) -> None:
+    with pytest.raises(ValueError, match="Cannot read organizations"):
+        list(read_organizations(str(tmp_path / "out.csv")))
+
+
+def test_merge_organizations_later_file_wins(tmp_path) -> None:
+    # Given two runs sharing a company
+    first, second = str(tmp_path / "first.jsonl"), str(tmp_path / "second.parquet")
+    with SinkerJsonl(first) as sinker:
+        sinker.sink_organization(_organization("Apple", EmployeeRange.RANGE_11_50))
+        sinker.sink_organization(_organization("Google", EmployeeRange.RANGE_11_50))
+    with SinkerParquet(second) as sinker:
+        sinker.sink_organization(_organization("Apple", EmployeeRange.RANGE_51_200))
+
+    # When merging them
+    output = str(tmp_path / "merged.jsonl")
+    with SinkerJsonl(output) as sinker:
+        count = merge_organizations([first, second], sinker)
+
+    # Then each company is written once, with the record of the later run
+    merged = {org.company_name: org for org in read_organizations(output)}
+    assert count == 2
+    assert merged["Apple"].employees == EmployeeRange.RANGE_51_200
+    assert merged["Google"].employees == EmployeeRange.RANGE_11_50
@@ -1,20 +1,24 @@
-import os
 from typing import Callable
 from unittest.mock import MagicMock, patch
 
 import numpy as np
-import pandas as pd
 import pytest
+from core.ports.referential import ReferentialMatch
 from infrastructure.repositories.referential_csv import (
     CsvReferential,
     CsvReferentialBuilder,
+    ReferentialData,
 )
 
 
 @pytest.fixture
 def mock_embedding_model() -> MagicMock:
     model: MagicMock = MagicMock()
-    model.encode.side_effect = lambda x, convert_to_numpy: np.array([1.0, 2.0, 3.0])
+    model.encode.side_effect = lambda x, convert_to_numpy: (
+        np.array([[1.0, 2.0, 3.0]] * len(x))
+        if isinstance(x, list)
+        else np.array([1.0, 2.0, 3.0])
+    )
     return model
 
 
@@ -24,93 +28,151 @@ def mock_similarity_fn() -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
 
 
 @pytest.fixture
-def sample_data() -> pd.DataFrame:
-    return pd.DataFrame(
-        {
-            "key": ["Title1", "Title2", "Title3"],
-            "value": ["Value1", "Value2", "Value3"],
-            "embedding": [
-                np.array([1, 0, 0]),
-                np.array([0, 1, 0]),
-                np.array([0, 0, 1]),
-            ],
-        }
+def sample_data() -> ReferentialData:
+    return ReferentialData(
+        keys=np.array(["Title1", "Title2", "Title3"]),
+        values=np.array(["Value1", "Value2", "Value3"]),
+        embeddings=np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]], dtype=np.float32),
     )
 
 
 def test_get_closest_match(
     mock_embedding_model: MagicMock,
     mock_similarity_fn: Callable[[np.ndarray, np.ndarray], np.ndarray],
-    sample_data: pd.DataFrame,
+    sample_data: ReferentialData,
 ) -> None:
     csv_referential = CsvReferential(
         sample_data, mock_embedding_model, mock_similarity_fn
     )
     result = csv_referential.get_closest_match("test query")
-    assert isinstance(result, dict)
-    assert result["key"] == "Title1"
+    assert result == ReferentialMatch(key="Title1", value="Value1")
 
 
-@pytest.fixture
-def mock_cache_path() -> str:
-    return ".tmp/test_cache.npz"
+def test_get_closest_match_default_similarity(
+    mock_embedding_model: MagicMock, sample_data: ReferentialData
+) -> None:
+    # Query embedding [1, 2, 3] is closest to the third axis
+    csv_referential = CsvReferential(sample_data, mock_embedding_model)
+    result = csv_referential.get_closest_match("test query")
+    assert result == ReferentialMatch(key="Title3", value="Value3")
 
 
-@patch("os.path.exists", return_value=True)
-@patch("numpy.load")
-def test_load_cached_data(mock_np_load: MagicMock, mock_cache_path: str) -> None:
-    mock_np_load.return_value = {
-        "data": np.array(["Title1", "Title2", "Title3"]),
-        "embeddings": np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]]),
-    }
-    result = CsvReferentialBuilder._load_cached_data(mock_cache_path)
-    assert isinstance(result, pd.DataFrame)
-    assert isinstance(result["embedding"].iloc[0], np.ndarray)
+def test_get_closest_matches(sample_data: ReferentialData) -> None:
+    # Given a model embedding each query on one axis
+    embedding_model = MagicMock()
+    embedding_model.encode.return_value = np.array([[0, 2, 0], [3, 0, 0]])
+    csv_referential = CsvReferential(sample_data, embedding_model)
 
+    # When matching several values at once
+    result = csv_referential.get_closest_matches(["second", "first"])
 
-@patch("pandas.read_csv")
-def test_generate_embeddings(
-    mock_read_csv: MagicMock, mock_embedding_model: MagicMock
-) -> None:
-    mock_read_csv.return_value = pd.DataFrame(
-        {"key": ["Test1", "Test2"], "value": ["Value1", "Value2"]}
-    )
-    result = CsvReferentialBuilder._generate_embeddings(
-        mock_read_csv.return_value, mock_embedding_model
+    # Then they are encoded in a single call
+    embedding_model.encode.assert_called_once_with(
+        ["second", "first"], convert_to_numpy=True
     )
-    assert "embedding" in result.columns
-    assert isinstance(result["embedding"].iloc[0], np.ndarray)
+    assert result == [
+        ReferentialMatch(key="Title2", value="Value2"),
+        ReferentialMatch(key="Title1", value="Value1"),
+    ]
 
 
-@patch("numpy.savez")
-def test_save_cache(
-    mock_npy_save: MagicMock, sample_data: pd.DataFrame, mock_cache_path: str
+def test_referential_is_read_only(
+    mock_embedding_model: MagicMock, sample_data: ReferentialData
 ) -> None:
-    CsvReferentialBuilder._save_cache(sample_data, mock_cache_path)
-    mock_npy_save.assert_called_once()
+    csv_referential = CsvReferential(sample_data, mock_embedding_model)
+    with pytest.raises(ValueError):
+        csv_referential._embeddings[0, 0] = 5.0
 
+    # And the caller's arrays stay writable
+    sample_data.keys[0] = "Changed"
+    sample_data.embeddings[0, 0] = 5.0
+    assert csv_referential._keys[0] == "Title1"
 
-@patch("pandas.read_csv")
-def test_load_data_without_cache(
-    mock_read_csv: MagicMock,
+
+def test_referential_keeps_normalized_embeddings_only(
     mock_embedding_model: MagicMock,
-    sample_data: pd.DataFrame,
-    mock_cache_path: str,
 ) -> None:
-    os.makedirs(os.path.dirname(mock_cache_path), exist_ok=True)
+    # Given embeddings of different lengths
+    data = ReferentialData(
+        keys=np.array(["A", "B"]),
+        values=np.array(["a", "b"]),
+        embeddings=np.array([[3.0, 4.0], [0.0, 2.0]]),
+    )
+
+    # When building the referential
+    csv_referential = CsvReferential(data, mock_embedding_model)
+
+    # Then it keeps a single unit-length float32 matrix
+    assert csv_referential._embeddings.dtype == np.float32
+    np.testing.assert_allclose(csv_referential._embeddings, [[0.6, 0.8], [0, 1]])
+    assert not hasattr(csv_referential, "_normalized_embeddings")
+
+
+def test_read_csv(tmp_path) -> None:
+    csv_path = tmp_path / "referential.csv"
+    csv_path.write_text(
+        'Code,Title,Change\n01,"Crop, animal",\n011,Growing,changed\n',
+        encoding="utf-8",
+    )
+    keys, values = CsvReferentialBuilder._read_csv(str(csv_path))
+    assert keys == ["01", "011"]
+    assert values == ["Crop, animal", "Growing"]
+
+
+def test_generate_embeddings(mock_embedding_model: MagicMock) -> None:
+    result = CsvReferentialBuilder._generate_embeddings(
+        ["Value1", "Value2"], mock_embedding_model
+    )
+    assert result.shape == (2, 3)
+    assert result.dtype == np.float32
+    mock_embedding_model.encode.assert_called_once()
+
+
+def test_save_and_load_cache(sample_data: ReferentialData, tmp_path) -> None:
+    cache_path = str(tmp_path / "test_cache.npz")
+    CsvReferentialBuilder._save_cache(sample_data, cache_path)
+    result = CsvReferentialBuilder._load_cached_data(cache_path)
+    assert result is not None
+    assert list(result.keys) == ["Title1", "Title2", "Title3"]
+    assert list(result.values) == ["Value1", "Value2", "Value3"]
+    np.testing.assert_array_equal(result.embeddings, sample_data.embeddings)
+
+
+def test_load_outdated_cache(tmp_path) -> None:
+    cache_path = str(tmp_path / "test_cache.npz")
+    np.savez(cache_path, data=np.array(["Title1"]), embeddings=np.eye(1))
+    assert CsvReferentialBuilder._load_cached_data(cache_path) is None
+
+
+def test_load_data_without_cache(mock_embedding_model: MagicMock, tmp_path) -> None:
+    csv_path = tmp_path / "referential.csv"
+    csv_path.write_text("Code,Title\nA,Value1\nB,Value2\n", encoding="utf-8")
+    cache_path = str(tmp_path / "referential.csv.npz")
 
-    mock_read_csv.return_value = sample_data.drop(columns=["embedding"])
     result = CsvReferentialBuilder._load_data(
-        "dummy.csv", mock_cache_path, mock_embedding_model
+        str(csv_path), cache_path, mock_embedding_model
     )
-    assert "embedding" in result.columns
-    assert isinstance(result["embedding"].iloc[0], np.ndarray)
+    assert list(result.keys) == ["A", "B"]
+    assert result.embeddings.shape == (2, 3)
+    assert (tmp_path / "referential.csv.npz").exists()
 
 
+@patch("sentence_transformers.SentenceTransformer")
 @patch("infrastructure.repositories.referential_csv.CsvReferentialBuilder._load_data")
-def test_build(mock_load_data: MagicMock) -> None:
-    mock_load_data.return_value = pd.DataFrame(
-        {"key": ["Title1"], "embedding": [np.array([1, 0, 0])]}
-    )
+def test_build(
+    mock_load_data: MagicMock,
+    mock_sentence_transformer: MagicMock,
+    sample_data: ReferentialData,
+) -> None:
+    mock_load_data.return_value = sample_data
     result = CsvReferentialBuilder.build("dummy.csv")
     assert isinstance(result, CsvReferential)
+    # The model is only loaded once something has to be encoded
+    mock_sentence_transformer.assert_not_called()
+    mock_sentence_transformer.return_value.encode.return_value = np.array(
+        [[1.0, 0.0, 0.0]]
+    )
+    assert result.get_closest_match("A") == ReferentialMatch(
+        key="Title1", value="Value1"
+    )
+    mock_sentence_transformer.assert_called_once_with("all-MiniLM-L6-v2")
@@ -0,0 +1,148 @@
+import threading
+from typing import List
+from unittest.mock import MagicMock, PropertyMock
+
+import pytest
+from core.ports.sinker import Sinker
+from infrastructure.repositories.sinker_background import (
+    BackgroundSinker,
+    FsyncPolicy,
+)
+from pydantic import BaseModel
+
+
+class MockModel(BaseModel):
+    name: str
+
+
+class RecordingSinker(Sinker):
+    def __init__(self) -> None:
+        self.batches: List[List[str]] = []
+        self.fsyncs: List[bool] = []
+        self.closed = False
+
+    def sink_organization(self, data: BaseModel) -> None:
+        self.batches.append([data.name])  # type: ignore[attr-defined]
+
+    def sink_organizations(self, data) -> None:
+        self.batches.append([record.name for record in data])
+
+    def flush(self, fsync: bool = False) -> None:
+        self.fsyncs.append(fsync)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_records_are_written_in_order() -> None:
+    # Given a background sinker around a recording sinker
+    inner = RecordingSinker()
+
+    # When sinking records and closing
+    with BackgroundSinker(inner, max_batch_size=10) as sinker:
+        for i in range(25):
+            sinker.sink_organization(MockModel(name=f"Company{i}"))
+
+    # Then every record reached the inner sinker, in order, by batches
+    names = [name for batch in inner.batches for name in batch]
+    assert names == [f"Company{i}" for i in range(25)]
+    assert all(len(batch) <= 10 for batch in inner.batches)
+    assert inner.closed
+
+
+def test_records_are_coalesced() -> None:
+    # Given a writer blocked on its first record
+    inner = RecordingSinker()
+    release = threading.Event()
+    original = inner.sink_organizations
+    inner.sink_organizations = lambda data: (release.wait(), original(data))  # type: ignore[method-assign]
+    sinker = BackgroundSinker(inner, max_batch_size=100)
+
+    # When records pile up meanwhile
+    for i in range(6):
+        sinker.sink_organization(MockModel(name=f"Company{i}"))
+    release.set()
+    sinker.close()
+
+    # Then the queued ones are written together
+    assert len(inner.batches) < 6
+    assert sum(len(batch) for batch in inner.batches) == 6
+
+
+def test_flush_drains_queue() -> None:
+    inner = RecordingSinker()
+    sinker = BackgroundSinker(inner)
+    sinker.sink_organization(MockModel(name="CompanyA"))
+
+    sinker.flush(fsync=True)
+
+    assert inner.batches == [["CompanyA"]]
+    assert inner.fsyncs == [True]
+    sinker.close()
+
+
+@pytest.mark.parametrize(
+    "policy, expected",
+    [
+        (FsyncPolicy.NEVER, [False]),
+        (FsyncPolicy.CLOSE, [True]),
+        (FsyncPolicy.BATCH, [True, True]),
+    ],
+)
+def test_fsync_policy(policy: FsyncPolicy, expected: List[bool]) -> None:
+    inner = RecordingSinker()
+    with BackgroundSinker(inner, fsync_policy=policy) as sinker:
+        sinker.sink_organization(MockModel(name="CompanyA"))
+        sinker._queue.join()
+
+    assert inner.fsyncs == expected
+
+
+def test_errors_propagate_to_pipeline() -> None:
+    # Given a failing inner sinker
+    inner = MagicMock(spec=Sinker)
+    inner.sink_organizations.side_effect = OSError("disk full")
+    sinker = BackgroundSinker(inner)
+
+    # When the writer fails, Then the pipeline sees the error
+    sinker.sink_organization(MockModel(name="CompanyA"))
+    with pytest.raises(RuntimeError, match="Background sinker failed") as error:
+        sinker.flush()
+    assert isinstance(error.value.__cause__, OSError)
+
+    with pytest.raises(RuntimeError):
+        sinker.sink_organization(MockModel(name="CompanyB"))
+
+    # And closing still releases the inner sinker
+    with pytest.raises(RuntimeError):
+        sinker.close()
+    inner.close.assert_called_once()
+
+
+def test_sink_after_close() -> None:
+    sinker = BackgroundSinker(RecordingSinker())
+    sinker.close()
+
+    with pytest.raises(ValueError, match="closed"):
+        sinker.sink_organization(MockModel(name="CompanyA"))
+
+
+def test_flush_after_close() -> None:
+    sinker = BackgroundSinker(RecordingSinker())
+    sinker.close()
+
+    # Then flushing fails at once instead of waiting for the stopped writer
+    with pytest.raises(ValueError, match="closed"):
+        sinker.flush()
+
+
+def test_durable_flush_is_the_wrapped_sinker_one() -> None:
+    # Given a wrapped sinker whose flush is not durable
+    wrapped = MagicMock(spec=Sinker)
+    type(wrapped).durable_flush = PropertyMock(return_value=False)
+
+    # Then neither is the flush of the background sinker
+    with BackgroundSinker(wrapped) as sinker:
+        assert not sinker.durable_flush
+    with BackgroundSinker(RecordingSinker()) as sinker:
+        assert sinker.durable_flush
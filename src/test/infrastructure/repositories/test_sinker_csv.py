@@ -1,4 +1,6 @@
 import csv
+import os
+from unittest.mock import patch
 
 import pytest
 from pydantic import BaseModel
@@ -57,6 +59,20 @@ def test_sink_organization(temp_csv_file: str, sinker: SinkerCsv) -> None:
         assert rows[2]["name"] == "CompanyC"
 
 
+def test_batch_is_written_at_once(temp_csv_file: str, sinker: SinkerCsv) -> None:
+    # Given a batch of five records, more than the batch size
+    records = [MockModel(name=f"Company{i}", id=i) for i in range(5)]
+
+    # When sinking it in one call
+    with patch.object(sinker, "_flush", wraps=sinker._flush) as flush:
+        sinker.sink_organizations(records)
+
+    # Then the file is appended to once, with every record
+    flush.assert_called_once()
+    with open(temp_csv_file, "r", encoding="utf-8") as file:
+        assert len(list(csv.DictReader(file))) == 5
+
+
 def test_del_triggers_flush(temp_csv_file: str) -> None:
     sinker = SinkerCsv(file_path=temp_csv_file, batch_size=5)
     data = MockModel(name="CompanyX", id=99)
@@ -70,3 +86,33 @@ def test_del_triggers_flush(temp_csv_file: str) -> None:
         rows = list(reader)
         assert len(rows) == 1
         assert rows[0]["name"] == "CompanyX"
+
+
+def test_context_manager_flushes(temp_csv_file: str) -> None:
+    with SinkerCsv(file_path=temp_csv_file, batch_size=5) as sinker:
+        sinker.sink_organization(MockModel(name="CompanyY", id=7))
+
+    with open(temp_csv_file, "r", encoding="utf-8") as file:
+        rows = list(csv.DictReader(file))
+        assert [row["name"] for row in rows] == ["CompanyY"]
+
+
+def test_fsync_after_earlier_flush(temp_csv_file: str, sinker: SinkerCsv) -> None:
+    # Given records already written by an earlier flush
+    sinker.sink_organization(MockModel(name="CompanyA", id=1))
+    sinker.flush()
+
+    # When asking for an fsync with nothing buffered
+    with patch("os.fsync") as fsync:
+        sinker.flush(fsync=True)
+
+    # Then the file is still forced to disk
+    fsync.assert_called_once()
+
+
+def test_fsync_without_file(temp_csv_file: str, sinker: SinkerCsv) -> None:
+    with patch("os.fsync") as fsync:
+        sinker.flush(fsync=True)
+
+    fsync.assert_not_called()
+    assert not os.path.exists(temp_csv_file)
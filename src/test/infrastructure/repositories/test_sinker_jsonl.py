@@ -0,0 +1,75 @@
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+from core.entities.organizations import Product
+from pydantic import BaseModel
+
+from organization_information_fetcher_app.infrastructure.repositories.sinker_jsonl import (
+    SinkerJsonl,
+)
+
+
+class MockModel(BaseModel):
+    name: str
+    products: list[Product]
+
+
+@pytest.fixture
+def temp_jsonl_file(tmp_path) -> str:
+    return str(tmp_path / "test_output.jsonl")
+
+
+def _read(path: str) -> list[dict]:
+    with open(path, encoding="utf-8") as file:
+        return [json.loads(line) for line in file]
+
+
+def test_sink_organization(temp_jsonl_file: str) -> None:
+    # Given a sinker flushing every two records
+    sinker = SinkerJsonl(file_path=temp_jsonl_file, batch_size=2)
+    product = Product(cpc_id="01", value="Crop")
+
+    # When sinking three records
+    for name in ["CompanyA", "CompanyB", "CompanyC"]:
+        sinker.sink_organization(MockModel(name=name, products=[product]))
+
+    # Then only the first batch is written, with nested products kept
+    rows = _read(temp_jsonl_file)
+    assert [row["name"] for row in rows] == ["CompanyA", "CompanyB"]
+    assert rows[0]["products"] == [{"cpc_id": "01", "value": "Crop"}]
+
+    # And closing writes the remaining record
+    sinker.close()
+    assert [row["name"] for row in _read(temp_jsonl_file)][-1] == "CompanyC"
+
+
+def test_batch_is_written_at_once(temp_jsonl_file: str) -> None:
+    # Given a batch of five records, more than the batch size
+    sinker = SinkerJsonl(file_path=temp_jsonl_file, batch_size=2)
+    records = [MockModel(name=f"Company{i}", products=[]) for i in range(5)]
+
+    # When sinking it in one call
+    with patch.object(sinker, "_flush", wraps=sinker._flush) as flush:
+        sinker.sink_organizations(records)
+
+    # Then the file is written once, with every record
+    flush.assert_called_once()
+    assert len(_read(temp_jsonl_file)) == 5
+    sinker.close()
+
+
+def test_context_manager_closes(temp_jsonl_file: str) -> None:
+    with SinkerJsonl(file_path=temp_jsonl_file, batch_size=5) as sinker:
+        sinker.sink_organization(MockModel(name="CompanyX", products=[]))
+
+    assert _read(temp_jsonl_file) == [{"name": "CompanyX", "products": []}]
+    assert sinker._file is None
+
+
+def test_close_without_records(temp_jsonl_file: str) -> None:
+    SinkerJsonl(file_path=temp_jsonl_file).close()
+
+    # Then no file is created
+    assert not os.path.exists(temp_jsonl_file)
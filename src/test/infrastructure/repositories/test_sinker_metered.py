@@ -0,0 +1,30 @@
+from unittest.mock import MagicMock
+
+from core.ports.sinker import Sinker
+from infrastructure.adapters.metrics_registry import InMemoryMetrics
+from infrastructure.repositories.sinker_metered import MeteredSinker
+from pydantic import BaseModel
+
+
+class MockModel(BaseModel):
+    name: str
+
+
+def test_metered_sinker() -> None:
+    # Given a metered sinker around a mock sinker
+    inner = MagicMock(spec=Sinker)
+    metrics = InMemoryMetrics()
+
+    # When sinking, flushing and closing
+    with MeteredSinker(inner, metrics) as sinker:
+        sinker.sink_organization(MockModel(name="CompanyA"))
+        sinker.sink_organizations([MockModel(name="CompanyB")] * 2)
+        sinker.flush(fsync=True)
+
+    # Then every call is forwarded and measured
+    inner.sink_organization.assert_called_once()
+    inner.sink_organizations.assert_called_once()
+    inner.flush.assert_called_once_with(True)
+    inner.close.assert_called_once()
+    assert metrics.counter("sink.records") == 3
+    assert metrics.histogram("sink.write").count == 2
@@ -0,0 +1,125 @@
+import os
+from datetime import date
+from typing import List, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from core.entities.organizations import EmployeeRange, Organization, Product
+from pydantic import BaseModel
+
+from organization_information_fetcher_app.infrastructure.repositories.sinker_parquet import (
+    SinkerParquet,
+    arrow_schema,
+)
+
+
+class MockModel(BaseModel):
+    name: str
+    creation_date: Optional[date]
+    employees: EmployeeRange
+    products: List[Product]
+
+
+@pytest.fixture
+def temp_parquet_file(tmp_path) -> str:
+    return str(tmp_path / "test_output.parquet")
+
+
+def test_arrow_schema_keeps_nested_types() -> None:
+    schema = arrow_schema(Organization)
+
+    assert schema.field("creation_date").type == pa.date32()
+    assert schema.field("employees").type == pa.string()
+    assert schema.field("economic_activity").type == pa.struct(
+        [pa.field("isic_id", pa.string()), pa.field("value", pa.string())]
+    )
+    assert schema.field("products").type == pa.list_(
+        pa.struct([pa.field("cpc_id", pa.string()), pa.field("value", pa.string())])
+    )
+
+
+def test_sink_organization(temp_parquet_file: str) -> None:
+    # Given a sinker writing row groups of two records
+    with SinkerParquet(file_path=temp_parquet_file, batch_size=2) as sinker:
+        for name, creation_date in [
+            ("CompanyA", None),
+            ("CompanyB", date(1976, 4, 1)),
+            ("CompanyC", None),
+        ]:
+            sinker.sink_organization(
+                MockModel(
+                    name=name,
+                    creation_date=creation_date,
+                    employees=EmployeeRange.RANGE_2_10,
+                    products=[Product(cpc_id="01", value="Crop")],
+                )
+            )
+
+    # Then every record is written once closed, split in two row groups
+    parquet_file = pq.ParquetFile(temp_parquet_file)
+    assert parquet_file.metadata.num_row_groups == 2
+
+    rows = parquet_file.read().to_pylist()
+    assert [row["name"] for row in rows] == ["CompanyA", "CompanyB", "CompanyC"]
+    assert rows[1]["creation_date"] == date(1976, 4, 1)
+    assert rows[0]["employees"] == "2 - 10 employees"
+    assert rows[2]["products"] == [{"cpc_id": "01", "value": "Crop"}]
+
+
+def test_batch_is_written_as_one_row_group(temp_parquet_file: str) -> None:
+    # Given a batch of five records, more than the batch size
+    records = [
+        MockModel(
+            name=f"Company{i}",
+            creation_date=None,
+            employees=EmployeeRange.RANGE_2_10,
+            products=[],
+        )
+        for i in range(5)
+    ]
+
+    # When sinking it in one call
+    with SinkerParquet(file_path=temp_parquet_file, batch_size=2) as sinker:
+        sinker.sink_organizations(records)
+
+    # Then it is written as a single row group
+    parquet_file = pq.ParquetFile(temp_parquet_file)
+    assert parquet_file.metadata.num_row_groups == 1
+    assert parquet_file.metadata.num_rows == 5
+
+
+def test_sink_after_close(temp_parquet_file: str) -> None:
+    # Given a closed sinker
+    record = MockModel(
+        name="CompanyA",
+        creation_date=None,
+        employees=EmployeeRange.RANGE_2_10,
+        products=[],
+    )
+    sinker = SinkerParquet(file_path=temp_parquet_file)
+    sinker.sink_organization(record)
+    sinker.close()
+
+    # When using it again
+    with pytest.raises(ValueError):
+        sinker.sink_organization(record.model_copy(update={"name": "CompanyB"}))
+    with pytest.raises(ValueError):
+        sinker.flush()
+    sinker.close()
+
+    # Then the records written are kept
+    rows = pq.read_table(temp_parquet_file).to_pylist()
+    assert [row["name"] for row in rows] == ["CompanyA"]
+
+
+def test_close_without_records(temp_parquet_file: str) -> None:
+    SinkerParquet(file_path=temp_parquet_file).close()
+
+    # Then no file is written, as there is no schema to write it with
+    assert not os.path.exists(temp_parquet_file)
+
+
+def test_flush_is_not_durable(temp_parquet_file: str) -> None:
+    # Parquet files have no footer until closed
+    assert not SinkerParquet(file_path=temp_parquet_file).durable_flush
@@ -0,0 +1,138 @@
+import sqlite3
+from datetime import date
+
+import pytest
+from core.entities.organizations import (
+    EmployeeRange,
+    Industry,
+    Organization,
+    Product,
+)
+from infrastructure.repositories.sinker_sqlite import SinkerSqlite
+from pydantic import BaseModel
+
+
+@pytest.fixture
+def temp_db_file(tmp_path) -> str:
+    return str(tmp_path / "organizations.db")
+
+
+def _organization(name: str, isic_id: str = "6211", products=("01",)) -> Organization:
+    return Organization(
+        company_name=name,
+        creation_date=date(1976, 4, 1),
+        employees=EmployeeRange.RANGE_11_50,
+        economic_activity_raw="Software",
+        economic_activity=Industry(isic_id=isic_id, value="Programming"),
+        products_raw=list(products),
+        products=[
+            Product(cpc_id=cpc_id, value=f"Product {cpc_id}") for cpc_id in products
+        ],
+        country_origin="USA",
+        countries_activity=["USA"],
+        main_company_domains=[f"{name.lower()}.com"],
+    )
+
+
+def _count(path: str, table: str) -> int:
+    with sqlite3.connect(path) as connection:
+        return connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_sink_organization(temp_db_file: str) -> None:
+    # Given a sinker flushing every two records
+    sinker = SinkerSqlite(temp_db_file, batch_size=2)
+
+    # When sinking two organizations
+    sinker.sink_organization(_organization("CompanyA", products=("01", "02")))
+    sinker.sink_organization(_organization("CompanyB", isic_id="4711"))
+
+    # Then organizations, activities and products are normalized
+    assert _count(temp_db_file, "organizations") == 2
+    assert _count(temp_db_file, "activities") == 2
+    assert _count(temp_db_file, "products") == 2
+    assert _count(temp_db_file, "organization_products") == 3
+    assert sinker.find_organization_keys_by_isic("6211") == ["CompanyA"]
+    sinker.close()
+
+
+def test_find_organizations_by_isic_prefix(temp_db_file: str) -> None:
+    # Given organizations matched to ISIC classes of divisions 62 and 63
+    with SinkerSqlite(temp_db_file) as sinker:
+        for name, isic_id in [
+            ("Games", "6211"),
+            ("Consulting", "6220"),
+            ("Services", "6290"),
+            ("Hosting", "6310"),
+        ]:
+            sinker.sink_organization(_organization(name, isic_id=isic_id))
+        sinker.flush()
+
+        # Then a division, group or class finds the organizations below it
+        assert sinker.find_organization_keys_by_isic("62") == [
+            "Consulting",
+            "Games",
+            "Services",
+        ]
+        assert sinker.find_organization_keys_by_isic("622") == ["Consulting"]
+        assert sinker.find_organization_keys_by_isic("6310") == ["Hosting"]
+        assert sinker.find_organization_keys_by_isic("64") == []
+        with pytest.raises(ValueError):
+            sinker.find_organization_keys_by_isic("")
+
+    # And the lookup runs on the isic_id index
+    with sqlite3.connect(temp_db_file) as connection:
+        plan = connection.execute(
+            "EXPLAIN QUERY PLAN SELECT organization_key FROM organizations"
+            " WHERE isic_id >= '62' AND isic_id < '63'"
+        ).fetchall()
+    assert "organizations_isic_id" in str(plan)
+
+
+def test_rerun_upserts_instead_of_duplicating(temp_db_file: str) -> None:
+    with SinkerSqlite(temp_db_file) as sinker:
+        sinker.sink_organization(_organization("CompanyA", products=("01", "02")))
+
+    # When the same company is sunk again with new products
+    with SinkerSqlite(temp_db_file) as sinker:
+        sinker.sink_organization(_organization("CompanyA", products=("03",)))
+
+    # Then the row is replaced
+    assert _count(temp_db_file, "organizations") == 1
+    with sqlite3.connect(temp_db_file) as connection:
+        assert connection.execute(
+            "SELECT cpc_id FROM organization_products"
+        ).fetchall() == [("03",)]
+
+
+def test_unchanged_rows_are_not_touched(temp_db_file: str) -> None:
+    with SinkerSqlite(temp_db_file) as sinker:
+        sinker.sink_organization(_organization("CompanyA"))
+
+    with sqlite3.connect(temp_db_file) as connection:
+        connection.execute("UPDATE organizations SET updated_at = 'sentinel'")
+
+    with SinkerSqlite(temp_db_file) as sinker:
+        sinker.sink_organization(_organization("CompanyA"))
+
+    with sqlite3.connect(temp_db_file) as connection:
+        assert connection.execute(
+            "SELECT updated_at FROM organizations"
+        ).fetchone() == ("sentinel",)
+
+
+def test_key_by_domain(temp_db_file: str) -> None:
+    with SinkerSqlite(temp_db_file, key_by_domain=True) as sinker:
+        sinker.sink_organization(_organization("CompanyA"))
+        assert sinker.find_organization_keys_by_isic("62") == []
+        sinker.flush()
+        assert sinker.find_organization_keys_by_isic("62") == ["companya.com"]
+
+
+def test_sink_other_model(temp_db_file: str) -> None:
+    class MockModel(BaseModel):
+        name: str
+
+    with SinkerSqlite(temp_db_file) as sinker:
+        with pytest.raises(ValueError, match="only sinks Organization"):
+            sinker.sink_organization(MockModel(name="CompanyA"))
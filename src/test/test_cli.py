@@ -0,0 +1,130 @@
+import importlib
+import os
+import subprocess
+import sys
+import tomllib
+from datetime import date
+
+import cli
+import pytest
+from core.entities.organizations import EmployeeRange, Industry, Organization
+from infrastructure.repositories.organization_files import read_organizations
+from infrastructure.repositories.sinker_jsonl import SinkerJsonl
+
+
+def _organization(name: str, country_origin: str) -> Organization:
+    return Organization(
+        company_name=name,
+        creation_date=date(1998, 9, 4),
+        employees=EmployeeRange.RANGE_10000_PLUS,
+        economic_activity_raw="Search",
+        economic_activity=Industry(isic_id="6312", value="Web portals"),
+        products_raw=[],
+        products=[],
+        country_origin=country_origin,
+        countries_activity=[],
+        main_company_domains=[],
+    )
+
+
+def test_options_without_command_apply_to_run(tmp_path, capsys) -> None:
+    # Given a headerless company list with a duplicate
+    companies = tmp_path / "companies.csv"
+    companies.write_text("Google,google.com\nGoogle LLC\nApple\n")
+
+    # When running the former main.py options without a command
+    exit_code = cli.main(["--companies", str(companies), "--refresh", "--dry-run"])
+
+    # Then they apply to run, which reads the deduplicated companies only
+    assert exit_code == 0
+    output = capsys.readouterr().out
+    assert output.startswith("2 companies")
+    assert output.strip().endswith("./organizations.sqlite")
+
+
+def test_help_does_not_load_heavy_dependencies() -> None:
+    # When building the parser in a fresh interpreter
+    code = (
+        "import sys, cli; cli.build_parser().format_help(); "
+        "heavy = {'langchain', 'langchain_core', 'sentence_transformers', 'torch'}; "
+        "print(sorted(heavy & {m.split('.')[0] for m in sys.modules}))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=os.path.dirname(cli.__file__),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Then none of the heavy dependencies is imported
+    assert completed.stdout.strip() == "[]"
+
+
+def test_help_describes_the_tool(capsys) -> None:
+    # When asking for help
+    with pytest.raises(SystemExit):
+        cli.main(["--help"])
+
+    # Then users read what the tool does, not notes for developers
+    output = capsys.readouterr().out
+    assert "Fetch information about companies" in output
+    assert "standard library" not in output
+
+
+def test_script_entry_point_is_the_cli() -> None:
+    # Given the console script declared by the project
+    pyproject = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(cli.__file__))),
+        "pyproject.toml",
+    )
+    with open(pyproject, "rb") as file:
+        scripts = tomllib.load(file)["project"]["scripts"]
+
+    # When resolving it
+    module, _, attribute = scripts["organization-information-fetcher"].partition(":")
+
+    # Then it is the CLI main function
+    assert getattr(importlib.import_module(module), attribute) is cli.main
+
+
+def test_refresh_rejects_parquet_output(tmp_path) -> None:
+    # Given a company list
+    companies = tmp_path / "companies.csv"
+    companies.write_text("Google\n")
+
+    # When refreshing into a Parquet file, only readable once complete
+    exit_code = cli.main(
+        [
+            "--companies",
+            str(companies),
+            "--refresh",
+            "--output",
+            str(tmp_path / "organizations.parquet"),
+        ]
+    )
+
+    # Then the run is refused before fetching anything
+    assert exit_code == 2
+
+
+def test_merge_command(tmp_path, capsys) -> None:
+    # Given the outputs of two runs
+    first, second = str(tmp_path / "first.jsonl"), str(tmp_path / "second.jsonl")
+    with SinkerJsonl(first) as sinker:
+        sinker.sink_organization(_organization("Google", "France"))
+    with SinkerJsonl(second) as sinker:
+        sinker.sink_organization(_organization("Google", "USA"))
+
+    # When merging them
+    output = str(tmp_path / "merged.jsonl")
+    assert cli.main(["merge", first, second, "--output", output]) == 0
+
+    # Then the later record is kept
+    assert [org.country_origin for org in read_organizations(output)] == ["USA"]
+    assert "1 organizations merged" in capsys.readouterr().out
+
+
+def test_unknown_benchmark_is_rejected() -> None:
+    with pytest.raises(SystemExit):
+        cli.main(["benchmark", "unknown"])